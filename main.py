@@ -1,55 +1,48 @@
+import argparse
+import os
+import random
+import tempfile
 from pathlib import Path
-import arcade
-from src.components.phone import Phone
-from src.core.asset_manager import AssetManager
-from src.shared.constants import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
 
-class GameWindow(arcade.Window):
-    def __init__(self) -> None:
-        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, resizable=True)
-        arcade.set_background_color(arcade.color.BLACK)
-
-        project_root = Path(__file__).parent
-        assets_root = project_root / "assets"
-
-        self.asset_manager = AssetManager(assets_root)
-        images_output = assets_root / "images"
-        self.asset_manager.load_all_atlases(images_output)
-
-        self.phone = Phone(self.asset_manager)
-        arcade.schedule(self.update, 1/60)
-
-    def on_resize(self, width: int, height: int) -> None:
-        super().on_resize(width, height)
-        self.phone.resize(width, height)
-
-    def on_draw(self) -> None:
-        self.clear()
-        self.phone.draw()
-
-    def on_mouse_press(self, x: float, y: float, button: int, modifiers: int) -> None:
-        self.phone.on_mouse_press(x, y, button, modifiers)
-
-    def on_mouse_release(self, x: float, y: float, button: int, modifiers: int) -> None:
-        self.phone.on_mouse_release(x, y, button, modifiers)
-        
-    def on_mouse_motion(self, x: float, y: float, dx: float, dy: float) -> None:
-        self.phone.on_mouse_motion(x, y, dx, dy)
-
-    def update(self, delta_time: float) -> None:
-        self.phone.update(delta_time)
-
-    def on_key_press(self, symbol: int, modifiers: int) -> None:
-        if symbol == arcade.key.F11:
-            self.set_fullscreen(not self.fullscreen)
-        self.phone.on_key_press(symbol, modifiers)
-
-    def on_text(self, text: str) -> None:
-        self.phone.on_text(text)
 
 def main() -> None:
-    window = GameWindow()
+    parser = argparse.ArgumentParser(description="ZHOSKO")
+    parser.add_argument("--record", type=Path, help="Record input events to this file")
+    parser.add_argument("--replay", type=Path, help="Replay a recorded input file and print frame timings")
+    parser.add_argument("--fast", action="store_true", help="Replay at maximum speed, one simulation step per frame")
+    parser.add_argument(
+        "--trace-startup", nargs="?", const="", type=str, metavar="PATH",
+        help="Write import, load phase and first-frame timings (default: data/startup/<time>.json)",
+    )
+    args = parser.parse_args()
+
+    if args.replay:
+        # DATA_DIR is read at import time; the replay restores the recorded saves into a scratch copy
+        os.environ["ZHOSKO_DATA_DIR"] = tempfile.mkdtemp(prefix="zhosko-replay-")
+
+    from src.core.startup_trace import startup_trace
+    if args.trace_startup is not None:
+        startup_trace.start(Path(args.trace_startup) if args.trace_startup else None)
+
+    with startup_trace.phase("import arcade"):
+        import arcade
+    with startup_trace.phase("import game"):
+        from src.core.game_window import GameWindow
+        from src.core.input_record import InputRecorder, InputReplay
+        from src.shared.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+    recorder = replay = None
+    if args.replay:
+        replay = InputReplay(args.replay)
+        replay.restore_files()
+        random.seed(replay.seed)
+    elif args.record:
+        seed = random.getrandbits(32)
+        random.seed(seed)
+        recorder = InputRecorder(args.record, seed, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    window = GameWindow(recorder, replay, args.fast)
     arcade.run()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -3,10 +3,18 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 import arcade
 
-from src.shared.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from src.core.font_cache import warm_up_glyphs
+from src.core.profiler import profiled
+from src.core.render_target import RENDER_QUALITY_SCALES, ScreenRenderTarget
+from src.core.save_game import save_game
+from src.core.startup_trace import startup_trace
+from src.core.update_scheduler import UpdateScheduler
+from src.shared.constants import PHONE_RENDER_QUALITY, SCREEN_HEIGHT, SCREEN_WIDTH
 from src.states.phone import PhoneData, PhoneState
+from src.components.phone.apps import AppRegistry
 from src.components.phone.layout import PhoneLayout
 from src.components.phone.home import PhoneHome
+from src.ui.widgets import InputEvent, Widget, WidgetTree
 
 if TYPE_CHECKING:
     from src.components.phone.zasora.app import ZasoraApp
@@ -17,85 +25,120 @@ PHONE_WIDTH = 400
 PHONE_HEIGHT = 640
 ADD_SCALE_PHONE_FACTOR = 1.1
 BOOT_DURATION = 1.0
+POWER_BUTTON_BLOCK_TIME = 0.3
 
 
 class Phone:
-    def __init__(self, asset_manager: AssetManager) -> None:
+    def __init__(self, asset_manager: AssetManager, render_quality: str = PHONE_RENDER_QUALITY) -> None:
         self.asset_manager = asset_manager
-        self.scale_factor = (SCREEN_HEIGHT / PHONE_HEIGHT) * ADD_SCALE_PHONE_FACTOR
-        self.scaled_width = PHONE_WIDTH * self.scale_factor
-        self.scaled_height = PHONE_HEIGHT * self.scale_factor
-        
-        center_x = SCREEN_WIDTH / 2
-        center_y = SCREEN_HEIGHT / 2
+        self.display_scale = (SCREEN_HEIGHT / PHONE_HEIGHT) * ADD_SCALE_PHONE_FACTOR
+        self.render_target = ScreenRenderTarget(PHONE_WIDTH, PHONE_HEIGHT, render_quality)
+        self.render_target.set_display_scale(self.display_scale)
+        self.scale_factor = self.render_target.scale
         
         self.state = PhoneData()
-        self._boot_elapsed: float = 0.0
-        
-        self.layout = PhoneLayout(self.asset_manager, self.scale_factor, self.scaled_width, self.scaled_height, center_x, center_y)
-        self.home = PhoneHome(self.asset_manager, self.scale_factor, self.scaled_width, self.scaled_height, PHONE_HEIGHT)
-        
-        self._zasora_app: ZasoraApp | None = None
-        self._calc_app: CalcApp | None = None
+        save_game.load("phone", self.state)
+        self.scheduler = UpdateScheduler()
         
-        _ = self.zasora_app
-        _ = self.calc_app
+        self.layout = PhoneLayout(self.asset_manager, self.display_scale, self.scale_factor, PHONE_WIDTH, PHONE_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.home = PhoneHome(self.asset_manager, self.scale_factor, self.layout.screen_width, self.layout.screen_height, PHONE_HEIGHT)
+        self._build_input()
+        self._place_screen(SCREEN_WIDTH, SCREEN_HEIGHT)
+        with startup_trace.phase("glyphs"):
+            warm_up_glyphs(self.scale_factor)
+
+        self.apps = AppRegistry(lambda cls: cls(self.asset_manager, *self._app_area(), self.scale_factor), self.screen_input.root, self.scheduler)
+        with startup_trace.phase("restore app"):
+            self._open_app(self.state.active_app)
+
+    def _build_input(self) -> None:
+        self.input = WidgetTree()
+        self.power_button = self.input.root.add(Widget("power").on("press", self._on_power_press))
+        self.home_button = self.input.root.add(Widget("home").on("press", self._on_home_press))
+        self.screen_input = WidgetTree()
+        self.screen_input.root.on("press", self._on_screen_press)
+        self.home.widget.active = lambda: self.state.state == PhoneState.ON and not self.state.active_app
+        self.screen_input.root.add(self.home.widget)
+        for name, icon in self.home.icons.items():
+            icon.on("press", lambda event, name=name: self._on_icon_press(event, name))
+
+    def _on_icon_press(self, event: InputEvent, name: str) -> bool:
+        if event.button != arcade.MOUSE_BUTTON_LEFT:
+            return False
+        return self._open_app(name)
+
+    def _on_power_press(self, event: InputEvent) -> bool:
+        if event.button != arcade.MOUSE_BUTTON_LEFT:
+            return False
+        if not self.state.power_button_blocked:
+            self._toggle_power()
+        return True
+
+    def _on_home_press(self, event: InputEvent) -> bool:
+        if event.button != arcade.MOUSE_BUTTON_LEFT:
+            return False
+        self._go_home()
+        return True
+
+    def _on_screen_press(self, event: InputEvent) -> bool:
+        if event.button == arcade.MOUSE_BUTTON_RIGHT and self.state.active_app:
+            self._close_app()
+            return True
+        return False
+
+    def _app_area(self) -> tuple[float, float, float, float]:
+        area = self.layout.screen["app"]
+        return area.left, area.bottom, area.width, area.height
+
+    def _place_screen(self, window_width: float, window_height: float) -> None:
+        body, power, home = self.layout.window["body"], self.layout.window["power"], self.layout.window["home"]
+        self.render_target.place(body.left, body.bottom, body.width, body.height, int(window_width), int(window_height))
+        self.power_button.set_bounds(power.left, power.bottom, power.width, power.height)
+        self.home_button.set_bounds(home.left, home.bottom, home.width, home.height)
+
+    def _apply_screen_scale(self) -> None:
+        self.scale_factor = self.render_target.scale
+        self.layout.set_screen_scale(self.scale_factor)
+        self.home.resize(self.scale_factor, self.layout.screen_width, self.layout.screen_height)
+        warm_up_glyphs(self.scale_factor)
+        for app in self.apps.loaded.values():
+            app.resize(*self._app_area(), self.scale_factor)
 
     def resize(self, width: float, height: float) -> None:
-        self.layout.resize(width / 2, height / 2, width, height)
-        
-        app_x = self.layout.phone_x + 70 * self.scale_factor
-        app_y = self.layout.phone_y + 90 * self.scale_factor
-        app_w = 230 * self.scale_factor
-        app_h = 435 * self.scale_factor
-        
-        if self._zasora_app:
-            self._zasora_app.resize(app_x, app_y, app_w, app_h)
-            
-        if self._calc_app:
-            self._calc_app.resize(app_x, app_y, app_w, app_h)
+        self.place(0.0, 0.0, width, height, width, height)
+
+    def place(self, x: float, y: float, width: float, height: float, window_width: float, window_height: float) -> None:
+        """Fit the phone into a (``x``, ``y``, ``width``, ``height``) cell of the window, e.g. when tiling several."""
+        self.display_scale = (height / PHONE_HEIGHT) * ADD_SCALE_PHONE_FACTOR
+        self.layout.resize(self.display_scale, width, height, x, y)
+        self._place_screen(window_width, window_height)
+        if self.render_target.set_display_scale(self.display_scale):
+            self._apply_screen_scale()
+
+    def set_render_quality(self, quality: str) -> None:
+        if self.render_target.set_quality(quality):
+            self._apply_screen_scale()
+
+    def cycle_render_quality(self) -> str:
+        qualities = list(RENDER_QUALITY_SCALES)
+        quality = qualities[(qualities.index(self.render_target.quality) + 1) % len(qualities)]
+        self.set_render_quality(quality)
+        return quality
 
     @property
     def zasora_app(self) -> ZasoraApp:
-        if self._zasora_app is None:
-            from src.components.phone.zasora.app import ZasoraApp
-            app_w = 230 * self.scale_factor
-            app_h = 435 * self.scale_factor
-            app_x = self.layout.phone_x + 70 * self.scale_factor
-            app_y = self.layout.phone_y + 90 * self.scale_factor
-            self._zasora_app = ZasoraApp(
-                self.asset_manager,
-                app_x,
-                app_y,
-                app_w,
-                app_h,
-                self.scale_factor,
-            )
-        return self._zasora_app
+        return self.apps.load("zasora")
 
     @property
     def calc_app(self) -> CalcApp:
-        if self._calc_app is None:
-            from src.components.phone.calc.app import CalcApp
-            app_w = 230 * self.scale_factor
-            app_h = 435 * self.scale_factor
-            app_x = self.layout.phone_x + 70 * self.scale_factor
-            app_y = self.layout.phone_y + 90 * self.scale_factor
-            self._calc_app = CalcApp(
-                self.asset_manager,
-                app_x,
-                app_y,
-                app_w,
-                app_h,
-                self.scale_factor,
-            )
-        return self._calc_app
+        return self.apps.load("calc")
 
     def _start_boot(self) -> None:
         self.state.state = PhoneState.BOOTING
         self.state.power_button_blocked = True
         self.state.videos_loaded = False
-        self._boot_elapsed = 0.0
+        self.state.boot_start_time = self.scheduler.now
+        self.scheduler.call_later(BOOT_DURATION, self._complete_boot)
 
     def _complete_boot(self) -> None:
         self.state.state = PhoneState.ON
@@ -108,120 +151,94 @@ class Phone:
         elif self.state.state == PhoneState.ON and not self.state.power_button_blocked:
             self.state.state = PhoneState.OFF
             self.state.power_button_blocked = True
-            self.state.power_button_block_time = 0.3
+            self.scheduler.call_later(POWER_BUTTON_BLOCK_TIME, self._unblock_power_button)
             self._close_app()
+            self.apps.unload_suspended()
+
+    def _unblock_power_button(self) -> None:
+        if self.state.state != PhoneState.BOOTING:
+            self.state.power_button_blocked = False
 
     def _go_home(self) -> None:
         if self.state.state == PhoneState.ON:
             self._close_app()
 
+    def _open_app(self, name: str) -> bool:
+        if self.state.state != PhoneState.ON or name not in self.apps:
+            return False
+        self.apps.launch(name)
+        self.state.active_app = name
+        return True
+
     def _close_app(self) -> None:
-        if self.zasora_app.state.is_running:
-            self.zasora_app.stop()
-        if self.calc_app.state.is_running:
-            self.calc_app.stop()
+        self.state.active_app = ""
+        self.apps.suspend()
+
+    def _dispatch(self, event: InputEvent) -> bool:
+        if self.input.dispatch(event):
+            return True
+        event.x, event.y = self.render_target.to_local(event.x, event.y)
+        event.dx, event.dy = self.render_target.to_local_delta(event.dx, event.dy) if event.kind == "motion" else (event.dx, event.dy)
+        handled = self.screen_input.dispatch(event)
+        self._wake_active_app()
+        return handled
+
+    def _wake_active_app(self) -> None:
+        if app := self.apps.active_app:
+            self.scheduler.wake(app)
 
     def on_mouse_press(self, x: float, y: float, button: int, modifiers: int) -> bool:
-        if button == arcade.MOUSE_BUTTON_LEFT:
-            pb_rect_left = self.layout.power_button_x
-            pb_rect_right = self.layout.power_button_x + self.layout.power_button_size
-            pb_rect_bottom = self.layout.power_button_y
-            pb_rect_top = self.layout.power_button_y + self.layout.power_button_size
-            
-            if pb_rect_left <= x <= pb_rect_right and pb_rect_bottom <= y <= pb_rect_top:
-                if not self.state.power_button_blocked:
-                    self._toggle_power()
-                return True
-                
-            hb_rect_left = self.layout.home_button_x
-            hb_rect_right = self.layout.home_button_x + self.layout.home_button_size
-            hb_rect_bottom = self.layout.home_button_y
-            hb_rect_top = self.layout.home_button_y + self.layout.home_button_size
-            
-            if hb_rect_left <= x <= hb_rect_right and hb_rect_bottom <= y <= hb_rect_top:
-                if self.state.state == PhoneState.ON:
-                    self._go_home()
-                return True
-
-        if self.zasora_app.state.is_running:
-            if self.zasora_app.on_mouse_press(x, y, button, modifiers):
-                return True
-            if button == arcade.MOUSE_BUTTON_RIGHT:
-                self._close_app()
-                return True
-                
-        if self.calc_app.state.is_running:
-            if self.calc_app.on_mouse_press(x, y, button, modifiers):
-                return True
-            if button == arcade.MOUSE_BUTTON_RIGHT:
-                self._close_app()
-                return True
-
-        if button == arcade.MOUSE_BUTTON_LEFT:
-            if self.state.state == PhoneState.ON and not self.zasora_app.state.is_running and not self.calc_app.state.is_running:
-                app_clicked = self.home.check_app_icon_click(x, y, self.layout.phone_x, self.layout.phone_y)
-                if app_clicked == "zasora":
-                    self.zasora_app.start()
-                    return True
-                elif app_clicked == "calc":
-                    self.calc_app.start()
-                    return True
-        return False
+        return self._dispatch(InputEvent("press", x, y, button, modifiers))
 
     def on_mouse_release(self, x: float, y: float, button: int, modifiers: int) -> bool:
-        if self.zasora_app.state.is_running:
-            if self.zasora_app.on_mouse_release(x, y, button, modifiers):
-                return True
-        if self.calc_app.state.is_running:
-            if self.calc_app.on_mouse_release(x, y, button, modifiers):
-                return True
-        return False
+        return self._dispatch(InputEvent("release", x, y, button, modifiers))
 
     def on_mouse_motion(self, x: float, y: float, dx: float, dy: float) -> bool:
-        if self.zasora_app.state.is_running:
-            return self.zasora_app.on_mouse_motion(x, y, dx, dy)
-        if self.calc_app.state.is_running:
-            return self.calc_app.on_mouse_motion(x, y, dx, dy)
-        return False
+        return self._dispatch(InputEvent("motion", x, y, dx=dx, dy=dy))
+
+    def on_mouse_scroll(self, x: float, y: float, scroll_x: float, scroll_y: float) -> bool:
+        return self._dispatch(InputEvent("scroll", x, y, dx=scroll_x, dy=scroll_y))
 
     def on_key_press(self, symbol: int, modifiers: int) -> None:
-        if self.zasora_app.state.is_running:
-            self.zasora_app.on_key_press(symbol, modifiers)
+        if handler := getattr(self.apps.active_app, "on_key_press", None):
+            handler(symbol, modifiers)
+            self._wake_active_app()
 
     def on_text(self, text: str) -> None:
-        if self.zasora_app.state.is_running:
-            self.zasora_app.on_text(text)
+        if handler := getattr(self.apps.active_app, "on_text", None):
+            handler(text)
+            self._wake_active_app()
 
+    @profiled("phone.update")
     def update(self, delta_time: float) -> None:
-        if self._zasora_app:
-            self._zasora_app.update(delta_time)
-        if self._calc_app:
-            self._calc_app.update(delta_time)
-            
-        if self.state.power_button_blocked and self.state.state == PhoneState.ON:
-            self.state.power_button_block_time -= delta_time
-            if self.state.power_button_block_time <= 0:
-                self.state.power_button_blocked = False
-                
-        if self.state.state == PhoneState.BOOTING:
-            self._boot_elapsed += delta_time
-            if self._boot_elapsed >= BOOT_DURATION:
-                self._complete_boot()
-
-    def draw(self) -> None:
-        self.layout.draw_base()
+        self.scheduler.update(delta_time)
 
-        if self.state.state == PhoneState.OFF:
-            self.layout.draw_off_screen()
-        elif self.state.state == PhoneState.BOOTING:
-            progress = min(self._boot_elapsed / BOOT_DURATION, 1.0)
-            self.layout.draw_boot_screen(progress)
-        elif self.state.state == PhoneState.ON:
-            if self.zasora_app.state.is_running:
-                self.zasora_app.draw()
-            elif self.calc_app.state.is_running:
-                self.calc_app.draw()
-            else:
-                self.home.draw(self.layout.phone_x, self.layout.phone_y)
-
-        self.layout.draw_overlay(self.state)
\ No newline at end of file
+    def close(self) -> None:
+        save_game.store("phone", self.state)
+        self.apps.unload_all()
+        save_game.commit()
+
+    @property
+    def is_idle(self) -> bool:
+        if self.state.state == PhoneState.BOOTING or self.state.power_button_blocked:
+            return False
+        return self.scheduler.is_idle
+
+    @profiled("phone.draw")
+    def draw(self, alpha: float = 1.0) -> None:
+        with self.render_target.activate():
+            self.layout.draw_base()
+
+            if self.state.state == PhoneState.OFF:
+                self.layout.draw_off_screen()
+            elif self.state.state == PhoneState.BOOTING:
+                progress = min((self.scheduler.now - self.state.boot_start_time) / BOOT_DURATION, 1.0)
+                self.layout.draw_boot_screen(progress)
+            elif self.state.state == PhoneState.ON:
+                if app := self.apps.active_app:
+                    app.draw(alpha)
+                else:
+                    self.home.draw()
+
+        self.render_target.draw()
+        self.layout.draw_overlay(self.state)
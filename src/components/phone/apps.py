@@ -0,0 +1,109 @@
+from __future__ import annotations
+import importlib
+from dataclasses import dataclass
+from typing import Any, Callable
+from src.core.save_game import save_game
+from src.core.update_scheduler import UpdateScheduler
+from src.ui.widgets import Widget
+
+
+@dataclass(frozen=True)
+class AppSpec:
+    """Installed app: home icon metadata plus a ``module:Class`` factory imported on first launch.
+
+    The class is built as ``cls(asset_manager, x, y, w, h, scale_factor)`` and provides
+    ``state``, ``widget``, ``start``, ``stop``, ``release``, ``resize``, ``update``,
+    ``wants_update`` and ``draw``; ``on_key_press``, ``on_text`` and ``is_animating`` are optional.
+    """
+
+    name: str
+    label: str
+    icon: str
+    position: tuple[int, int]
+    factory: str
+
+
+APPS = (
+    AppSpec("zasora", "zasora", "zasora", (85, 125), "src.components.phone.zasora.app:ZasoraApp"),
+    AppSpec("calc", "calc", "calc", (155, 125), "src.components.phone.calc.app:CalcApp"),
+)
+
+MAX_SUSPENDED_APPS = len(APPS)
+
+
+class AppRegistry:
+    """Phone apps by name, constructed on first launch.
+
+    Closing the active app suspends it (stopped, resources kept for a quick return).
+    ``MAX_SUSPENDED_APPS`` covers every stock app, so switching between them never unloads one;
+    ``unload_suspended`` does on power-off or memory pressure, and past the cap the least recently
+    used app goes first. Unloading stores the state to ``save_game`` and ``release`` frees players
+    and caches; the comment arena goes with the dropped state.
+    """
+
+    def __init__(self, create: Callable[[type], Any], root: Widget, scheduler: UpdateScheduler, specs: tuple[AppSpec, ...] = APPS) -> None:
+        self.specs = {spec.name: spec for spec in specs}
+        self.loaded: dict[str, Any] = {}
+        self.active = ""
+        self._create = create
+        self._root = root
+        self._scheduler = scheduler
+        self._suspended: list[str] = []
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.specs
+
+    def get(self, name: str) -> Any | None:
+        return self.loaded.get(name)
+
+    @property
+    def active_app(self) -> Any | None:
+        return self.loaded.get(self.active)
+
+    def load(self, name: str) -> Any:
+        if (app := self.loaded.get(name)) is None:
+            module, _, attr = self.specs[name].factory.partition(":")
+            app = self.loaded[name] = self._create(getattr(importlib.import_module(module), attr))
+            self._root.add(app.widget)
+        return app
+
+    def launch(self, name: str) -> Any:
+        if self.active != name:
+            self.suspend()
+        app = self.load(name)
+        if name in self._suspended:
+            self._suspended.remove(name)
+        self.active = name
+        app.start()
+        self._scheduler.wake(app)
+        return app
+
+    def suspend(self) -> None:
+        if not self.active:
+            return
+        name, self.active = self.active, ""
+        self.loaded[name].stop()
+        self._suspended.append(name)
+        while len(self._suspended) > MAX_SUSPENDED_APPS:
+            self.unload(self._suspended[0])
+
+    def unload(self, name: str) -> None:
+        if (app := self.loaded.pop(name, None)) is None:
+            return
+        if name == self.active:
+            self.active = ""
+        if name in self._suspended:
+            self._suspended.remove(name)
+        save_game.store(name, app.state)
+        self._scheduler.sleep(app)
+        app.release()
+        self._root.remove(app.widget)
+
+    def unload_suspended(self) -> None:
+        """Drop every suspended app, e.g. under memory pressure or when the phone powers off."""
+        for name in list(self._suspended):
+            self.unload(name)
+
+    def unload_all(self) -> None:
+        for name in list(self.loaded):
+            self.unload(name)
@@ -2,9 +2,12 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 import arcade
+from src.core.profiler import profiled
+from src.core.save_game import save_game
 from src.states.calc import CalcState
-from src.shared.utils import make_rect
+from src.ui.layout import Layout, Length, Slot, grid_slots
 from src.ui.shapes import draw_rounded_rect
+from src.ui.widgets import InputEvent, Widget
 
 if TYPE_CHECKING:
     from src.core.asset_manager import AssetManager
@@ -16,17 +19,53 @@ BUTTONS = [
     ["1", "2", "3", "+"],
     ["0", ".", "="]
 ]
+EXPRESSION_TAIL = 24
+
+
+def _key_cells() -> list[tuple[str, int, int, int]]:
+    cells = []
+    for row, chars in enumerate(BUTTONS):
+        col = 0
+        for char in chars:
+            span = 2 if char == "0" else 1
+            cells.append((char, row, col, span))
+            col += span
+    return cells
+
+
+def _key_colors(char: str) -> tuple[tuple[int, int, int, int], tuple[int, int, int, int]]:
+    if char in ("/", "*", "-", "+", "="):
+        return (255, 255, 255, 255), (0, 0, 0, 255)
+    if char in ("C", "±", "%"):
+        return (80, 80, 80, 255), (255, 255, 255, 255)
+    return (30, 30, 30, 255), (255, 255, 255, 255)
+
+
+CALC_LAYOUT = Layout(
+    [
+        Slot("keys", height=Length(fraction=0.65)),
+        *grid_slots("keys", _key_cells(), len(BUTTONS), 4, 10),
+        Slot("display.expression", Length(-20, 1.0), Length(-20, 1.0), 0, 0),
+        Slot("display.value", Length(-20, 1.0), Length(-50, 1.0), 0, 0),
+    ],
+    metrics={"key.radius": 15},
+    fonts={"display.expression": 16, "display.value": 36, "key": 18},
+)
 
 class CalcApp:
     def __init__(self, asset_manager: AssetManager, app_area_x: float, app_area_y: float, app_area_w: float, app_area_h: float, scale_factor: float) -> None:
         self.asset_manager = asset_manager
         self.state = CalcState()
+        save_game.load("calc", self.state)
         self.scale_factor = scale_factor
         self.font_path = str(Path(__file__).parent.parent.parent.parent.parent / "assets" / "font.ttf")
         self.button_rects: list[tuple[arcade.Rect, str, tuple[int, int, int, int], tuple[int, int, int, int]]] = []
+        self.widget = Widget("calc", lambda: self.state.is_running).on("press", lambda event: True)
         self.resize(app_area_x, app_area_y, app_area_w, app_area_h)
 
-    def resize(self, app_area_x: float, app_area_y: float, app_area_w: float, app_area_h: float) -> None:
+    def resize(self, app_area_x: float, app_area_y: float, app_area_w: float, app_area_h: float, scale_factor: float | None = None) -> None:
+        if scale_factor is not None:
+            self.scale_factor = scale_factor
         self.app_x = app_area_x
         self.app_y = app_area_y
         self.app_w = app_area_w
@@ -34,47 +73,15 @@ class CalcApp:
         self._calculate_layout()
 
     def _calculate_layout(self) -> None:
+        self.frame = CALC_LAYOUT.solve(self.app_w, self.app_h, self.scale_factor, self.app_x, self.app_y)
         self.button_rects.clear()
-        padding = 10 * self.scale_factor
-        display_h = self.app_h * 0.35
-        buttons_h = self.app_h - display_h
-        
-        cols = 4
-        rows = 5
-        
-        btn_w = (self.app_w - padding * (cols + 1)) / cols
-        btn_h = (buttons_h - padding * (rows + 1)) / rows
-        
-        start_y = self.app_y + buttons_h - padding - btn_h
-        
-        for r_idx, row in enumerate(BUTTONS):
-            c_idx = 0
-            while c_idx < len(row):
-                char = row[c_idx]
-                is_zero = (char == "0")
-                
-                w = btn_w * 2 + padding if is_zero else btn_w
-                x = self.app_x + padding + c_idx * (btn_w + padding)
-                y = start_y - r_idx * (btn_h + padding)
-                
-                rect = make_rect(x, y, w, btn_h)
-                
-                if char in ("/", "*", "-", "+"):
-                    bg_col = (255, 255, 255, 255)
-                    txt_col = (0, 0, 0, 255)
-                elif char == "=":
-                    bg_col = (255, 255, 255, 255)
-                    txt_col = (0, 0, 0, 255)
-                elif char in ("C", "±", "%"):
-                    bg_col = (80, 80, 80, 255)
-                    txt_col = (255, 255, 255, 255)
-                else:
-                    bg_col = (30, 30, 30, 255)
-                    txt_col = (255, 255, 255, 255)
-                    
-                self.button_rects.append((rect, char, bg_col, txt_col))
-                
-                c_idx += 2 if is_zero else 1
+        self.widget.clear()
+        self.widget.set_bounds(self.app_x, self.app_y, self.app_w, self.app_h)
+        for char, _, _, _ in _key_cells():
+            rect = self.frame[char]
+            self.button_rects.append((rect, char, *_key_colors(char)))
+            button = self.widget.add(Widget(char).on("press", self._on_button_press))
+            button.set_bounds(rect.left, rect.bottom, rect.width, rect.height)
 
     def start(self) -> None:
         self.state.is_running = True
@@ -82,78 +89,69 @@ class CalcApp:
     def stop(self) -> None:
         self.state.is_running = False
 
-    def on_mouse_press(self, x: float, y: float, button: int, modifiers: int) -> bool:
-        if not self.state.is_running:
-            return False
-            
-        if self.app_x <= x <= self.app_x + self.app_w and self.app_y <= y <= self.app_y + self.app_h:
-            if button == arcade.MOUSE_BUTTON_LEFT:
-                for rect, char, _, _ in self.button_rects:
-                    if rect.left <= x <= rect.right and rect.bottom <= y <= rect.top:
-                        self.state.input_char(char)
-                        return True
-            return True
-        return False
+    def release(self) -> None:
+        self.stop()
 
-    def on_mouse_release(self, x: float, y: float, button: int, modifiers: int) -> bool:
-        if not self.state.is_running:
+    def _on_button_press(self, event: InputEvent) -> bool:
+        if event.button != arcade.MOUSE_BUTTON_LEFT:
             return False
-        return False
+        self.state.input_char(event.target.name)
+        return True
 
-    def on_mouse_motion(self, x: float, y: float, dx: float, dy: float) -> bool:
-        if not self.state.is_running:
-            return False
+    @property
+    def wants_update(self) -> bool:
         return False
 
+    @profiled("calc.update")
     def update(self, delta_time: float) -> None:
         pass
 
-    def draw(self) -> None:
+    @profiled("calc.draw")
+    def draw(self, alpha: float = 1.0) -> None:
         if not self.state.is_running:
             return
 
-        arcade.draw_rect_filled(make_rect(self.app_x, self.app_y, self.app_w, self.app_h), (10, 10, 10, 255))
-        
-        display_y = self.app_y + self.app_h - 20 * self.scale_factor
-        
-        if self.state.expression:
+        frame = self.frame
+        arcade.draw_rect_filled(frame[""], (10, 10, 10, 255))
+
+        if expression := self.state.expression:
+            if len(expression) > EXPRESSION_TAIL:
+                expression = "…" + expression[-EXPRESSION_TAIL:]
+            anchor = frame["display.expression"]
             arcade.draw_text(
-                self.state.expression,
-                self.app_x + self.app_w - 20 * self.scale_factor,
-                display_y,
+                expression,
+                anchor.left,
+                anchor.bottom,
                 (150, 150, 150, 255),
-                font_size=int(16 * self.scale_factor),
+                font_size=frame.fonts["display.expression"],
                 font_name=self.font_path,
                 anchor_x="right",
                 anchor_y="top"
             )
-            
+
+        anchor = frame["display.value"]
         arcade.draw_text(
             self.state.display,
-            self.app_x + self.app_w - 20 * self.scale_factor,
-            display_y - 30 * self.scale_factor,
+            anchor.left,
+            anchor.bottom,
             arcade.color.WHITE,
-            font_size=int(36 * self.scale_factor),
+            font_size=frame.fonts["display.value"],
             font_name=self.font_path,
             anchor_x="right",
             anchor_y="top"
         )
-        
+
+        r, font_size = frame.metrics["key.radius"], frame.fonts["key"]
         for rect, char, bg_col, txt_col in self.button_rects:
-            r = 15 * self.scale_factor
-            if char == "0":
-                draw_rounded_rect(rect.left, rect.bottom, rect.width, rect.height, bg_col, r)
-            else:
-                draw_rounded_rect(rect.left, rect.bottom, rect.width, rect.height, bg_col, r)
-                
+            draw_rounded_rect(rect.left, rect.bottom, rect.width, rect.height, bg_col, r)
             arcade.draw_text(
                 char,
-                rect.left + rect.width / 2,
-                rect.bottom + rect.height / 2,
+                rect.x,
+                rect.y,
                 txt_col,
-                font_size=int(18 * self.scale_factor),
+                font_size=font_size,
                 font_name=self.font_path,
                 anchor_x="center",
                 anchor_y="center",
                 bold=True
-            )
\ No newline at end of file
+            )
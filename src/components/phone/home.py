@@ -1,72 +1,76 @@
 from __future__ import annotations
 import arcade
 from typing import TYPE_CHECKING
-from src.shared.utils import make_centered_rect, make_rect
+from src.components.phone.apps import APPS
+from src.core.profiler import profiled
+from src.ui.layout import Layout, Length, Slot
 from src.ui.shapes import draw_rounded_rect
+from src.ui.widgets import Widget
 
 if TYPE_CHECKING:
     from src.core.asset_manager import AssetManager
 
 APP_ICON_SIZE = 40
 APP_ICON_TEXT_HEIGHT = 20
-APP_POSITIONS = {
-    "zasora": (85, 125),
-    "calc": (155, 125)
-}
+APP_POSITIONS = {spec.name: spec.position for spec in APPS}
+
+
+def home_layout(phone_height: float) -> Layout:
+    """Icon square, inset image, label anchor and hit box (icon plus label) per installed app."""
+    size, text = APP_ICON_SIZE, APP_ICON_TEXT_HEIGHT
+    slots = []
+    for spec in APPS:
+        pos_x, pos_y = spec.position
+        icon = f"icon.{spec.name}"
+        slots += [
+            Slot(icon, pos_x, phone_height - pos_y - size, size, size),
+            Slot(f"{icon}.image", Length(fraction=0.125), Length(fraction=0.125), Length(fraction=0.75), Length(fraction=0.75), icon),
+            Slot(f"{icon}.label", Length(fraction=0.5), -6, 0, 0, icon),
+            Slot(f"{icon}.hit", 0, -text, size, size + text, icon),
+        ]
+    return Layout(slots, metrics={"icon.radius": size * 0.2}, fonts={"icon.label": 12})
+
 
 class PhoneHome:
     def __init__(self, asset_manager: AssetManager, scale_factor: float, scaled_width: float, scaled_height: float, phone_height: float):
         self.asset_manager = asset_manager
+        self.phone_height = phone_height
+        self.layout = home_layout(phone_height)
+        self.widget = Widget("home")
+        self.icons = {name: self.widget.add(Widget(name)) for name in APP_POSITIONS}
+        self.resize(scale_factor, scaled_width, scaled_height)
+        self.screen_on_texture = self.asset_manager.get_texture("SCREEN_ON")
+        self.icon_textures = {spec.name: self.asset_manager.get_texture(spec.icon) for spec in APPS}
+
+    def resize(self, scale_factor: float, scaled_width: float, scaled_height: float) -> None:
         self.scale_factor = scale_factor
         self.scaled_width = scaled_width
         self.scaled_height = scaled_height
-        self.phone_height = phone_height
-        self.screen_on_texture = self.asset_manager.get_texture("SCREEN_ON")
-        self.zasora_icon_texture = self.asset_manager.get_texture("zasora")
-        self.calc_icon_texture = self.asset_manager.get_texture("calc")
+        self.frame = self.layout.solve(scaled_width, scaled_height, scale_factor)
+        for app_name, icon in self.icons.items():
+            hit = self.frame[f"icon.{app_name}.hit"]
+            icon.set_bounds(hit.left, hit.bottom, hit.width, hit.height)
 
-    def draw(self, phone_x: float, phone_y: float):
+    @profiled("home.draw")
+    def draw(self):
         if self.screen_on_texture:
-            arcade.draw_texture_rect(
-                self.screen_on_texture,
-                make_centered_rect(phone_x + self.scaled_width / 2, phone_y + self.scaled_height / 2, self.scaled_width, self.scaled_height),
-            )
-        
-        font_path = "assets/font.ttf"
-        for app_name, (pos_x, pos_y) in APP_POSITIONS.items():
-            if app_name == "zasora":
-                self._draw_app_icon(self.zasora_icon_texture, "zasora", phone_x, phone_y, pos_x, pos_y, str(font_path))
-            elif app_name == "calc":
-                self._draw_app_icon(self.calc_icon_texture, "calc", phone_x, phone_y, pos_x, pos_y, str(font_path))
+            arcade.draw_texture_rect(self.screen_on_texture, self.frame[""])
 
-    def _draw_app_icon(self, icon_texture, label, phone_x, phone_y, base_x, base_y, font_name):
-        icon_size = APP_ICON_SIZE * self.scale_factor
-        bl_x = phone_x + base_x * self.scale_factor
-        bl_y = phone_y + (self.phone_height - base_y) * self.scale_factor - icon_size
+        font_path = "assets/font.ttf"
+        for spec in APPS:
+            self._draw_app_icon(self.icon_textures[spec.name], spec.label, f"icon.{spec.name}", font_path)
 
-        draw_rounded_rect(bl_x, bl_y, icon_size, icon_size, arcade.color.BLACK, icon_size * 0.2)
+    def _draw_app_icon(self, icon_texture, label, slot, font_name):
+        frame = self.frame
+        icon = frame[slot]
+        draw_rounded_rect(icon.left, icon.bottom, icon.width, icon.height, arcade.color.BLACK, frame.metrics["icon.radius"])
 
         if icon_texture:
-            texture_size = icon_size * 0.75
-            texture_offset = (icon_size - texture_size) / 2
-            arcade.draw_texture_rect(
-                icon_texture,
-                make_rect(bl_x + texture_offset, bl_y + texture_offset, texture_size, texture_size),
-            )
+            arcade.draw_texture_rect(icon_texture, frame[f"{slot}.image"])
 
-        font_size = int(12 * self.scale_factor)
+        anchor = frame[f"{slot}.label"]
         arcade.draw_text(
-            label, bl_x + icon_size / 2, bl_y - font_size * 0.5,
-            arcade.color.WHITE, font_size=font_size, font_name=font_name,
+            label, anchor.left, anchor.bottom,
+            arcade.color.WHITE, font_size=frame.fonts["icon.label"], font_name=font_name,
             anchor_x="center", anchor_y="top"
         )
-
-    def check_app_icon_click(self, x, y, phone_x, phone_y) -> str | None:
-        for app_name, (pos_x, pos_y) in APP_POSITIONS.items():
-            icon_size = APP_ICON_SIZE * self.scale_factor
-            text_height = APP_ICON_TEXT_HEIGHT * self.scale_factor
-            bl_x = phone_x + pos_x * self.scale_factor
-            bl_y = phone_y + (self.phone_height - pos_y) * self.scale_factor - icon_size
-            if bl_x <= x <= bl_x + icon_size and bl_y - text_height <= y <= bl_y + icon_size:
-                return app_name
-        return None
\ No newline at end of file
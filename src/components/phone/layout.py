@@ -2,74 +2,95 @@ from __future__ import annotations
 import arcade
 from typing import TYPE_CHECKING
 from src.states.phone import PhoneState
-from src.shared.utils import make_rect, make_centered_rect
+from src.ui.layout import Layout, Length, Slot
 
 if TYPE_CHECKING:
     from src.states.phone import PhoneData
 
+PHONE_BUTTON_SIZE = 64
+PHONE_BUTTON_MARGIN = 20
+APP_AREA = (70, 90, 230, 435)
+
+
+def window_layout(phone_width: float, phone_height: float) -> Layout:
+    """Window space at the display scale: phone body centered, power and home buttons in the bottom right corner."""
+    size, margin = PHONE_BUTTON_SIZE, PHONE_BUTTON_MARGIN
+    return Layout([
+        Slot("body", Length(-phone_width / 2, 0.5), Length(-phone_height / 2, 0.5), phone_width, phone_height),
+        Slot("power", Length(-size, 1.0, -margin), Length(px=margin), size, size),
+        Slot("home", Length(-2 * size, 1.0, -2 * margin), Length(px=margin), size, size),
+    ])
+
+
+SCREEN_LAYOUT = Layout([
+    Slot("app", *APP_AREA),
+    Slot("boot.logo", Length(-79, 0.5), Length(-14, 0.5), 128, 128),
+    Slot("boot.title", Length(-15, 0.5), Length(-34, 0.5), 0, 0),
+    Slot("boot.status", Length(0, 0.5), Length(-64, 0.5), 0, 0),
+], fonts={"boot.title": 24, "boot.status": 16})
+
+
 class PhoneLayout:
-    def __init__(self, asset_manager, scale_factor, scaled_width, scaled_height, center_x, center_y):
+    def __init__(self, asset_manager, scale_factor, screen_scale, phone_width, phone_height, width, height):
         self.asset_manager = asset_manager
-        self.scale_factor = scale_factor
-        self.scaled_width = scaled_width
-        self.scaled_height = scaled_height
-        self.power_button_size = 64 * self.scale_factor
-        self.home_button_size = 64 * self.scale_factor
+        self.phone_width, self.phone_height = phone_width, phone_height
+        self.window_layout = window_layout(phone_width, phone_height)
         self.body_texture = self.asset_manager.get_texture("telefon_body")
         self.screen_off_texture = self.asset_manager.get_texture("SCREEN_OFF")
         self.screen_black_texture = self.asset_manager.get_texture("SCREEN_BLACK")
         self.power_button_texture = self.asset_manager.get_texture("powerbtn")
         self.home_button_texture = self.asset_manager.get_texture("homebtn")
         self.turtle_logo_texture = self.asset_manager.get_texture("turtlelogo")
-        self.resize(center_x, center_y, center_x * 2, center_y * 2)
+        self.set_screen_scale(screen_scale)
+        self.resize(scale_factor, width, height)
+
+    def resize(self, scale_factor, width, height, x=0.0, y=0.0):
+        self.scale_factor = scale_factor
+        self.window = self.window_layout.solve(width, height, scale_factor, x, y)
+        body, power, home = self.window["body"], self.window["power"], self.window["home"]
+        self.phone_x, self.phone_y, self.scaled_width, self.scaled_height = body.left, body.bottom, body.width, body.height
+        self.power_button_x, self.power_button_y, self.power_button_size = power.left, power.bottom, power.width
+        self.home_button_x, self.home_button_y, self.home_button_size = home.left, home.bottom, home.width
+        self.center_x, self.center_y = body.x, body.y
 
-    def resize(self, center_x, center_y, width, height):
-        self.phone_x = center_x - self.scaled_width / 2
-        self.phone_y = center_y - self.scaled_height / 2
-        self.power_button_x = width - self.power_button_size - 20
-        self.power_button_y = 20
-        self.home_button_x = self.power_button_x - self.home_button_size - 20
-        self.home_button_y = 20
-        self.center_x, self.center_y = center_x, center_y
+    def set_screen_scale(self, screen_scale):
+        self.screen_scale = screen_scale
+        self.screen_width = self.phone_width * screen_scale
+        self.screen_height = self.phone_height * screen_scale
+        self.screen = SCREEN_LAYOUT.solve(self.screen_width, self.screen_height, screen_scale)
 
     def draw_base(self):
         if self.screen_black_texture:
-            arcade.draw_texture_rect(
-                self.screen_black_texture,
-                make_centered_rect(self.phone_x + self.scaled_width / 2, self.phone_y + self.scaled_height / 2, self.scaled_width, self.scaled_height),
-            )
+            arcade.draw_texture_rect(self.screen_black_texture, self.screen[""])
 
     def draw_off_screen(self):
         if self.screen_off_texture:
-            arcade.draw_texture_rect(
-                self.screen_off_texture,
-                make_centered_rect(self.phone_x + self.scaled_width / 2, self.phone_y + self.scaled_height / 2, self.scaled_width, self.scaled_height),
-            )
+            arcade.draw_texture_rect(self.screen_off_texture, self.screen[""])
 
     def draw_boot_screen(self, progress: float):
-        logo_size = 128 * self.scale_factor
-        logo_x, logo_y = self.center_x - 15 * self.scale_factor, self.center_y + 50 * self.scale_factor
+        screen = self.screen
         if self.turtle_logo_texture:
-            arcade.draw_texture_rect(self.turtle_logo_texture, make_centered_rect(logo_x, logo_y, logo_size, logo_size))
-        
+            arcade.draw_texture_rect(self.turtle_logo_texture, screen["boot.logo"])
+
         font = "assets/font.ttf"
+        title, status = screen["boot.title"], screen["boot.status"]
         arcade.draw_text(
-            "TURTLE OS", logo_x, logo_y - logo_size / 2 - 20 * self.scale_factor, 
-            arcade.color.WHITE, font_size=int(24 * self.scale_factor), 
+            "TURTLE OS", title.left, title.bottom,
+            arcade.color.WHITE, font_size=screen.fonts["boot.title"],
             font_name=font, anchor_x="center", anchor_y="top"
         )
         arcade.draw_text(
-            "booting" + "." * int(progress * 3), self.center_x, 
-            logo_y - logo_size / 2 - 50 * self.scale_factor, arcade.color.GRAY, 
-            font_size=int(16 * self.scale_factor), font_name=font, anchor_x="center", anchor_y="top"
+            "booting" + "." * int(progress * 3), status.left, status.bottom,
+            arcade.color.GRAY, font_size=screen.fonts["boot.status"],
+            font_name=font, anchor_x="center", anchor_y="top"
         )
 
     def draw_overlay(self, state: PhoneData):
         if self.body_texture:
-            arcade.draw_texture_rect(self.body_texture, make_rect(self.phone_x, self.phone_y, self.scaled_width, self.scaled_height))
-        
-        for btn, tex, x, y, size, blocked in [("power", self.power_button_texture, self.power_button_x, self.power_button_y, self.power_button_size, state.power_button_blocked), ("home", self.home_button_texture, self.home_button_x, self.home_button_y, self.home_button_size, state.state in (PhoneState.OFF, PhoneState.BOOTING))]:
+            arcade.draw_texture_rect(self.body_texture, self.window["body"])
+
+        for tex, rect, blocked in [(self.power_button_texture, self.window["power"], state.power_button_blocked), (self.home_button_texture, self.window["home"], state.state in (PhoneState.OFF, PhoneState.BOOTING))]:
             if tex:
-                arcade.draw_texture_rect(tex, make_rect(x, y, size, size))
+                arcade.draw_texture_rect(tex, rect)
                 if blocked:
-                    arcade.draw_rect_filled(make_rect(x, y, size, size), (128, 128, 128, 128))
\ No newline at end of file
+                    arcade.draw_rect_filled(rect, (128, 128, 128, 128))
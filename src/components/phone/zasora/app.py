@@ -1,20 +1,60 @@
 from __future__ import annotations
-import json
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING
 import arcade
 import pyglet
 import pyglet.media
+from src.core.pixelate import video_pixelation
+from src.core.profiler import profiled
+from src.core.save_game import save_game
+from src.core.telemetry import EVENT_DECODE_STALL, EVENT_SWIPE, EVENT_VIDEO_LOAD, EVENT_VIDEO_READY, EVENT_WATCH, telemetry
 from src.states.zasora import ZasoraState
 from src.components.phone.zasora.commentPanel import CommentPanel
 from src.components.phone.zasora.header import ZasoraHeader
-from src.shared.utils import make_rect, make_centered_rect
-from src.ui.text import draw_wrapped_text
+from src.components.phone.zasora.overlay import VideoOverlay
+from src.composables.zasora.phrasesLoader import PhraseTable
+from src.ui.layout import FULL, Layout, Length, Slot
+from src.ui.kinetic import VelocityTracker, fling_direction, spring_step
+from src.ui.widgets import InputEvent, Widget
 
 if TYPE_CHECKING:
     from src.core.asset_manager import AssetManager
 
 ZASORA_HEADER_HEIGHT = 60
+SWIPE_SPRING_FREQUENCY = 14.0
+SWIPE_FLING_VELOCITY = 500.0
+SWIPE_PROJECTION_TIME = 0.15
+SWIPE_CLICK_DISTANCE = 10
+SWIPE_REST_OFFSET = 0.5
+SWIPE_REST_VELOCITY = 5.0
+DECODE_STALL_THRESHOLD = 0.25
+
+ZASORA_LAYOUT = Layout(
+    [
+        Slot("video", height=Length(-ZASORA_HEADER_HEIGHT, 1.0)),
+        Slot("header", 0, Length(-ZASORA_HEADER_HEIGHT, 1.0), FULL, ZASORA_HEADER_HEIGHT),
+        Slot("header.logo", 10, Length(-20, 0.5), 40, 40, "header"),
+        Slot("header.title", 65, Length(0, 0.5), 0, 0, "header"),
+        Slot("pause", Length(0, 0.5), Length(0, 0.5), 0, 0, "video"),
+        Slot("pause.icon", Length(-10, 0.5), Length(-15, 0.5), 25, 30, "video"),
+        Slot("like", Length(-57.5, 1.0), Length(-17.5, 0.5), 35, 35, "video"),
+        Slot("like.badge", Length(-25, 1.0), Length(0, 0.5), 0, 0, "video"),
+        Slot("like.icon", Length(-35.8, 1.0), Length(-10.8, 0.5), 21.6, 21.6, "video"),
+        Slot("like.count", Length(-25, 1.0), Length(-23, 0.5), 0, 0, "video"),
+        Slot("comment", Length(-57.5, 1.0), Length(-82.5, 0.5), 35, 35, "video"),
+        Slot("comment.badge", Length(-25, 1.0), Length(-65, 0.5), 0, 0, "video"),
+        Slot("comment.icon", Length(-35.8, 1.0), Length(-75.8, 0.5), 21.6, 21.6, "video"),
+        Slot("comment.count", Length(-25, 1.0), Length(-88, 0.5), 0, 0, "video"),
+        Slot("comments", height=Length(fraction=0.65)),
+        Slot("caption", 5, 10, Length(-50, 1.0), 0),
+    ],
+    metrics={
+        "pause.radius": 30, "badge.radius": 18, "caption.padding": 10, "swipe.fling_velocity": SWIPE_FLING_VELOCITY,
+        "swipe.rest_offset": SWIPE_REST_OFFSET, "swipe.rest_velocity": SWIPE_REST_VELOCITY,
+    },
+    fonts={"header.title": 22, "count": 12, "caption.author": 14, "caption.text": 12},
+)
 
 class VideoPlayer:
     def __init__(self) -> None:
@@ -22,10 +62,16 @@ class VideoPlayer:
         self._source: pyglet.media.Source | None = None
         self._is_playing: bool = False
         self._wants_preload: bool = False
+        self._loaded_at: float | None = None
+        self._media_time = 0.0
+        self._media_time_at = 0.0
+        self._stalled = False
+        self.name = ""
 
     def load(self, video_path: Path, auto_play: bool = True) -> bool:
         try:
             self.stop()
+            self.name = video_path.name
             self._source = pyglet.media.load(str(video_path))
             self._player = pyglet.media.Player()
             self._player.queue(self._source)
@@ -33,10 +79,40 @@ class VideoPlayer:
             self._player.play()
             self._is_playing = auto_play
             self._wants_preload = not auto_play
+            self._loaded_at = perf_counter()
+            telemetry.record(EVENT_VIDEO_LOAD, int(auto_play))
             return True
         except Exception: return False
 
+    @property
+    def is_pending(self) -> bool:
+        """Still waiting for a first frame (preload pause or ready telemetry)."""
+        return self._wants_preload or self._loaded_at is not None
+
+    @property
+    def is_ready(self) -> bool:
+        return bool(self._player and self._player.texture)
+
+    def _track(self) -> None:
+        now = perf_counter()
+        if self._loaded_at is not None and self._player.texture:
+            telemetry.record(EVENT_VIDEO_READY, value=now - self._loaded_at)
+            self._loaded_at = None
+        if not self._is_playing:
+            self._media_time_at = now
+            return
+        if self._player.time != self._media_time:
+            if self._stalled:
+                telemetry.record(EVENT_DECODE_STALL, value=now - self._media_time_at)
+                self._stalled = False
+            self._media_time, self._media_time_at = self._player.time, now
+        elif now - self._media_time_at > DECODE_STALL_THRESHOLD and self._player.source:
+            self._stalled = True
+
+    @profiled("video.update")
     def update(self) -> None:
+        if self._player and telemetry.enabled:
+            self._track()
         if self._wants_preload and self._player and self._player.texture:
             self._player.pause()
             self._player.seek(0)
@@ -63,9 +139,13 @@ class VideoPlayer:
             self._player.play()
             self._is_playing = True
 
+    @profiled("video.draw")
     def draw(self, x: float, y: float, width: float, height: float) -> None:
         if self._player and self._player.texture:
-            self._player.texture.blit(int(x), int(y), width=int(width), height=int(height))
+            if (pixel_size := video_pixelation.size_for(self.name)) > 1:
+                video_pixelation.draw(self._player.texture, x, y, width, height, pixel_size)
+            else:
+                self._player.texture.blit(int(x), int(y), width=int(width), height=int(height))
 
     def stop(self) -> None:
         if self._player:
@@ -74,102 +154,160 @@ class VideoPlayer:
             self._player = None
         self._source = None
         self._is_playing = self._wants_preload = False
+        self._loaded_at, self._stalled = None, False
 
 class ZasoraApp:
     def __init__(self, asset_manager: AssetManager, app_area_x: float, app_area_y: float, app_area_w: float, app_area_h: float, scale_factor: float) -> None:
         self.asset_manager = asset_manager
         self.state = ZasoraState()
+        save_game.load("zasora", self.state)
         self.scale_factor = scale_factor
+        self.comment_panel = CommentPanel(self.state, scale_factor)
+        self.header = ZasoraHeader(asset_manager)
+        self.widget = Widget("zasora", lambda: self.state.is_running)
+        self.widget.on("press", self._on_modal_press, capture=True)
+        for kind, handler in (("press", self._on_press), ("release", self._on_release), ("motion", self._on_motion), ("scroll", self._on_scroll)):
+            self.widget.on(kind, handler)
+        self.like_button = self.widget.add(Widget("like"))
+        self.comment_button = self.widget.add(Widget("comment"))
         self.resize(app_area_x, app_area_y, app_area_w, app_area_h)
-        self._swipe_start_y = self.state.y_offset = 0.0
-        self._is_swiping = False
+        self._swipe_start_y = self.state.y_offset = self._prev_y_offset = self._clock = 0.0
+        self._is_swiping = self._press_settled = False
+        self._swipe_tracker = VelocityTracker()
         self._video_player, self._next_video_player, self._prev_video_player = VideoPlayer(), VideoPlayer(), VideoPlayer()
-        self.comment_panel = CommentPanel(self.state, scale_factor)
-        self.header = ZasoraHeader(asset_manager, scale_factor)
         self.font_path = str(Path(__file__).parent.parent.parent.parent.parent / "assets" / "font.ttf")
         self._load_resources()
         
-    def resize(self, app_area_x: float, app_area_y: float, app_area_w: float, app_area_h: float) -> None:
+    def resize(self, app_area_x: float, app_area_y: float, app_area_w: float, app_area_h: float, scale_factor: float | None = None) -> None:
+        if scale_factor is not None:
+            self.scale_factor = scale_factor
         self.app_x, self.app_y, self.app_w, self.app_h = app_area_x, app_area_y, app_area_w, app_area_h
-        self.header_height = ZASORA_HEADER_HEIGHT * getattr(self, "scale_factor", 1.0)
-        self.video_area_x, self.video_area_y, self.video_area_width = self.app_x, self.app_y, self.app_w
-        self.video_area_height = self.app_h - self.header_height
+        self.frame = ZASORA_LAYOUT.solve(app_area_w, app_area_h, self.scale_factor, app_area_x, app_area_y)
+        video = self.frame["video"]
+        self.header_height = self.frame["header"].height
+        self.video_area_x, self.video_area_y, self.video_area_width, self.video_area_height = video.left, video.bottom, video.width, video.height
+        self.comment_panel.place(self.frame["comments"], self.scale_factor)
+        self.widget.set_bounds(app_area_x, app_area_y, app_area_w, app_area_h)
+        for button, name in ((self.like_button, "like"), (self.comment_button, "comment")):
+            rect = self.frame[name]
+            button.set_bounds(rect.left, rect.bottom, rect.width, rect.height)
 
     def _load_resources(self) -> None:
         self.like_tex = self.asset_manager.get_texture("like")
         self.unlike_tex = self.asset_manager.get_texture("unlike")
         self.comment_tex = self.asset_manager.get_texture("comment")
-        phrases_path = Path(__file__).parent.parent.parent.parent.parent / "assets" / "stories" / "phrases.json"
-        if phrases_path.exists():
-            try:
-                with open(phrases_path, "r", encoding="utf-8") as f: self.state.phrases = json.load(f)
-            except Exception: self.state.phrases = {}
+        self.state.phrases = PhraseTable.load()
+        self._overlay_key: tuple | None = None
+        self._overlay: VideoOverlay | None = None
         self._load_current_video()
 
     def start(self) -> None:
         self.state.is_running = True
+        self._hold_pointer()
         self._video_player.seek_start()
         self._video_player.play()
 
     def stop(self) -> None:
         self.state.is_running = False
         self._video_player.pause()
+        if self.widget.tree: self.widget.tree.release(self.widget)
+
+    def release(self) -> None:
+        self.stop()
+        for p in [self._video_player, self._next_video_player, self._prev_video_player]: p.stop()
+        self._overlay_key = self._overlay = None
+        self.comment_panel.release()
+        self.state.close()
 
     def _load_current_video(self) -> None:
         if vid := self.state.get_current_video(): self._video_player.load(vid, False)
         if nxt := self.state.get_video_by_offset(1): self._next_video_player.load(nxt, False)
         if prv := self.state.get_video_by_offset(-1): self._prev_video_player.load(prv, False)
 
-    def _finalize_swipe(self) -> None:
-        threshold = self.video_area_height * 0.25
-        if abs(self.state.y_offset) > threshold:
-            direction = 1 if self.state.y_offset > 0 else -1
-            if direction == 1:
-                self.state.next_video()
-                self._prev_video_player.stop()
-                self._prev_video_player, self._video_player = self._video_player, self._next_video_player
-                self._next_video_player = VideoPlayer()
-                if nxt := self.state.get_video_by_offset(1): self._next_video_player.load(nxt, False)
-            elif self.state.current_video_index > 0:
-                self.state.prev_video()
-                self._next_video_player.stop()
-                self._next_video_player, self._video_player = self._video_player, self._prev_video_player
-                self._prev_video_player = VideoPlayer()
-                if prv := self.state.get_video_by_offset(-1): self._prev_video_player.load(prv, False)
-            self._video_player.play()
-        self.state.y_offset = 0.0
+    def _release_swipe(self) -> None:
+        """Pick the page to settle on from offset and fling velocity; a page change commits right away."""
+        velocity = self.state.swipe_velocity = self._swipe_tracker.velocity(self._clock)
+        direction = fling_direction(
+            self.state.y_offset, velocity, self.video_area_height,
+            self.frame.metrics["swipe.fling_velocity"], SWIPE_PROJECTION_TIME,
+        )
+        if direction == -1 and self.state.current_video_index == 0: direction = 0
+        if direction: self._commit_swipe(direction)
+
+    def _commit_swipe(self, direction: int) -> None:
+        """Make the incoming video current while the spring is still carrying it into place.
+
+        The offset is rebased onto the new page so the picture does not jump; the incoming player
+        starts decoding and the next neighbour starts preloading before the animation ends.
+        """
+        incoming = self._next_video_player if direction == 1 else self._prev_video_player
+        telemetry.record(EVENT_WATCH, value=self.state.watch_time)
+        telemetry.record(EVENT_SWIPE, direction, float(incoming.is_ready))
+        if direction == 1:
+            self.state.next_video()
+            self._prev_video_player.stop()
+            self._prev_video_player, self._video_player = self._video_player, self._next_video_player
+            self._next_video_player = VideoPlayer()
+            if nxt := self.state.get_video_by_offset(1): self._next_video_player.load(nxt, False)
+        else:
+            self.state.prev_video()
+            self._next_video_player.stop()
+            self._next_video_player, self._video_player = self._video_player, self._prev_video_player
+            self._prev_video_player = VideoPlayer()
+            if prv := self.state.get_video_by_offset(-1): self._prev_video_player.load(prv, False)
+        shift = direction * self.video_area_height
+        self.state.y_offset -= shift
+        self._prev_y_offset -= shift
         self._video_player.seek_start()
-        if not self.state.show_comments: self._video_player.play()
+        self._video_player.play()
 
-    def on_mouse_press(self, x: float, y: float, button: int, modifiers: int) -> bool:
-        if not self.state.is_running: return False
-        if self.state.show_comments:
-            action = self.comment_panel.on_mouse_press(x, y, self.app_x, self.app_y, self.app_w, self.app_h * 0.65, self.state.get_current_video())
-            if action in ("close", "outside"):
-                self.state.show_comments = False
-                self._video_player.play()
-            return True
-        if self.app_x <= x <= self.app_x + self.app_w and self.app_y <= y <= self.app_y + self.app_h:
-            if button == arcade.MOUSE_BUTTON_LEFT:
-                self._is_swiping, self._swipe_start_y, self.state.swipe_velocity = True, y, 0
-                return True
-        return False
+    def _hold_pointer(self) -> None:
+        if self.widget.tree:
+            if self._is_swiping or self.state.show_comments: self.widget.tree.capture(self.widget)
+            else: self.widget.tree.release(self.widget)
+
+    def _on_modal_press(self, event: InputEvent) -> bool:
+        if not self.state.show_comments: return False
+        action = self.comment_panel.on_mouse_press(event.x, event.y, self.state.get_current_video())
+        if action in ("close", "outside"):
+            self.state.show_comments = False
+            self._video_player.play()
+        self._hold_pointer()
+        return True
 
-    def on_mouse_release(self, x: float, y: float, button: int, modifiers: int) -> bool:
-        if self._is_swiping and button == arcade.MOUSE_BUTTON_LEFT:
+    def _on_press(self, event: InputEvent) -> bool:
+        if event.button != arcade.MOUSE_BUTTON_LEFT or not self.widget.contains(event.x, event.y): return False
+        self._is_swiping, self._swipe_start_y, self.state.swipe_velocity = True, event.y, 0.0
+        self._press_settled = self.state.y_offset == 0
+        self._swipe_tracker.reset(self._clock, self.state.y_offset)
+        self._hold_pointer()
+        return True
+
+    def _on_release(self, event: InputEvent) -> bool:
+        if self.state.show_comments: self.comment_panel.on_mouse_release()
+        if self._is_swiping and event.button == arcade.MOUSE_BUTTON_LEFT:
             self._is_swiping = False
-            if abs(self._swipe_start_y - y) < 10: self._handle_click(x, y)
-            else: self._finalize_swipe()
+            if self._press_settled and abs(self._swipe_start_y - event.y) < SWIPE_CLICK_DISTANCE: self._handle_click(event.x, event.y)
+            else: self._release_swipe()
+            self._hold_pointer()
             return True
         return False
         
-    def on_mouse_motion(self, x: float, y: float, dx: float, dy: float) -> bool:
-        if self._is_swiping and not self.state.show_comments:
-            self.state.y_offset += dy
+    def _on_motion(self, event: InputEvent) -> bool:
+        if self.state.show_comments:
+            return self.comment_panel.on_mouse_motion(event.dy, self.state.get_current_video())
+        if self._is_swiping:
+            self.state.y_offset += event.dy
+            self._swipe_tracker.add(self._clock, self.state.y_offset)
             self._video_player.pause()
             return True
         return False
 
+    def _on_scroll(self, event: InputEvent) -> bool:
+        if not self.state.show_comments: return False
+        self.comment_panel.on_mouse_scroll(event.dy, self.state.get_current_video())
+        return True
+
     def on_key_press(self, symbol: int, modifiers: int) -> None:
         if self.state.show_comments: self.comment_panel.on_key_press(symbol, modifiers, self.state.get_current_video())
 
@@ -177,79 +315,84 @@ class ZasoraApp:
         if self.state.show_comments: self.comment_panel.on_text(text)
         
     def _handle_click(self, x: float, y: float) -> None:
-        lx, ly, ls = self.app_x + self.app_w - 40 * self.scale_factor, self.app_y + self.video_area_height / 2, 35 * self.scale_factor
-        if lx - ls/2 <= x <= lx + ls/2:
-            if ly - ls/2 <= y <= ly + ls/2: self._toggle_like(); return
-            if ly - 65 * self.scale_factor - ls/2 <= y <= ly - 65 * self.scale_factor + ls/2:
-                self.state.show_comments = True
-                self._video_player.pause(); return
+        if self.like_button.contains(x, y): self._toggle_like(); return
+        if self.comment_button.contains(x, y):
+            self.state.show_comments = True
+            self._video_player.pause(); return
         self.state.is_paused = not self.state.is_paused
         if self.state.is_paused: self._video_player.pause()
         else: self._video_player.play()
             
     def _toggle_like(self) -> None:
         if vid := self.state.get_current_video():
-            inter = self.state.get_interaction(vid.name)
-            inter.is_liked = not inter.is_liked
-            inter.likes += 1 if inter.is_liked else -1
-            self.state.save_interactions()
+            self.state.toggle_like(vid.name)
+
+    @property
+    def is_animating(self) -> bool:
+        return self.state.is_running and (not self.state.is_paused or self._is_swiping or self.state.y_offset != 0)
+
+    @property
+    def wants_update(self) -> bool:
+        return self.is_animating or any(p.is_pending for p in (self._video_player, self._next_video_player, self._prev_video_player))
 
+    @profiled("zasora.update")
     def update(self, delta_time: float) -> None:
         for p in [self._video_player, self._next_video_player, self._prev_video_player]: p.update()
+        self._prev_y_offset = self.state.y_offset
+        self._clock += delta_time
         if not self.state.is_running: return
         if not self._is_swiping and self.state.y_offset != 0:
-            if abs(self.state.y_offset) < 5:
-                self.state.y_offset = 0
+            offset, velocity = spring_step(self.state.y_offset, self.state.swipe_velocity, SWIPE_SPRING_FREQUENCY, delta_time)
+            if abs(offset) < self.frame.metrics["swipe.rest_offset"] and abs(velocity) < self.frame.metrics["swipe.rest_velocity"]:
+                offset = velocity = 0.0
                 if not self.state.is_paused and not self.state.show_comments: self._video_player.play()
-            else: self.state.y_offset *= 0.8 
-        if self._video_player.is_finished() and not self.state.is_paused and not self._is_swiping and self.state.y_offset == 0 and not self.state.show_comments:
-            self.state.y_offset = self.video_area_height * 0.45 
-            self._finalize_swipe()
+            self.state.y_offset, self.state.swipe_velocity = offset, velocity
+        watching = not self.state.is_paused and not self._is_swiping and self.state.y_offset == 0 and not self.state.show_comments
+        if watching: self.state.watch_time += delta_time
+        if self._video_player.is_finished() and watching:
+            self.state.swipe_velocity = 0.0
+            self._commit_swipe(1)
 
-    def draw(self) -> None:
+    @profiled("zasora.draw")
+    def draw(self, alpha: float = 1.0) -> None:
         if not self.state.is_running: return
         ctx = arcade.get_window().ctx
         old_scissor = ctx.scissor
+        frame = self.frame
         ctx.scissor = (int(self.app_x), int(self.app_y), int(self.app_w), int(self.app_h))
-        arcade.draw_rect_filled(make_rect(self.app_x, self.app_y, self.app_w, self.app_h), arcade.color.BLACK)
-        yo = self.state.y_offset
+        arcade.draw_rect_filled(frame[""], arcade.color.BLACK)
+        yo = self.state.y_offset if self._is_swiping else self._prev_y_offset + (self.state.y_offset - self._prev_y_offset) * alpha
         if yo > 0: self._next_video_player.draw(self.video_area_x, self.video_area_y + yo - self.video_area_height, self.video_area_width, self.video_area_height)
         if yo < 0: self._prev_video_player.draw(self.video_area_x, self.video_area_y + yo + self.video_area_height, self.video_area_width, self.video_area_height)
         self._video_player.draw(self.video_area_x, self.video_area_y + yo, self.video_area_width, self.video_area_height)
         if self.state.is_paused and not self.state.show_comments:
-            arcade.draw_circle_filled(self.app_x + self.app_w/2, self.app_y + self.video_area_height/2, 30 * self.scale_factor, (0, 0, 0, 150))
-            arcade.draw_triangle_filled(self.app_x + self.app_w/2 - 10 * self.scale_factor, self.app_y + self.video_area_height/2 + 15 * self.scale_factor, self.app_x + self.app_w/2 - 10 * self.scale_factor, self.app_y + self.video_area_height/2 - 15 * self.scale_factor, self.app_x + self.app_w/2 + 15 * self.scale_factor, self.app_y + self.video_area_height/2, arcade.color.WHITE)
+            pause, icon = frame["pause"], frame["pause.icon"]
+            arcade.draw_circle_filled(pause.left, pause.bottom, frame.metrics["pause.radius"], (0, 0, 0, 150))
+            arcade.draw_triangle_filled(icon.left, icon.top, icon.left, icon.bottom, icon.right, icon.y, arcade.color.WHITE)
         if vid := self.state.get_current_video():
             self._draw_overlay(vid); self._draw_interactions(vid)
-            if self.state.show_comments: self.comment_panel.draw(vid, self.app_x, self.app_y, self.app_w, self.app_h * 0.65)
-        self.header.draw(self.app_x, self.app_y, self.app_w, self.app_h, self.header_height)
+            if self.state.show_comments: self.comment_panel.draw(vid)
+        self.header.draw(frame)
         ctx.scissor = old_scissor
 
     def _draw_overlay(self, current_vid: Path) -> None:
-        info = self.state.phrases.get(current_vid.name, {})
-        auth, desc = info.get("author", ""), info.get("describe", "")
-        if auth or desc:
-            pad, afs, dfs, aw = 10 * self.scale_factor, int(14 * self.scale_factor), int(12 * self.scale_factor), self.app_w - 70 * self.scale_factor 
-            h = pad * 2 + (afs * 1.5 if auth else 0) + (len(desc.split())//3 + 1) * dfs * 1.3
-            arcade.draw_rect_filled(make_rect(self.app_x + 5 * self.scale_factor, self.app_y + 10 * self.scale_factor, aw + pad * 2, h), (0, 0, 0, 150))
-            tx, cy = self.app_x + 5 * self.scale_factor + pad, self.app_y + 10 * self.scale_factor + h - pad
-            if auth:
-                arcade.draw_text(
-                    f"@{auth}", tx, cy, arcade.color.WHITE, 
-                    font_size=afs, font_name=self.font_path, 
-                    anchor_x="left", anchor_y="top", bold=True
-                )
-                cy -= afs * 1.5
-            draw_wrapped_text(desc, tx, cy, aw, dfs, arcade.color.WHITE, self.font_path)
+        key = (current_vid.name, self.frame)
+        if key != self._overlay_key:
+            self._overlay_key, self._overlay = key, None
+            if (info := self.state.phrases.get(current_vid.name)) and any(info):
+                self._overlay = VideoOverlay(*info, self.frame, self.font_path)
+        if self._overlay: self._overlay.draw()
 
     def _draw_interactions(self, current_vid: Path) -> None:
         inter = self.state.get_interaction(current_vid.name)
-        ix, ly, r = self.app_x + self.app_w - 25 * self.scale_factor, self.app_y + self.video_area_height / 2, 18 * self.scale_factor
-        for y, tex, val in [(ly, self.like_tex if inter.is_liked else self.unlike_tex, inter.likes), (ly - 65 * self.scale_factor, self.comment_tex, len(inter.comments))]:
-            arcade.draw_circle_filled(ix, y, r, (0, 0, 0, 150))
-            if tex: arcade.draw_texture_rect(tex, make_centered_rect(ix, y, r * 1.2, r * 1.2))
+        frame = self.frame
+        r, font_size = frame.metrics["badge.radius"], frame.fonts["count"]
+        for name, tex, val in [("like", self.like_tex if inter.is_liked else self.unlike_tex, inter.likes), ("comment", self.comment_tex, len(inter.comments))]:
+            badge, count = frame[f"{name}.badge"], frame[f"{name}.count"]
+            arcade.draw_circle_filled(badge.left, badge.bottom, r, (0, 0, 0, 150))
+            if tex: arcade.draw_texture_rect(tex, frame[f"{name}.icon"])
             arcade.draw_text(
-                str(val), ix, y - r - 5 * self.scale_factor, arcade.color.WHITE, 
-                font_size=int(12 * self.scale_factor), font_name=self.font_path, 
+                str(val), count.left, count.bottom, arcade.color.WHITE,
+                font_size=font_size, font_name=self.font_path,
                 anchor_x="center", anchor_y="top"
             )
\ No newline at end of file
@@ -1,8 +1,41 @@
 from __future__ import annotations
+import math
 import arcade
 from pathlib import Path
-from src.states.zasora import ZasoraState
-from src.shared.utils import make_rect
+from src.states.zasora import CommentList, ZasoraState
+from src.ui.layout import FULL, Layout, Length, Slot
+
+COMMENT_ROW_HEIGHT = 55
+COMMENT_SCROLL_STEP = 40
+
+COMMENT_LAYOUT = Layout(
+    [
+        Slot("list", 0, 50, FULL, Length(-110, 1.0)),
+        Slot("empty", Length(0, 0.5), Length(-80, 1.0), 0, 0),
+        Slot("header", 0, Length(-40, 1.0), FULL, 40),
+        Slot("header.title", Length(0, 0.5), Length(-15, 1.0), 0, 0),
+        Slot("close", Length(-40, 1.0), Length(-40, 1.0), 40, 40),
+        Slot("close.icon", Length(-26, 1.0), Length(-26, 1.0), 12, 12),
+        Slot("input_bar", 0, 0, FULL, 50),
+        Slot("input", 10, 10, Length(-20, 1.0), 30),
+        Slot("input.text", 20, 25, 0, 0),
+    ],
+    metrics={
+        "row.height": COMMENT_ROW_HEIGHT, "scroll.step": COMMENT_SCROLL_STEP,
+        "avatar.x": 20, "avatar.y": -10, "avatar.radius": 12, "avatar.text_y": 4,
+        "row.text_x": 40, "row.text_y": -18,
+    },
+    fonts={"avatar": 10, "author": 12, "text": 13, "title": 14, "input": 12},
+)
+
+class CommentRow:
+    __slots__ = ("index", "avatar", "author", "text")
+
+    def __init__(self, font_path: str, fonts: dict[str, int]) -> None:
+        self.index = -1
+        self.avatar = arcade.Text("", 0, 0, arcade.color.WHITE, fonts["avatar"], font_name=font_path, anchor_x="center", anchor_y="center", bold=True)
+        self.author = arcade.Text("", 0, 0, (150, 150, 150, 255), fonts["author"], font_name=font_path, anchor_x="left", anchor_y="top", bold=True)
+        self.text = arcade.Text("", 0, 0, arcade.color.WHITE, fonts["text"], font_name=font_path, anchor_x="left", anchor_y="top")
 
 class CommentPanel:
     def __init__(self, state: ZasoraState, scale_factor: float) -> None:
@@ -11,77 +44,134 @@ class CommentPanel:
         self.font_path = str(Path(__file__).parent.parent.parent.parent.parent / "assets" / "font.ttf")
         self.input_text = ""
         self.is_typing = False
+        self.scroll = 0.0
+        self._is_dragging = False
+        self._rows_key: tuple[str, int] | None = None
+        self._rows: list[CommentRow] = []
+        self._rows_scale = scale_factor
+        self.frame = COMMENT_LAYOUT.solve(0, 0, scale_factor)
+
+    def place(self, rect: arcade.Rect, scale_factor: float) -> None:
+        self.scale_factor = scale_factor
+        self.frame = COMMENT_LAYOUT.solve(rect.width, rect.height, scale_factor, rect.left, rect.bottom)
+
+    def _max_scroll(self, count: int) -> float:
+        return max(0.0, count * self.frame.metrics["row.height"] - self.frame["list"].height)
 
-    def on_mouse_press(self, x: float, y: float, cx: float, cy: float, cw: float, ch: float, current_vid: Path | None) -> str:
-        if cx <= x <= cx + cw and cy <= y <= cy + ch:
-            cs = 30 * self.scale_factor
-            if cx + cw - cs - 10 * self.scale_factor <= x <= cx + cw and cy + ch - cs - 10 * self.scale_factor <= y <= cy + ch:
+    def scroll_by(self, dy: float, current_vid: Path | None) -> None:
+        if current_vid:
+            count = len(self.state.get_interaction(current_vid.name).comments)
+            self.scroll = min(max(self.scroll + dy, 0.0), self._max_scroll(count))
+
+    def on_mouse_press(self, x: float, y: float, current_vid: Path | None) -> str:
+        frame = self.frame
+        if _inside(frame[""], x, y):
+            if _inside(frame["close"], x, y):
                 self.is_typing = False
                 return "close"
-            self.is_typing = (cx + 10 * self.scale_factor <= x <= cx + cw - 10 * self.scale_factor and cy + 10 * self.scale_factor <= y <= cy + 40 * self.scale_factor)
+            self.is_typing = _inside(frame["input"], x, y)
+            self._is_dragging = not self.is_typing and _inside(frame["list"], x, y)
             return "consume"
         self.is_typing = False
         return "outside"
 
+    def on_mouse_release(self) -> None:
+        self._is_dragging = False
+
+    def on_mouse_motion(self, dy: float, current_vid: Path | None) -> bool:
+        if self._is_dragging:
+            self.scroll_by(dy, current_vid)
+        return self._is_dragging
+
+    def on_mouse_scroll(self, scroll_y: float, current_vid: Path | None) -> None:
+        self.scroll_by(-scroll_y * self.frame.metrics["scroll.step"], current_vid)
     def on_key_press(self, symbol: int, modifiers: int, current_vid: Path | None) -> None:
         if self.is_typing and current_vid:
             if symbol == arcade.key.BACKSPACE: self.input_text = self.input_text[:-1]
             elif symbol in (arcade.key.ENTER, arcade.key.NUM_ENTER) and self.input_text.strip():
-                self.state.get_interaction(current_vid.name).comments.insert(0, {"author": "Player", "text": self.input_text.strip()})
-                self.state.save_interactions()
-                self.input_text, self.is_typing = "", False
+                self.state.add_comment(current_vid.name, {"author": "Player", "text": self.input_text.strip()})
+                self.input_text, self.is_typing, self.scroll = "", False, 0.0
 
     def on_text(self, text: str) -> None:
         if self.is_typing and len(self.input_text) < 50 and text.isprintable(): self.input_text += text
 
-    def draw(self, current_vid: Path, cx: float, cy: float, cw: float, ch: float) -> None:
+    def release(self) -> None:
+        self._rows, self._rows_key = [], None
+
+    def _row_pool(self, size: int) -> list[CommentRow]:
+        if self._rows_scale != self.scale_factor:
+            self._rows, self._rows_scale = [], self.scale_factor
+        while len(self._rows) < size:
+            self._rows.append(CommentRow(self.font_path, self.frame.fonts))
+        return self._rows
+
+    def _draw_rows(self, comments: CommentList) -> None:
+        frame, m = self.frame, self.frame.metrics
+        cx, top, bottom = frame[""].left, frame["list"].top, frame["list"].bottom
+        row_h = m["row.height"]
+        first = int(self.scroll // row_h)
+        offset = self.scroll - first * row_h
+        visible = math.ceil((top - bottom) / row_h) + 1
+        pool = self._row_pool(visible)
+        for i, (auth, txt) in enumerate(comments.rows(first, first + visible), first):
+            y_pos = top - (i - first) * row_h + offset
+            if y_pos <= bottom:
+                break
+            row = pool[i % visible]
+            if row.index != i:
+                row.index, row.avatar.text, row.author.text, row.text.text = i, auth[:1].upper(), auth, txt
+            ax, ay = cx + m["avatar.x"], y_pos + m["avatar.y"]
+            arcade.draw_circle_filled(ax, ay, m["avatar.radius"], arcade.color.GRAY)
+            row.avatar.position = ax, ay + m["avatar.text_y"]
+            row.author.position = cx + m["row.text_x"], y_pos
+            row.text.position = cx + m["row.text_x"], y_pos + m["row.text_y"]
+            row.avatar.draw()
+            row.author.draw()
+            row.text.draw()
+
+    def draw(self, current_vid: Path) -> None:
+        frame = self.frame
         inter = self.state.get_interaction(current_vid.name)
-        arcade.draw_rect_filled(make_rect(cx, cy, cw, ch), (25, 25, 25, 255))
-        arcade.draw_text(
-            f"{len(inter.comments)} комментариев", cx + cw/2, cy + ch - 15 * self.scale_factor, 
-            arcade.color.WHITE, font_size=int(14 * self.scale_factor), 
-            font_name=self.font_path, anchor_x="center", anchor_y="top", bold=True
-        )
-        
-        close_x, close_y, cs = cx + cw - 20 * self.scale_factor, cy + ch - 20 * self.scale_factor, 6 * self.scale_factor
-        arcade.draw_line(close_x - cs, close_y - cs, close_x + cs, close_y + cs, arcade.color.GRAY, 2)
-        arcade.draw_line(close_x - cs, close_y + cs, close_x + cs, close_y - cs, arcade.color.GRAY, 2)
-        arcade.draw_line(cx, cy + ch - 40 * self.scale_factor, cx + cw, cy + ch - 40 * self.scale_factor, (50, 50, 50, 255), 1)
-        
-        y_pos = cy + ch - 60 * self.scale_factor
+        if (key := (current_vid.name, len(inter.comments))) != self._rows_key:
+            if not self._rows_key or self._rows_key[0] != key[0]: self.scroll = 0.0
+            self._rows_key = key
+            for row in self._rows: row.index = -1
+        arcade.draw_rect_filled(frame[""], (25, 25, 25, 255))
+
         if not inter.comments:
+            empty = frame["empty"]
             arcade.draw_text(
-                "Нет комментариев", cx + cw/2, y_pos - 20 * self.scale_factor, 
-                arcade.color.GRAY, font_size=int(14 * self.scale_factor), 
+                "Нет комментариев", empty.left, empty.bottom,
+                arcade.color.GRAY, font_size=frame.fonts["title"],
                 font_name=self.font_path, anchor_x="center", anchor_y="top"
             )
         else:
-            for comment in inter.comments[:5]:
-                auth, txt = comment.get("author", "Player"), comment.get("text", "")
-                ax, ay = cx + 20 * self.scale_factor, y_pos - 10 * self.scale_factor
-                arcade.draw_circle_filled(ax, ay, 12 * self.scale_factor, arcade.color.GRAY)
-                arcade.draw_text(
-                    auth[0].upper(), ax, ay + 4 * self.scale_factor, arcade.color.WHITE, 
-                    font_size=int(10 * self.scale_factor), font_name=self.font_path, 
-                    anchor_x="center", anchor_y="center", bold=True
-                )
-                arcade.draw_text(
-                    auth, cx + 40 * self.scale_factor, y_pos, (150, 150, 150, 255), 
-                    font_size=int(12 * self.scale_factor), font_name=self.font_path, 
-                    anchor_x="left", anchor_y="top", bold=True
-                )
-                arcade.draw_text(
-                    txt, cx + 40 * self.scale_factor, y_pos - 18 * self.scale_factor, arcade.color.WHITE, 
-                    font_size=int(13 * self.scale_factor), font_name=self.font_path, 
-                    anchor_x="left", anchor_y="top"
-                )
-                y_pos -= 55 * self.scale_factor
-
-        arcade.draw_rect_filled(make_rect(cx, cy, cw, 50 * self.scale_factor), (35, 35, 35, 255))
-        arcade.draw_rect_filled(make_rect(cx + 10 * self.scale_factor, cy + 10 * self.scale_factor, cw - 20 * self.scale_factor, 30 * self.scale_factor), (60, 60, 60, 255) if self.is_typing else (50, 50, 50, 255))
+            self._draw_rows(inter.comments)
+
+        # header and input bar are drawn over the list so scrolled rows are clipped by them
+        header, title = frame["header"], frame["header.title"]
+        arcade.draw_rect_filled(header, (25, 25, 25, 255))
+        arcade.draw_text(
+            f"{len(inter.comments)} комментариев", title.left, title.bottom,
+            arcade.color.WHITE, font_size=frame.fonts["title"],
+            font_name=self.font_path, anchor_x="center", anchor_y="top", bold=True
+        )
+
+        close = frame["close.icon"]
+        arcade.draw_line(close.left, close.bottom, close.right, close.top, arcade.color.GRAY, 2)
+        arcade.draw_line(close.left, close.top, close.right, close.bottom, arcade.color.GRAY, 2)
+        arcade.draw_line(header.left, header.bottom, header.right, header.bottom, (50, 50, 50, 255), 1)
+
+        arcade.draw_rect_filled(frame["input_bar"], (35, 35, 35, 255))
+        arcade.draw_rect_filled(frame["input"], (60, 60, 60, 255) if self.is_typing else (50, 50, 50, 255))
         disp, col = (self.input_text + ("|" if self.is_typing else ""), arcade.color.WHITE) if self.input_text or self.is_typing else ("Добавить комментарий...", arcade.color.GRAY)
+        anchor = frame["input.text"]
         arcade.draw_text(
-            disp, cx + 20 * self.scale_factor, cy + 25 * self.scale_factor, col, 
-            font_size=int(12 * self.scale_factor), font_name=self.font_path, 
+            disp, anchor.left, anchor.bottom, col,
+            font_size=frame.fonts["input"], font_name=self.font_path,
             anchor_x="left", anchor_y="center"
-        )
\ No newline at end of file
+        )
+
+
+def _inside(rect: arcade.Rect, x: float, y: float) -> bool:
+    return rect.left <= x <= rect.right and rect.bottom <= y <= rect.top
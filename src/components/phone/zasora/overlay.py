@@ -0,0 +1,37 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import arcade
+from src.shared.utils import make_rect
+from src.ui.text import wrap_text_lines
+
+if TYPE_CHECKING:
+    from src.ui.layout import SolvedLayout
+
+AUTHOR_LINE_HEIGHT = 1.5
+TEXT_LINE_HEIGHT = 1.3
+
+class VideoOverlay:
+    """Author/description caption of one video, laid out once when the video becomes current.
+
+    The box grows up from the ``caption`` slot to fit the wrapped text.
+    """
+
+    def __init__(self, author: str, describe: str, frame: SolvedLayout, font_path: str) -> None:
+        box, pad = frame["caption"], frame.metrics["caption.padding"]
+        afs, dfs = frame.fonts["caption.author"], frame.fonts["caption.text"]
+        lines = wrap_text_lines(describe, box.width - pad * 2, dfs)
+        h = pad * 2 + (afs * AUTHOR_LINE_HEIGHT if author else 0) + max(len(lines), 1) * dfs * TEXT_LINE_HEIGHT
+        self.rect = make_rect(box.left, box.bottom, box.width, h)
+        tx, cy = box.left + pad, box.bottom + h - pad
+        self.texts: list[arcade.Text] = []
+        if author:
+            self.texts.append(arcade.Text(f"@{author}", tx, cy, arcade.color.WHITE, afs, font_name=font_path, anchor_x="left", anchor_y="top", bold=True))
+            cy -= afs * AUTHOR_LINE_HEIGHT
+        for line in lines:
+            self.texts.append(arcade.Text(line, tx, cy, arcade.color.WHITE, dfs, font_name=font_path, anchor_x="left", anchor_y="top"))
+            cy -= dfs * TEXT_LINE_HEIGHT
+
+    def draw(self) -> None:
+        arcade.draw_rect_filled(self.rect, (0, 0, 0, 150))
+        for text in self.texts:
+            text.draw()
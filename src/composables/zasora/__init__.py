@@ -1,4 +1,6 @@
-from .dataLoader import load_interactions, save_interactions
-from .videoLoader import load_videos
+from .dataLoader import InteractionJournal, apply_interaction, load_interactions, save_interactions
+from .feedSampler import FeedSampler, FenwickTree
+from .phrasesLoader import PhraseTable, compile_phrases
+from .videoLoader import VideoCatalog, load_videos
 
-__all__ = ["load_interactions", "save_interactions", "load_videos"]
\ No newline at end of file
+__all__ = ["InteractionJournal", "apply_interaction", "load_interactions", "save_interactions", "load_videos", "VideoCatalog", "FeedSampler", "FenwickTree", "PhraseTable", "compile_phrases"]
\ No newline at end of file
@@ -1,52 +1,186 @@
 import base64
+import binascii
 import json
+import os
+import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import orjson
 
 from src.shared.constants import DATA_DIR
 
 if TYPE_CHECKING:
-    from src.states.zasora import VideoInteractionState
+    from src.states.zasora import CommentArena, VideoInteractionState
+
+JOURNAL_COMPACT_BYTES = 64 * 1024
 
-def _get_file_path() -> Path:
+def _get_file_path(name: bytes = b"zasora_data") -> Path:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    filename = base64.b64encode(b"zasora_data").decode("utf-8")
+    filename = base64.b64encode(name).decode("utf-8")
     return DATA_DIR / filename
 
-def load_interactions() -> dict[str, "VideoInteractionState"]:
+def _encode_line(record: dict[str, Any]) -> bytes:
+    return base64.b64encode(orjson.dumps(record)) + b"\n"
+
+def apply_interaction(interactions: dict[str, "VideoInteractionState"], record: dict[str, Any], arena: "CommentArena") -> None:
     from src.states.zasora import VideoInteractionState
-    file_path = _get_file_path()
-    interactions = {}
-    if file_path.exists():
+    video = record["video"]
+    if (inter := interactions.get(video)) is None:
+        inter = interactions[sys.intern(video)] = VideoInteractionState()
+    op = record["op"]
+    if op == "like" and not inter.is_liked:
+        inter.is_liked = True
+        inter.likes += 1
+    elif op == "unlike" and inter.is_liked:
+        inter.is_liked = False
+        inter.likes -= 1
+    elif op == "comment":
+        comment = record["comment"]
+        inter.add_comment(comment.get("author", "Player"), comment.get("text", ""), arena)
+
+def _apply_record(entries: dict[str, dict[str, Any]], record: dict[str, Any]) -> None:
+    """``apply_interaction`` on snapshot-shaped dicts whose comments are still oldest first."""
+    entry = entries.setdefault(record["video"], {"likes": 0, "is_liked": False, "comments": []})
+    op = record["op"]
+    if op == "like" and not entry["is_liked"]:
+        entry["is_liked"] = True
+        entry["likes"] += 1
+    elif op == "unlike" and entry["is_liked"]:
+        entry["is_liked"] = False
+        entry["likes"] -= 1
+    elif op == "comment":
+        comment = record["comment"]
+        entry["comments"].append({"author": comment.get("author", "Player"), "text": comment.get("text", "")})
+
+def _to_entries(interactions: dict[str, "VideoInteractionState"]) -> dict[str, dict[str, Any]]:
+    return {
+        k: {"likes": v.likes, "is_liked": v.is_liked, "comments": v.comments.to_list()}
+        for k, v in interactions.items()
+    }
+
+class InteractionJournal:
+    """Snapshot plus append-only log of like/unlike/comment records.
+
+    Every interaction appends one line to the journal; once it grows past ``compact_bytes`` the
+    caller folds it into a fresh snapshot via ``compact``. Journal lines carry the snapshot
+    generation in a header so a crash between the two writes never replays records twice.
+
+    ``write`` is meant for a background writer: compaction re-reads the snapshot and journal
+    files, so it never reads state the main thread is mutating and keeps no copy in between.
+    """
+
+    def __init__(self, compact_bytes: int = JOURNAL_COMPACT_BYTES) -> None:
+        self.snapshot_path = _get_file_path()
+        self.journal_path = _get_file_path(b"zasora_journal")
+        self.compact_bytes = compact_bytes
+        self.generation = 0
+
+    def _load_snapshot(self) -> dict[str, dict[str, Any]]:
+        if not self.snapshot_path.exists():
+            return {}
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            data = json.loads(base64.b64decode(f.read()).decode("utf-8"))
+        if isinstance(data.get("generation"), int) and isinstance(data.get("interactions"), dict):
+            self.generation = data["generation"]
+            return data["interactions"]
+        return data
+
+    def _replay(self, entries: dict[str, dict[str, Any]]) -> None:
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, "rb") as f:
+            lines = f.read().splitlines()
+        for i, line in enumerate(lines):
+            try:
+                record = orjson.loads(base64.b64decode(line))
+                if i == 0:
+                    if record.get("generation") != self.generation:
+                        return  # already folded into the snapshot
+                    continue
+                _apply_record(entries, record)
+            except (binascii.Error, orjson.JSONDecodeError, KeyError, AttributeError, TypeError):
+                continue  # torn line from an interrupted append
+
+    def _read_entries(self) -> dict[str, dict[str, Any]]:
+        """Snapshot plus replayed journal as snapshot-shaped dicts (comments newest first)."""
+        entries = {}
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                encoded_data = f.read()
-                decoded_data = base64.b64decode(encoded_data).decode("utf-8")
-                data = json.loads(decoded_data)
-                for k, v in data.items():
-                    interactions[k] = VideoInteractionState(
-                        likes=v.get("likes", 0),
-                        is_liked=v.get("is_liked", False),
-                        comments=v.get("comments", [])
-                    )
+            for k, v in self._load_snapshot().items():
+                entries[k] = {
+                    "likes": v.get("likes", 0),
+                    "is_liked": v.get("is_liked", False),
+                    "comments": v.get("comments", [])[::-1],
+                }
         except Exception:
             pass
-    return interactions
+        try:
+            self._replay(entries)
+        except Exception:
+            pass
+        for entry in entries.values():
+            entry["comments"].reverse()
+        return entries
 
-def save_interactions(interactions: dict[str, "VideoInteractionState"]) -> None:
-    file_path = _get_file_path()
-    data = {
-        k: {
-            "likes": v.likes,
-            "is_liked": v.is_liked,
-            "comments": v.comments
+    def load(self, arena: "CommentArena") -> dict[str, "VideoInteractionState"]:
+        from src.states.zasora import CommentList, VideoInteractionState
+        entries = self._read_entries()
+        return {
+            sys.intern(k): VideoInteractionState(
+                likes=v["likes"], is_liked=v["is_liked"], comments=CommentList(arena, v["comments"])
+            )
+            for k, v in entries.items()
         }
-        for k, v in interactions.items()
-    }
-    try:
-        json_str = json.dumps(data, ensure_ascii=False)
-        encoded_data = base64.b64encode(json_str.encode("utf-8")).decode("utf-8")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(encoded_data)
-    except Exception:
-        pass
\ No newline at end of file
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """Append a batch and compact when due.
+
+        A ``{"op": "compact"}`` record forces compaction.
+        """
+        batch = [r for r in records if r["op"] != "compact"]
+        if self.append(*batch) or len(batch) < len(records):
+            self.compact(self._read_entries())
+
+    def append(self, *records: dict[str, Any]) -> bool:
+        """Append records; returns True once the journal is due for compaction."""
+        if not records:
+            return False
+        try:
+            with open(self.journal_path, "a+b") as f:
+                end = f.seek(0, os.SEEK_END)
+                if end == 0:
+                    f.write(_encode_line({"generation": self.generation}))
+                else:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")  # terminate a torn line left by an interrupted append
+                f.write(b"".join(_encode_line(record) for record in records))
+                return f.tell() >= self.compact_bytes
+        except OSError:
+            return False
+
+    def compact(self, data: dict[str, dict[str, Any]]) -> None:
+        generation = self.generation + 1
+        try:
+            json_str = json.dumps({"generation": generation, "interactions": data}, ensure_ascii=False)
+            encoded_data = base64.b64encode(json_str.encode("utf-8")).decode("utf-8")
+            _replace_file(self.snapshot_path, encoded_data.encode("utf-8"))
+            self.generation = generation
+            _replace_file(self.journal_path, _encode_line({"generation": generation}))
+        except Exception:
+            pass
+
+def _replace_file(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def load_interactions() -> dict[str, "VideoInteractionState"]:
+    from src.states.zasora import CommentArena
+    return InteractionJournal().load(CommentArena())
+
+def save_interactions(interactions: dict[str, "VideoInteractionState"]) -> None:
+    journal = InteractionJournal()
+    journal._read_entries()
+    journal.compact(_to_entries(interactions))
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.composables.zasora.videoLoader import VideoCatalog
+    from src.states.zasora import VideoInteractionState
+
+FEED_BASE_WEIGHT = 1.0
+FEED_LIKE_WEIGHT = 0.5
+FEED_COMMENT_WEIGHT = 0.75
+FEED_WATCH_WEIGHT = 0.5
+FEED_LIKED_BONUS = 1.0
+FEED_NO_REPEAT_WINDOW = 50
+
+
+class FenwickTree:
+    """Prefix sums over float weights with O(log n) point updates and weighted search."""
+
+    def __init__(self, weights: list[float]) -> None:
+        self.size = len(weights)
+        self._tree = array("d", [0.0])
+        self._tree.extend(weights)
+        for i in range(1, self.size + 1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self._tree[parent] += self._tree[i]
+
+    @property
+    def total(self) -> float:
+        # summed from the tree itself so ``find`` never sees a drifted running total
+        total, i = 0.0, self.size
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def add(self, index: int, delta: float) -> None:
+        i = index + 1
+        while i <= self.size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def find(self, target: float) -> int:
+        """Index whose cumulative range contains ``target`` (0 <= target < total)."""
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self._tree[nxt] <= target:
+                pos = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return min(pos, self.size - 1)
+
+
+class FeedSampler:
+    """Infinite feed over a ``VideoCatalog`` sampled by engagement weight.
+
+    Each video's weight grows with its likes, comments and watch time; the last
+    ``FEED_NO_REPEAT_WINDOW`` picks (at most half the catalog) are held at zero weight so they
+    do not come back right away. Positions already shown are kept, so scrolling back returns the same videos.
+    """
+
+    def __init__(
+        self,
+        catalog: VideoCatalog,
+        interactions: dict[str, VideoInteractionState],
+        seed: int,
+        window: int = FEED_NO_REPEAT_WINDOW,
+    ) -> None:
+        self.catalog = catalog
+        self.interactions = interactions
+        self.window = window
+        self._rng = random.Random(seed)
+        self._tree: FenwickTree | None = None
+        self._weights = array("d")
+        self._recent: deque[int] = deque()
+        self._held: set[int] = set()
+        self._history = array("I")
+        self._watch: dict[int, float] = {}
+
+    def _score(self, index: int) -> float:
+        weight = FEED_BASE_WEIGHT + FEED_WATCH_WEIGHT * math.log1p(self._watch.get(index, 0.0))
+        if inter := self.interactions.get(self.catalog.name(index)):
+            weight += FEED_LIKE_WEIGHT * math.log1p(max(inter.likes, 0))
+            weight += FEED_COMMENT_WEIGHT * math.log1p(len(inter.comments))
+            weight += FEED_LIKED_BONUS if inter.is_liked else 0.0
+        return weight
+
+    def _build(self) -> FenwickTree:
+        if self._tree is None:
+            self._weights = array("d", [FEED_BASE_WEIGHT]) * len(self.catalog)
+            for name in self.interactions:
+                if (index := self.catalog.index_of(name)) is not None:
+                    self._weights[index] = self._score(index)
+            self._tree = FenwickTree(list(self._weights))
+            # cap at half the catalog so weights still decide the order in small libraries
+            self.window = min(self.window, len(self._weights) // 2)
+        return self._tree
+
+    def _sample(self) -> int:
+        tree = self._build()
+        index = tree.find(self._rng.random() * tree.total)
+        self._hold(index)
+        return index
+
+    def _hold(self, index: int) -> None:
+        if self.window <= 0 or index in self._held:
+            return
+        self._tree.add(index, -self._weights[index])
+        self._recent.append(index)
+        self._held.add(index)
+        if len(self._recent) > self.window:
+            released = self._recent.popleft()
+            self._held.discard(released)
+            self._tree.add(released, self._weights[released])
+
+    def restore(self, indices: list[int]) -> None:
+        """Replace the shown positions, e.g. from a save, and hold the most recent ones."""
+        self._build()
+        self._history = array("I", indices)
+        for index in indices[-self.window:] if self.window > 0 else ():
+            self._hold(index)
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    def index_at(self, position: int) -> int | None:
+        if position < 0 or not self.catalog:
+            return None
+        while len(self._history) <= position:
+            self._history.append(self._sample())
+        return self._history[position]
+
+    def get(self, position: int) -> Path | None:
+        index = self.index_at(position)
+        return None if index is None else self.catalog.path(index)
+
+    def refresh(self, name: str) -> None:
+        """Recompute one video's weight after an interaction, O(log n)."""
+        if self._tree is None or (index := self.catalog.index_of(name)) is None:
+            return
+        self._set_weight(index, self._score(index))
+
+    def add_watch_time(self, index: int, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        self._watch[index] = self._watch.get(index, 0.0) + seconds
+        if self._tree is not None:
+            self._set_weight(index, self._score(index))
+
+    def watch_times(self) -> dict[str, float]:
+        """Accumulated watch seconds by video name, for saving."""
+        return {self.catalog.name(index): seconds for index, seconds in self._watch.items()}
+
+    def restore_watch_times(self, times: dict[str, float]) -> None:
+        for name, seconds in times.items():
+            if (index := self.catalog.index_of(name)) is not None:
+                self.add_watch_time(index, seconds)
+
+    def _set_weight(self, index: int, weight: float) -> None:
+        delta = weight - self._weights[index]
+        self._weights[index] = weight
+        if index not in self._held:
+            self._tree.add(index, delta)
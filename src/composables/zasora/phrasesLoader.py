@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+
+PHRASES_PATH = Path(__file__).parent.parent.parent.parent / "assets" / "stories" / "phrases.json"
+PHRASES_MAGIC = b"ZPHR"
+PHRASES_VERSION = 1
+
+_HEADER = struct.Struct("<4sHI")
+_ENTRY = struct.Struct("<IHIHIH")
+
+
+def compiled_path(source: Path) -> Path:
+    return source.with_suffix(".bin")
+
+
+def compile_phrases(phrases: dict[str, dict[str, str]]) -> bytes:
+    """Pack phrases into a table sorted by UTF-8 key with offsets into one string pool."""
+    pool = bytearray()
+    offsets: dict[bytes, int] = {}
+
+    def intern(text: str) -> tuple[int, int]:
+        data = text.encode("utf-8")
+        if data not in offsets:
+            offsets[data] = len(pool)
+            pool.extend(data)
+        return offsets[data], len(data)
+
+    entries = []
+    for key in sorted(phrases, key=lambda k: k.encode("utf-8")):
+        info = phrases[key]
+        entries.append(_ENTRY.pack(
+            *intern(key), *intern(info.get("author", "")), *intern(info.get("describe", ""))
+        ))
+    return _HEADER.pack(PHRASES_MAGIC, PHRASES_VERSION, len(entries)) + b"".join(entries) + bytes(pool)
+
+
+class PhraseTable:
+    """Read-only view over compiled phrases; ``get`` binary-searches the key index.
+
+    Uses ``phrases.bin`` from ``tools/story_compile.py`` when it is newer than the JSON, and
+    compiles the JSON in memory otherwise.
+    """
+
+    def __init__(self, data: bytes = b"") -> None:
+        self._data = data
+        self._count = 0
+        if data:
+            magic, version, self._count = _HEADER.unpack_from(data)
+            if magic != PHRASES_MAGIC or version != PHRASES_VERSION:
+                raise ValueError("Unsupported phrases table")
+        self._pool = _HEADER.size + _ENTRY.size * self._count
+
+    @classmethod
+    def load(cls, source: Path = PHRASES_PATH) -> PhraseTable:
+        binary = compiled_path(source)
+        try:
+            if binary.exists() and (not source.exists() or binary.stat().st_mtime >= source.stat().st_mtime):
+                return cls(binary.read_bytes())
+            if source.exists():
+                with open(source, "r", encoding="utf-8") as f:
+                    return cls(compile_phrases(json.load(f)))
+        except (OSError, ValueError, struct.error):
+            pass
+        return cls()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, offset: int, length: int) -> bytes:
+        start = self._pool + offset
+        return self._data[start:start + length]
+
+    def get(self, name: str) -> tuple[str, str] | None:
+        """``(author, describe)`` for a video file name."""
+        key = name.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = _ENTRY.unpack_from(self._data, _HEADER.size + mid * _ENTRY.size)
+            probe = self._string(entry[0], entry[1])
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return self._string(*entry[2:4]).decode("utf-8"), self._string(*entry[4:6]).decode("utf-8")
+        return None
@@ -1,14 +1,52 @@
-from pathlib import Path
+import os
 import random
+from bisect import bisect_left
+from pathlib import Path
+
+VIDEO_DIR = Path(__file__).parent.parent.parent.parent / "assets" / "video" / "zasora"
+VIDEO_EXTENSIONS = (".webm", ".mp4")
+
+
+class VideoCatalog:
+    """Video library; ``seed`` drives the ``FeedSampler`` order over it.
+
+    The directory is listed on first access as plain sorted names and paths are built per
+    lookup, so opening a large library costs one ``scandir``. ``name``/``path``/``index_of``
+    address videos by their position in the sorted listing.
+    """
+
+    def __init__(self, video_dir: Path = VIDEO_DIR, seed: int | None = None) -> None:
+        self.video_dir = video_dir
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self._names: list[str] | None = None
+
+    def _scan(self) -> list[str]:
+        if self._names is None:
+            names = []
+            if self.video_dir.exists():
+                with os.scandir(self.video_dir) as entries:
+                    names = [e.name for e in entries if e.name.endswith(VIDEO_EXTENSIONS) and e.is_file()]
+            names.sort()
+            self._names = names
+        return self._names
+
+    def __len__(self) -> int:
+        return len(self._scan())
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def name(self, index: int) -> str:
+        return self._scan()[index]
+
+    def path(self, index: int) -> Path:
+        return self.video_dir / self._scan()[index]
+
+    def index_of(self, name: str) -> int | None:
+        names = self._scan()
+        i = bisect_left(names, name)
+        return i if i < len(names) and names[i] == name else None
 
 
-def load_videos() -> tuple[list[Path], list[int]]:
-    video_dir = Path(__file__).parent.parent.parent.parent / "assets" / "video" / "zasora"
-    video_files = []
-    shuffled_order = []
-    if video_dir.exists():
-        video_files = list(video_dir.glob("*.webm")) + list(video_dir.glob("*.mp4"))
-        indices = list(range(len(video_files)))
-        random.shuffle(indices)
-        shuffled_order = indices
-    return video_files, shuffled_order
\ No newline at end of file
+def load_videos(seed: int | None = None) -> VideoCatalog:
+    return VideoCatalog(VIDEO_DIR, seed)
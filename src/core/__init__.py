@@ -1,3 +1,66 @@
-from src.core.asset_manager import AssetManager
+"""Core services. Names are imported on first access so that importing one core module
+(e.g. the startup trace) does not pull arcade, story runtime and telemetry in with it."""
+from __future__ import annotations
 
-__all__ = ["AssetManager"]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.core.asset_manager import AssetManager
+    from src.core.background_writer import BackgroundWriter
+    from src.core.calc_engine import CalcError, CalcTape, CompiledExpression, compile_expression, evaluate_many
+    from src.core.font_cache import warm_up_glyphs
+    from src.core.frame_scheduler import FrameScheduler
+    from src.core.ink import CompiledStory, StoryError, compile_ink
+    from src.core.input_record import InputRecorder, InputReplay, read_recording
+    from src.core.pixelate import VideoPixelation, video_pixelation
+    from src.core.profiler import FrameProfiler, profiled, profiler
+    from src.core.render_target import RENDER_QUALITY_SCALES, ScreenRenderTarget
+    from src.core.save_game import SaveGame, save_game
+    from src.core.startup_trace import StartupTrace, startup_trace
+    from src.core.story import Story
+    from src.core.telemetry import Telemetry, telemetry
+    from src.core.update_scheduler import TimerHandle, UpdateScheduler
+
+_EXPORTS = {
+    "AssetManager": "src.core.asset_manager",
+    "BackgroundWriter": "src.core.background_writer",
+    "CalcError": "src.core.calc_engine",
+    "CalcTape": "src.core.calc_engine",
+    "CompiledExpression": "src.core.calc_engine",
+    "CompiledStory": "src.core.ink",
+    "FrameScheduler": "src.core.frame_scheduler",
+    "FrameProfiler": "src.core.profiler",
+    "InputRecorder": "src.core.input_record",
+    "InputReplay": "src.core.input_record",
+    "RENDER_QUALITY_SCALES": "src.core.render_target",
+    "SaveGame": "src.core.save_game",
+    "ScreenRenderTarget": "src.core.render_target",
+    "StartupTrace": "src.core.startup_trace",
+    "Story": "src.core.story",
+    "StoryError": "src.core.ink",
+    "Telemetry": "src.core.telemetry",
+    "TimerHandle": "src.core.update_scheduler",
+    "UpdateScheduler": "src.core.update_scheduler",
+    "VideoPixelation": "src.core.pixelate",
+    "compile_expression": "src.core.calc_engine",
+    "compile_ink": "src.core.ink",
+    "evaluate_many": "src.core.calc_engine",
+    "profiled": "src.core.profiler",
+    "profiler": "src.core.profiler",
+    "read_recording": "src.core.input_record",
+    "save_game": "src.core.save_game",
+    "startup_trace": "src.core.startup_trace",
+    "telemetry": "src.core.telemetry",
+    "video_pixelation": "src.core.pixelate",
+    "warm_up_glyphs": "src.core.font_cache",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _EXPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(module), name)
+    return value
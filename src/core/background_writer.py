@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+WRITE_DELAY = 0.25
+
+
+class BackgroundWriter(Generic[T]):
+    """Coalesces submitted items and hands them to ``write`` in batches on a worker thread.
+
+    The first item after an idle period opens a ``delay`` window; everything submitted inside it
+    is written as one batch. ``close`` drains what is pending and also runs at interpreter exit.
+    """
+
+    def __init__(self, write: Callable[[list[T]], None], delay: float = WRITE_DELAY, name: str = "background-writer") -> None:
+        self._write = write
+        self.delay = delay
+        self._pending: list[T] = []
+        self._cond = threading.Condition()
+        self._busy = False
+        self._flush_requested = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, item: T) -> None:
+        with self._cond:
+            if not self._closed:
+                self._pending.append(item)
+                self._cond.notify_all()
+                return
+        self._write([item])
+
+    def flush(self) -> None:
+        """Block until everything submitted so far has been written."""
+        with self._cond:
+            if self._closed:
+                return
+            self._flush_requested = True
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: not self._pending and not self._busy)
+            self._flush_requested = False
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                self._cond.wait_for(lambda: self._closed or self._flush_requested, timeout=self.delay)
+                batch, self._pending = self._pending, []
+                self._busy = True
+            try:
+                self._write(batch)
+            except Exception:
+                pass
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import re
+from array import array
+from collections import OrderedDict, deque
+from fractions import Fraction
+from typing import Iterable, Iterator
+
+CALC_DISPLAY_DECIMALS = 8
+CALC_TAPE_SIZE = 100
+COMPILE_CACHE_SIZE = 64
+
+OP_PUSH, OP_ADD, OP_SUB, OP_MUL, OP_DIV, OP_NEG, OP_PERCENT = range(7)
+
+_BINARY = {"+": (1, OP_ADD), "-": (1, OP_SUB), "*": (2, OP_MUL), "/": (2, OP_DIV)}
+_ALIASES = {"×": "*", "÷": "/", "−": "-"}
+_TOKEN = re.compile(r"\s*(?:(\d+\.?\d*|\.\d+)|(\S))")
+
+
+class CalcError(Exception):
+    pass
+
+
+def tokenize(text: str) -> list[str | Fraction]:
+    """Numbers become exact ``Fraction`` values, everything else one-character operator tokens."""
+    tokens: list[str | Fraction] = []
+    pos, end = 0, len(text.rstrip())
+    while pos < end:
+        match = _TOKEN.match(text, pos)
+        number, char = match.groups()
+        if number is not None:
+            tokens.append(Fraction(number))
+        elif (char := _ALIASES.get(char, char)) in "+-*/%()":
+            tokens.append(char)
+        else:
+            raise CalcError(f"Unexpected {char!r} at {match.start(2)}")
+        pos = match.end()
+    return tokens
+
+
+class CompiledExpression:
+    """Expression flattened to postfix ``ops`` with constant indices in ``args``.
+
+    Parsing and precedence are paid once in ``compile_expression``; ``evaluate`` is a flat
+    stack loop over exact ``Fraction`` values.
+    """
+
+    __slots__ = ("ops", "args", "constants")
+
+    def __init__(self, ops: bytes, args: array, constants: list[Fraction]) -> None:
+        self.ops = ops
+        self.args = args
+        self.constants = constants
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def evaluate(self) -> Fraction:
+        stack: list[Fraction] = []
+        push, pop, constants = stack.append, stack.pop, self.constants
+        for op, arg in zip(self.ops, self.args):
+            if op == OP_PUSH:
+                push(constants[arg])
+            elif op == OP_NEG:
+                stack[-1] = -stack[-1]
+            elif op == OP_PERCENT:
+                stack[-1] /= 100
+            else:
+                right = pop()
+                if op == OP_ADD:
+                    stack[-1] += right
+                elif op == OP_SUB:
+                    stack[-1] -= right
+                elif op == OP_MUL:
+                    stack[-1] *= right
+                elif not right:
+                    raise CalcError("Division by zero")
+                else:
+                    stack[-1] /= right
+        return stack[0]
+
+
+class _Parser:
+    """Recursive descent: ``expr := term (+|- term)*``, ``term := unary (*|/ unary)*``,
+    ``unary := (+|-)* primary %*``, ``primary := number | ( expr )``."""
+
+    def __init__(self, tokens: list[str | Fraction]) -> None:
+        self.tokens = tokens
+        self.pos = 0
+        self.ops = bytearray()
+        self.args = array("I")
+        self.constants: list[Fraction] = []
+
+    def emit(self, op: int, arg: int = 0) -> None:
+        self.ops.append(op)
+        self.args.append(arg)
+
+    def peek(self) -> str | Fraction | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def expression(self, min_precedence: int = 1) -> None:
+        self.unary()
+        while (token := self.peek()) in _BINARY and _BINARY[token][0] >= min_precedence:
+            precedence, op = _BINARY[token]
+            self.pos += 1
+            self.expression(precedence + 1)
+            self.emit(op)
+
+    def unary(self) -> None:
+        negate = False
+        while (token := self.peek()) in ("+", "-"):
+            negate ^= token == "-"
+            self.pos += 1
+        token = self.peek()
+        if isinstance(token, Fraction):
+            self.pos += 1
+            self.emit(OP_PUSH, len(self.constants))
+            self.constants.append(token)
+        elif token == "(":
+            self.pos += 1
+            self.expression()
+            if self.peek() != ")":
+                raise CalcError("Missing ')'")
+            self.pos += 1
+        else:
+            raise CalcError("Expected a number" if token is None else f"Unexpected {token!r}")
+        while self.peek() == "%":
+            self.pos += 1
+            self.emit(OP_PERCENT)
+        if negate:
+            self.emit(OP_NEG)
+
+
+_cache: OrderedDict[str, CompiledExpression] = OrderedDict()
+
+
+def compile_expression(text: str) -> CompiledExpression:
+    """Parse ``text`` with the usual precedence (unary minus and postfix % bind tightest); results are LRU-cached."""
+    if (compiled := _cache.get(text)) is not None:
+        _cache.move_to_end(text)
+        return compiled
+    parser = _Parser(tokenize(text))
+    parser.expression()
+    if parser.pos != len(parser.tokens):
+        raise CalcError(f"Unexpected {parser.tokens[parser.pos]!r}")
+    compiled = _cache[text] = CompiledExpression(bytes(parser.ops), parser.args, parser.constants)
+    if len(_cache) > COMPILE_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return compiled
+
+
+def evaluate(text: str) -> Fraction:
+    return compile_expression(text).evaluate()
+
+
+def evaluate_many(texts: Iterable[str]) -> list[Fraction | CalcError]:
+    """Batch form of ``evaluate``: one result per text, with the ``CalcError`` in place of a failed one."""
+    results: list[Fraction | CalcError] = []
+    for text in texts:
+        try:
+            results.append(compile_expression(text).evaluate())
+        except CalcError as error:
+            results.append(error)
+    return results
+
+
+def format_number(value: Fraction, decimals: int = CALC_DISPLAY_DECIMALS) -> str:
+    """Round half-even to ``decimals`` places in exact integer arithmetic and drop trailing zeros."""
+    if value.denominator == 1:
+        return str(value.numerator)
+    scaled = round(value * 10 ** decimals)
+    whole, fraction = divmod(abs(scaled), 10 ** decimals)
+    digits = str(fraction).rjust(decimals, "0").rstrip("0")
+    if not whole and not digits:
+        return "0"
+    sign = "-" if scaled < 0 else ""
+    return f"{sign}{whole}.{digits}" if digits else f"{sign}{whole}"
+
+
+class CalcTape:
+    """Last ``CALC_TAPE_SIZE`` (expression, result) pairs, oldest first; appending is O(1)."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, entries: Iterable[Iterable[str]] = (), size: int = CALC_TAPE_SIZE) -> None:
+        self._entries: deque[tuple[str, str]] = deque((tuple(entry) for entry in entries), maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(self._entries)
+
+    def append(self, expression: str, result: str) -> None:
+        self._entries.append((expression, result))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def to_list(self) -> list[list[str]]:
+        return [list(entry) for entry in self._entries]
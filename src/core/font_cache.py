@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import hashlib
+import platform
+from pathlib import Path
+from typing import Any
+
+import arcade
+import orjson
+import pyglet
+from PIL import Image
+
+from src.shared.constants import DATA_DIR
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+FONT_MANIFEST_PATH = PROJECT_ROOT / "assets" / "font_manifest.json"
+GLYPH_CACHE_DIR = DATA_DIR / "glyph_cache"
+GLYPH_CACHE_VERSION = 1
+
+# pyglet only holds the last few loaded fonts strongly; keep warmed ones alive
+_warmed_fonts: dict[tuple[str, int, bool], pyglet.font.base.Font] = {}
+
+
+def load_font_manifest(path: Path = FONT_MANIFEST_PATH) -> dict | None:
+    if not path.exists():
+        return None
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _resolve_font(font_path: str, size: int, bold: bool) -> pyglet.font.base.Font:
+    # go through arcade.Text so the font descriptor matches the one draw_text will request
+    label = arcade.Text("", 0, 0, font_size=size, font_name=font_path, bold=bold).label
+    return pyglet.font.load(label.font_name, size, weight=label.weight, dpi=label.dpi or 96)
+
+
+def _cache_key(font_digest: str, charset: str, size: int, bold: bool) -> str:
+    digest = hashlib.sha1()
+    parts = (font_digest, charset, str(size), str(bold), pyglet.version, platform.system())
+    for part in (*parts, str(GLYPH_CACHE_VERSION)):
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _flip_tex_coords(t: tuple[float, ...]) -> tuple[float, ...]:
+    return t[9:12] + t[6:9] + t[3:6] + t[:3]
+
+
+def _save_glyphs(font: pyglet.font.base.Font, cache_dir: Path, key: str) -> None:
+    owners: list[Any] = []
+    glyphs = []
+    for glyph_key, glyph in font.glyphs.items():
+        if glyph.owner not in owners:
+            owners.append(glyph.owner)
+        natural = glyph.owner.get_region(glyph.x, glyph.y, glyph.width, glyph.height).tex_coords
+        glyphs.append([
+            "s" if isinstance(glyph_key, str) else "i", glyph_key, owners.index(glyph.owner),
+            glyph.x, glyph.y, glyph.width, glyph.height,
+            glyph.baseline, glyph.lsb, glyph.advance, tuple(glyph.tex_coords) != tuple(natural),
+        ])
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for i, owner in enumerate(owners):
+        data = owner.get_image_data()
+        pixels = data.get_data("RGBA", -data.width * 4)
+        Image.frombytes("RGBA", (data.width, data.height), pixels).save(cache_dir / f"{key}_{i}.png")
+    with open(cache_dir / f"{key}.json", "wb") as f:
+        f.write(orjson.dumps({"atlases": len(owners), "glyphs": glyphs}))
+
+
+def _restore_glyphs(font: pyglet.font.base.Font, cache_dir: Path, key: str) -> bool:
+    index_path = cache_dir / f"{key}.json"
+    if not index_path.exists():
+        return False
+    try:
+        with open(index_path, "rb") as f:
+            index = orjson.loads(f.read())
+        atlases = []
+        for i in range(index["atlases"]):
+            with Image.open(cache_dir / f"{key}_{i}.png") as img:
+                rgba = img.convert("RGBA")
+                pitch = -rgba.width * 4
+                atlases.append(pyglet.image.ImageData(rgba.width, rgba.height, "RGBA", rgba.tobytes(), pitch))
+        for kind, glyph_key, atlas, x, y, w, h, baseline, lsb, advance, flipped in index["glyphs"]:
+            glyph_key = glyph_key if kind == "s" else int(glyph_key)
+            if glyph_key in font.glyphs:
+                continue
+            glyph = font.create_glyph(atlases[atlas].get_region(x, y, w, h))
+            glyph.set_bearings(baseline, lsb, advance)
+            if flipped:
+                glyph.tex_coords = _flip_tex_coords(glyph.tex_coords)
+            font.glyphs[glyph_key] = glyph
+    except (OSError, ValueError, KeyError, orjson.JSONDecodeError):
+        return False
+    return True
+
+
+def warm_up_glyphs(
+    scale: float, manifest: dict | None = None, cache_dir: Path | None = GLYPH_CACHE_DIR
+) -> int:
+    """Rasterize the manifest's charset at every UI point size for ``scale`` before first use.
+
+    Glyph atlases are restored from ``cache_dir`` when a matching snapshot exists and saved
+    there otherwise. Returns the number of fonts warmed.
+    """
+    manifest = manifest if manifest is not None else load_font_manifest()
+    if not manifest:
+        return 0
+    font_path = manifest["font"]
+    font_file = PROJECT_ROOT / font_path
+    font_digest = hashlib.sha1(font_file.read_bytes()).hexdigest() if font_file.exists() else ""
+    charset = manifest["charset"]
+    seen: set[tuple[int, bool]] = set()
+    for entry in manifest["sizes"]:
+        size, bold = int(entry["size"] * scale), bool(entry["bold"])
+        if size <= 0 or (size, bold) in seen:
+            continue
+        seen.add((size, bold))
+        if (font_path, size, bold) in _warmed_fonts:
+            continue
+        font = _warmed_fonts[(font_path, size, bold)] = _resolve_font(font_path, size, bold)
+        key = _cache_key(font_digest, charset, size, bold)
+        restored = cache_dir is not None and _restore_glyphs(font, cache_dir, key)
+        font.get_glyphs(charset)
+        if cache_dir is not None and not restored:
+            try:
+                _save_glyphs(font, cache_dir, key)
+            except OSError:
+                pass
+    return len(seen)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from arcade.clock import GLOBAL_FIXED_CLOCK
+
+if TYPE_CHECKING:
+    import arcade
+
+RENDER_MODES = ("vsync", "uncapped", "capped")
+UNCAPPED_RATE = 1 / 1000
+SIMULATION_STEP = 1 / 60
+MAX_SIMULATION_STEPS = 5
+RENDER_RATE = 1 / 60
+IDLE_RENDER_RATE = 1 / 10
+IDLE_TIMEOUT = 2.0
+
+
+class FrameScheduler:
+    """Drives render/update rates of an arcade window running a fixed simulation step.
+
+    The window dispatches ``on_fixed_update`` at ``SIMULATION_STEP`` from its own accumulator;
+    this class picks how often frames are presented and drops to ``IDLE_RENDER_RATE`` when
+    nothing on screen moves for ``IDLE_TIMEOUT`` seconds.
+    """
+
+    def __init__(
+        self,
+        window: arcade.Window,
+        mode: str = "vsync",
+        render_rate: float = RENDER_RATE,
+        idle_rate: float = IDLE_RENDER_RATE,
+        idle_timeout: float = IDLE_TIMEOUT,
+    ) -> None:
+        self.window = window
+        self.render_rate = render_rate
+        self.idle_rate = idle_rate
+        self.idle_timeout = idle_timeout
+        self.is_idle = False
+        self._quiet_time = 0.0
+        self._rate = RENDER_RATE
+        self.set_mode(mode)
+
+    @property
+    def alpha(self) -> float:
+        return min(max(GLOBAL_FIXED_CLOCK.fraction, 0.0), 1.0)
+
+    def _active_rate(self) -> float:
+        return self.render_rate if self.mode == "capped" else UNCAPPED_RATE
+
+    def _apply_rate(self, rate: float) -> None:
+        # arcade asserts update_rate <= draw_rate, so order the two calls by direction
+        if rate < self._rate:
+            self.window.set_update_rate(rate)
+            self.window.set_draw_rate(rate)
+        else:
+            self.window.set_draw_rate(rate)
+            self.window.set_update_rate(rate)
+        self._rate = rate
+
+    def set_mode(self, mode: str) -> None:
+        if mode not in RENDER_MODES:
+            raise ValueError(f"Unknown render mode: {mode}")
+        self.mode = mode
+        self.window.set_vsync(mode == "vsync")
+        self.is_idle = False
+        self._quiet_time = 0.0
+        self._apply_rate(self._active_rate())
+
+    def wake(self) -> None:
+        self._quiet_time = 0.0
+        if self.is_idle:
+            self.is_idle = False
+            self._apply_rate(self._active_rate())
+
+    def tick(self, delta_time: float, can_idle: bool) -> None:
+        if not can_idle:
+            self.wake()
+            return
+        self._quiet_time += delta_time
+        if not self.is_idle and self._quiet_time >= self.idle_timeout:
+            self.is_idle = True
+            self._apply_rate(self.idle_rate)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import arcade
+
+from src.components.phone import Phone
+from src.core.asset_manager import AssetManager
+from src.core.frame_scheduler import MAX_SIMULATION_STEPS, RENDER_RATE, SIMULATION_STEP, FrameScheduler
+from src.core.input_record import (
+    INPUT_KEY, INPUT_MOTION, INPUT_PRESS, INPUT_RELEASE, INPUT_RESIZE, INPUT_SCROLL, INPUT_TEXT,
+    InputRecorder, InputReplay,
+)
+from src.core.pixelate import video_pixelation
+from src.core.profiler import GRAPH_HEIGHT, profiler
+from src.core.startup_trace import startup_trace
+from src.core.telemetry import telemetry
+from src.shared.constants import DATA_DIR, RENDER_MODE, SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
+from src.shared.utils import summarize
+
+ASSETS_ROOT = Path(__file__).resolve().parents[2] / "assets"
+
+
+class GameWindow(arcade.Window):
+    """Main window: forwards input to the phone and steps the simulation at ``SIMULATION_STEP``.
+
+    With a ``recorder`` every forwarded event is stored against the simulation step it arrived
+    in. With a ``replay`` live input is ignored and the recorded events are fed at the same
+    steps; ``fast`` runs one step per frame with no frame cap instead of following the clock.
+    Video playback still runs on the wall clock, so clip endings may land on other steps.
+    """
+
+    def __init__(self, recorder: InputRecorder | None = None, replay: InputReplay | None = None, fast: bool = False) -> None:
+        with startup_trace.phase("window"):
+            super().__init__(
+                SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, resizable=True,
+                update_rate=RENDER_RATE, draw_rate=RENDER_RATE,
+                fixed_rate=SIMULATION_STEP, fixed_frame_cap=MAX_SIMULATION_STEPS,
+            )
+        arcade.set_background_color(arcade.color.BLACK)
+
+        with startup_trace.phase("atlases"):
+            self.asset_manager = AssetManager(ASSETS_ROOT)
+            self.asset_manager.load_all_atlases(ASSETS_ROOT / "images")
+
+        with startup_trace.phase("phone"):
+            self.phone = Phone(self.asset_manager)
+        self.recorder = recorder
+        self.replay = replay
+        self.fast = fast and replay is not None
+        self.step_index = 0
+        self.scheduler = FrameScheduler(self, "uncapped" if self.fast else RENDER_MODE)
+        self._frame_times: list[float] = []
+        self._last_frame = 0.0
+        self._replay_start = perf_counter()
+        if replay:
+            self.phone.resize(*replay.size)
+
+    def on_resize(self, width: int, height: int) -> None:
+        super().on_resize(width, height)
+        if self.replay:
+            return
+        if self.recorder:
+            self.recorder.record(self.step_index, INPUT_RESIZE, width, height)
+        self.phone.resize(width, height)
+        self.scheduler.wake()
+
+    def on_close(self) -> None:
+        self.phone.close()
+        telemetry.close()
+        if self.recorder:
+            self.recorder.close(self.step_index)
+            self.recorder = None
+        super().on_close()
+
+    def on_draw(self) -> None:
+        profiler.next_frame()
+        self.clear()
+        self.phone.draw(1.0 if self.fast else self.scheduler.alpha)
+        profiler.draw_overlay(10, self.height - 10 - GRAPH_HEIGHT)
+        if startup_trace.enabled:
+            startup_trace.first_frame()
+        if self.replay:
+            now = perf_counter()
+            if self._last_frame:
+                self._frame_times.append((now - self._last_frame) * 1000.0)
+            self._last_frame = now
+
+    def on_mouse_press(self, x: float, y: float, button: int, modifiers: int) -> None:
+        if self.replay:
+            return
+        if self.recorder:
+            self.recorder.record(self.step_index, INPUT_PRESS, x, y, button, modifiers)
+        self._mouse_press(x, y, button, modifiers)
+
+    def on_mouse_release(self, x: float, y: float, button: int, modifiers: int) -> None:
+        if self.replay:
+            return
+        if self.recorder:
+            self.recorder.record(self.step_index, INPUT_RELEASE, x, y, button, modifiers)
+        self._mouse_release(x, y, button, modifiers)
+
+    def on_mouse_motion(self, x: float, y: float, dx: float, dy: float) -> None:
+        if self.replay:
+            return
+        if self.recorder:
+            self.recorder.record(self.step_index, INPUT_MOTION, x, y, dx, dy)
+        self._mouse_motion(x, y, dx, dy)
+
+    def on_mouse_scroll(self, x: int, y: int, scroll_x: float, scroll_y: float) -> None:
+        if self.replay:
+            return
+        if self.recorder:
+            self.recorder.record(self.step_index, INPUT_SCROLL, x, y, scroll_x, scroll_y)
+        self._mouse_scroll(x, y, scroll_x, scroll_y)
+
+    def on_key_press(self, symbol: int, modifiers: int) -> None:
+        if self.replay:
+            return
+        if self.recorder:
+            self.recorder.record(self.step_index, INPUT_KEY, symbol, modifiers)
+        if symbol == arcade.key.F11:
+            self.set_fullscreen(not self.fullscreen)
+        self._key_press(symbol, modifiers)
+
+    def on_text(self, text: str) -> None:
+        if self.replay:
+            return
+        if self.recorder:
+            self.recorder.record_text(self.step_index, text)
+        self._text(text)
+
+    def _mouse_press(self, x: float, y: float, button: int, modifiers: int) -> None:
+        self.scheduler.wake()
+        self.phone.on_mouse_press(x, y, button, modifiers)
+
+    def _mouse_release(self, x: float, y: float, button: int, modifiers: int) -> None:
+        self.scheduler.wake()
+        self.phone.on_mouse_release(x, y, button, modifiers)
+
+    def _mouse_motion(self, x: float, y: float, dx: float, dy: float) -> None:
+        self.scheduler.wake()
+        self.phone.on_mouse_motion(x, y, dx, dy)
+
+    def _mouse_scroll(self, x: float, y: float, scroll_x: float, scroll_y: float) -> None:
+        self.scheduler.wake()
+        self.phone.on_mouse_scroll(x, y, scroll_x, scroll_y)
+
+    def _key_press(self, symbol: int, modifiers: int) -> None:
+        self.scheduler.wake()
+        if symbol == arcade.key.F3:
+            profiler.toggle()
+        elif symbol == arcade.key.F4 and profiler.enabled:
+            DATA_DIR.mkdir(parents=True, exist_ok=True)
+            path = DATA_DIR / "profile.json"
+            profiler.dump(str(path))
+            print(f"profile written to {path}", file=sys.stderr)
+        elif symbol == arcade.key.F8:
+            video_pixelation.cycle()
+        elif symbol == arcade.key.F10:
+            self.phone.cycle_render_quality()
+        self.phone.on_key_press(symbol, modifiers)
+
+    def _text(self, text: str) -> None:
+        self.scheduler.wake()
+        self.phone.on_text(text)
+
+    def _feed_replay(self) -> None:
+        for _, _, kind, a, b, c, d in self.replay.events_at(self.step_index):
+            if kind == INPUT_PRESS:
+                self._mouse_press(a, b, int(c), int(d))
+            elif kind == INPUT_RELEASE:
+                self._mouse_release(a, b, int(c), int(d))
+            elif kind == INPUT_MOTION:
+                self._mouse_motion(a, b, c, d)
+            elif kind == INPUT_SCROLL:
+                self._mouse_scroll(a, b, c, d)
+            elif kind == INPUT_KEY:
+                self._key_press(int(a), int(b))
+            elif kind == INPUT_TEXT:
+                self._text(chr(int(a)))
+            elif kind == INPUT_RESIZE:
+                self.phone.resize(int(a), int(b))
+                self.scheduler.wake()
+
+    def _finish_replay(self) -> None:
+        import orjson
+        replay = self.replay
+        wall = perf_counter() - self._replay_start
+        report = {
+            "mode": "fast" if self.fast else "realtime",
+            "steps": self.step_index,
+            "events": len(replay.events),
+            "recorded_seconds": replay.duration,
+            "replay_seconds": wall,
+            "frames": len(self._frame_times),
+            "fps": len(self._frame_times) / wall if wall else 0.0,
+            "frame_ms": summarize(self._frame_times),
+        }
+        sys.stdout.write(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode() + "\n")
+        self.close()
+
+    def _step(self, delta_time: float) -> None:
+        if self.replay:
+            self._feed_replay()
+        self.phone.update(delta_time)
+        self.step_index += 1
+        if self.replay and self.replay.finished and self.step_index == self.replay.end_step + 1:
+            self._finish_replay()
+
+    def on_fixed_update(self, delta_time: float) -> None:
+        if not self.fast:
+            self._step(delta_time)
+
+    def on_update(self, delta_time: float) -> None:
+        if self.fast:
+            self._step(SIMULATION_STEP)
+        self.scheduler.tick(delta_time, self.phone.is_idle and not self.fast)
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+STORY_MAGIC = b"ZINK"
+STORY_VERSION = 1
+INK_VERSIONS = range(19, 22)
+
+_HEADER = struct.Struct("<4sHII")
+
+FLAG_VISITS = 0x1
+FLAG_TURNS = 0x2
+
+CHOICE_HAS_CONDITION = 0x1
+CHOICE_HAS_START = 0x2
+CHOICE_HAS_CHOICE_ONLY = 0x4
+CHOICE_INVISIBLE_DEFAULT = 0x8
+CHOICE_ONCE_ONLY = 0x10
+CHOICE_FLAG_BITS = 5
+
+(
+    OP_NOP, OP_TEXT, OP_NEWLINE, OP_GLUE, OP_EV_START, OP_EV_END, OP_OUT, OP_POP, OP_DUP,
+    OP_STR_START, OP_STR_END, OP_PUSH, OP_VOID, OP_NATIVE, OP_DIVERT, OP_DIVERT_COND, OP_DIVERT_VAR,
+    OP_CALL, OP_CALL_VAR, OP_TUNNEL, OP_TUNNEL_VAR, OP_RETURN, OP_TUNNEL_RETURN, OP_TARGET, OP_GET,
+    OP_SET_GLOBAL, OP_SET_TEMP, OP_ASSIGN, OP_READ_COUNT, OP_ENTER, OP_VISIT, OP_SEQ, OP_CHOICE,
+    OP_CHOICE_COUNT, OP_TURN, OP_TURNS_SINCE, OP_READC, OP_RANDOM, OP_SEED_RANDOM, OP_TAG,
+    OP_TAG_START, OP_TAG_END, OP_DONE, OP_END, OP_FLOW_END,
+) = range(45)
+
+NATIVE_NAMES = (
+    "+", "-", "*", "/", "%", "_", "==", "!=", ">", "<", ">=", "<=", "!", "&&", "||",
+    "MIN", "MAX", "POW", "FLOOR", "CEILING", "INT", "FLOAT", "?", "!?",
+)
+_NATIVE_IDS = {name: i for i, name in enumerate(NATIVE_NAMES)}
+
+_COMMANDS = {
+    "\n": OP_NEWLINE, "<>": OP_GLUE, "ev": OP_EV_START, "/ev": OP_EV_END, "out": OP_OUT,
+    "pop": OP_POP, "du": OP_DUP, "str": OP_STR_START, "/str": OP_STR_END, "nop": OP_NOP,
+    "void": OP_VOID, "~ret": OP_RETURN, "->->": OP_TUNNEL_RETURN, "choiceCnt": OP_CHOICE_COUNT,
+    "turn": OP_TURN, "turns": OP_TURNS_SINCE, "readc": OP_READC, "rnd": OP_RANDOM,
+    "srnd": OP_SEED_RANDOM, "#": OP_TAG_START, "/#": OP_TAG_END, "done": OP_DONE, "end": OP_END,
+}
+_CONTAINER_COMMANDS = {"visit": OP_VISIT, "seq": OP_SEQ}
+
+
+class StoryError(Exception):
+    pass
+
+
+class _Container:
+    __slots__ = ("id", "path", "parent", "content", "named", "named_only", "flags", "address", "element_addresses", "end_address")
+
+    def __init__(self, path: str, parent: _Container | None) -> None:
+        self.id = -1
+        self.path = path
+        self.parent = parent
+        self.content: list[Any] = []
+        self.named: dict[str, _Container] = {}
+        self.named_only: list[_Container] = []
+        self.flags = 0
+        self.address = 0
+        self.element_addresses: list[int] = []
+        self.end_address = 0
+
+
+class CompiledStory:
+    """Ink story flattened into parallel ``ops``/``args`` arrays.
+
+    Containers are laid out depth-first, so indexed sub-containers simply fall through into
+    the next element of their parent; named-only ones (knots, stitches, choice targets) are
+    appended after the main flow and end in ``OP_FLOW_END``. Every divert is resolved to an
+    address at compile time, text and variable names live in an interned constant pool.
+    """
+
+    __slots__ = ("ops", "args", "constants", "paths", "container_addresses", "container_flags", "container_ids", "counted", "globals_address", "checksum")
+
+    def __init__(self, ops: bytes, args: array, constants: list[Any], paths: list[str], addresses: array, flags: array, globals_address: int) -> None:
+        self.ops = ops
+        self.args = args
+        self.constants = [sys.intern(c) if isinstance(c, str) else c for c in constants]
+        self.paths = paths
+        self.container_addresses = addresses
+        self.container_flags = flags
+        self.container_ids = {path: i for i, path in enumerate(paths)}
+        self.counted: dict[int, int] = {}
+        for i, (address, flag) in enumerate(zip(addresses, flags)):
+            if flag & (FLAG_VISITS | FLAG_TURNS):
+                self.counted.setdefault(address, i)
+        self.globals_address = globals_address
+        self.checksum = zlib.crc32(ops + args.tobytes())
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def to_bytes(self) -> bytes:
+        meta = orjson.dumps({
+            "constants": self.constants,
+            "paths": self.paths,
+            "addresses": list(self.container_addresses),
+            "flags": list(self.container_flags),
+            "globals": self.globals_address,
+        })
+        return _HEADER.pack(STORY_MAGIC, STORY_VERSION, len(self.ops), len(meta)) + self.ops + self.args.tobytes() + meta
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CompiledStory:
+        magic, version, count, meta_len = _HEADER.unpack_from(data)
+        if magic != STORY_MAGIC or version != STORY_VERSION:
+            raise StoryError("Unsupported compiled story")
+        start = _HEADER.size
+        ops = data[start:start + count]
+        args = array("i")
+        args.frombytes(data[start + count:start + count * 5])
+        meta = orjson.loads(data[start + count * 5:start + count * 5 + meta_len])
+        return cls(ops, args, meta["constants"], meta["paths"], array("i", meta["addresses"]), array("B", meta["flags"]), meta["globals"])
+
+
+class _Compiler:
+    def __init__(self) -> None:
+        self.ops = bytearray()
+        self.args = array("i")
+        self.constants: list[Any] = []
+        self._constant_ids: dict[tuple[type, Any], int] = {}
+        self.containers: list[_Container] = []
+        self._fixups: list[tuple[int, _Container, str, bool]] = []
+
+    def constant(self, value: Any) -> int:
+        key = (type(value), value)
+        if key not in self._constant_ids:
+            self._constant_ids[key] = len(self.constants)
+            self.constants.append(value)
+        return self._constant_ids[key]
+
+    def emit(self, op: int, arg: int = 0) -> None:
+        self.ops.append(op)
+        self.args.append(arg)
+
+    def emit_path(self, op: int, container: _Container, path: str, flags: int = 0, as_container: bool = False) -> None:
+        self._fixups.append((len(self.ops), container, path, as_container))
+        self.emit(op, flags)
+
+    def parse(self, raw: list[Any], path: str, parent: _Container | None) -> _Container:
+        if not isinstance(raw, list) or not raw:
+            raise StoryError(f"Malformed container at {path or 'root'}")
+        node = _Container(path, parent)
+        node.id = len(self.containers)
+        self.containers.append(node)
+        *items, terminator = raw
+        prefix = f"{path}." if path else ""
+        for i, item in enumerate(items):
+            if isinstance(item, list):
+                name = item[-1].get("#n") if isinstance(item[-1], dict) else None
+                child = self.parse(item, prefix + (name or str(i)), node)
+                if name:
+                    node.named[name] = child
+                item = child
+            node.content.append(item)
+        for key, value in (terminator or {}).items():
+            if key == "#f":
+                node.flags = value
+            elif key != "#n":
+                child = self.parse(value, prefix + key, node)
+                node.named[key] = child
+                node.named_only.append(child)
+        return node
+
+    def resolve(self, container: _Container, path: str) -> tuple[_Container, int | None]:
+        parts = path.split(".")
+        if parts[0] == "":
+            node, parts = container, parts[2:] if parts[1:2] == ["^"] else parts[1:]
+        else:
+            node = self.containers[0]
+        index: int | None = None
+        for part in parts:
+            if index is not None:
+                raise StoryError(f"Path {path!r} goes through content")
+            if part == "^":
+                node = node.parent or node
+            elif part.isdigit():
+                i = int(part)
+                target = node.content[i] if i < len(node.content) else None
+                if isinstance(target, _Container):
+                    node = target
+                else:
+                    index = i
+            elif part in node.named:
+                node = node.named[part]
+            else:
+                raise StoryError(f"Unresolved path {path!r} from {container.path or 'root'}")
+        return node, index
+
+    def layout(self, node: _Container, deferred: list[_Container]) -> None:
+        node.address = len(self.ops)
+        if node.flags & (FLAG_VISITS | FLAG_TURNS):
+            self.emit(OP_ENTER, node.id)
+        for item in node.content:
+            node.element_addresses.append(len(self.ops))
+            if isinstance(item, _Container):
+                self.layout(item, deferred)
+            else:
+                self.emit_item(node, item)
+        node.end_address = len(self.ops)
+        deferred.extend(node.named_only)
+
+    def emit_item(self, node: _Container, item: Any) -> None:
+        if isinstance(item, str):
+            if item.startswith("^"):
+                self.emit(OP_TEXT, self.constant(item[1:]))
+            elif item in _COMMANDS:
+                self.emit(_COMMANDS[item])
+            elif item in _CONTAINER_COMMANDS:
+                self.emit(_CONTAINER_COMMANDS[item], node.id)
+            elif item in _NATIVE_IDS:
+                self.emit(OP_NATIVE, _NATIVE_IDS[item])
+            else:
+                raise StoryError(f"Unsupported Ink command {item!r}")
+        elif isinstance(item, (bool, int, float)):
+            self.emit(OP_PUSH, self.constant(item))
+        elif isinstance(item, dict):
+            self.emit_object(node, item)
+        elif item is not None:
+            raise StoryError(f"Unsupported Ink content {item!r}")
+
+    def emit_object(self, node: _Container, item: dict[str, Any]) -> None:
+        is_var = item.get("var", False)
+        for key, direct, by_var in (("->", OP_DIVERT, OP_DIVERT_VAR), ("f()", OP_CALL, OP_CALL_VAR), ("->t->", OP_TUNNEL, OP_TUNNEL_VAR)):
+            if key in item:
+                if is_var:
+                    self.emit(by_var, self.constant(item[key]))
+                else:
+                    self.emit_path(OP_DIVERT_COND if item.get("c") else direct, node, item[key])
+                return
+        if "^->" in item:
+            self.emit_path(OP_TARGET, node, item["^->"])
+        elif "VAR?" in item:
+            self.emit(OP_GET, self.constant(item["VAR?"]))
+        elif "VAR=" in item:
+            self.emit(OP_ASSIGN if item.get("re") else OP_SET_GLOBAL, self.constant(item["VAR="]))
+        elif "temp=" in item:
+            self.emit(OP_SET_TEMP, self.constant(item["temp="]))
+        elif "CNT?" in item:
+            self.emit_path(OP_READ_COUNT, node, item["CNT?"], as_container=True)
+        elif "*" in item:
+            self.emit_path(OP_CHOICE, node, item["*"], flags=item.get("flg", 0))
+        elif "#" in item:
+            self.emit(OP_TAG, self.constant(item["#"]))
+        else:
+            raise StoryError(f"Unsupported Ink object {sorted(item)}")
+
+    def fix(self) -> None:
+        for position, node, path, as_container in self._fixups:
+            target, index = self.resolve(node, path)
+            if as_container:
+                if index is not None:
+                    raise StoryError(f"Path {path!r} is not a container")
+                value = target.id
+            elif index is None:
+                value = target.address
+            else:
+                value = target.element_addresses[index] if index < len(target.element_addresses) else target.end_address
+            if self.ops[position] == OP_CHOICE:
+                value = (value << CHOICE_FLAG_BITS) | self.args[position]
+            self.args[position] = value
+
+
+def compile_ink(data: dict[str, Any]) -> CompiledStory:
+    """Compile inklecate JSON output; threads, lists and external functions are rejected."""
+    if data.get("inkVersion") not in INK_VERSIONS:
+        raise StoryError(f"Unsupported inkVersion {data.get('inkVersion')!r}")
+    compiler = _Compiler()
+    root = compiler.parse(data["root"], "", None)
+    deferred: list[_Container] = []
+    compiler.layout(root, deferred)
+    compiler.emit(OP_FLOW_END)
+    while deferred:
+        node = deferred.pop(0)
+        compiler.layout(node, deferred)
+        compiler.emit(OP_FLOW_END)
+    compiler.fix()
+    globals_node = root.named.get("global decl")
+    return CompiledStory(
+        bytes(compiler.ops), compiler.args, compiler.constants,
+        [c.path for c in compiler.containers],
+        array("i", (c.address for c in compiler.containers)),
+        array("B", (c.flags & 0xFF for c in compiler.containers)),
+        globals_node.address if globals_node else -1,
+    )
+
+
+def compiled_story_path(source: Path) -> Path:
+    return source.with_suffix(".bin")
+
+
+def load_compiled_story(source: Path) -> CompiledStory:
+    """Prefer the ``.bin`` written by ``tools/story_compile.py`` unless the JSON is newer."""
+    binary = compiled_story_path(source)
+    if binary.exists() and (not source.exists() or binary.stat().st_mtime >= source.stat().st_mtime):
+        try:
+            return CompiledStory.from_bytes(binary.read_bytes())
+        except (StoryError, struct.error, orjson.JSONDecodeError, KeyError):
+            pass
+    return compile_ink(orjson.loads(source.read_bytes().lstrip(b"\xef\xbb\xbf")))
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from pathlib import Path
+from time import perf_counter
+
+from src.shared.constants import DATA_DIR
+
+RECORD_MAGIC = b"ZREC"
+RECORD_VERSION = 1
+
+INPUT_END = 0
+INPUT_PRESS = 1
+INPUT_RELEASE = 2
+INPUT_MOTION = 3
+INPUT_SCROLL = 4
+INPUT_KEY = 5
+INPUT_TEXT = 6
+INPUT_RESIZE = 7
+
+_HEADER = struct.Struct("<4sHIHHI")
+_FILE = struct.Struct("<HI")
+_EVENT = struct.Struct("<IfB4d")
+
+InputRecord = tuple[int, float, int, float, float, float, float]
+
+
+def _snapshot(directory: Path) -> dict[str, bytes]:
+    if not directory.is_dir():
+        return {}
+    return {path.name: path.read_bytes() for path in sorted(directory.iterdir()) if path.is_file()}
+
+
+class InputRecorder:
+    """Buffers window input by simulation step and writes it out as one compressed file.
+
+    The top-level files of ``DATA_DIR`` (save, feed journal) are captured when recording
+    starts, so a replay begins from the same state. Text is stored one code point per record.
+    """
+
+    def __init__(self, path: Path, seed: int, width: int, height: int) -> None:
+        self.path = path
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.files = _snapshot(DATA_DIR)
+        self._events = bytearray()
+        self._start = perf_counter()
+
+    def record(self, step: int, kind: int, a: float = 0.0, b: float = 0.0, c: float = 0.0, d: float = 0.0) -> None:
+        self._events += _EVENT.pack(step, perf_counter() - self._start, kind, a, b, c, d)
+
+    def record_text(self, step: int, text: str) -> None:
+        for char in text:
+            self.record(step, INPUT_TEXT, ord(char))
+
+    def close(self, step: int) -> None:
+        self.record(step, INPUT_END)
+        files = b"".join(
+            _FILE.pack(len(name := key.encode("utf-8")), len(data)) + name + data
+            for key, data in self.files.items()
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb") as f:
+            f.write(_HEADER.pack(RECORD_MAGIC, RECORD_VERSION, self.seed, self.width, self.height, len(self.files)))
+            f.write(zlib.compress(files + bytes(self._events), 6))
+
+
+def read_recording(path: Path) -> tuple[int, tuple[int, int], dict[str, bytes], list[InputRecord]]:
+    """Decode a recording into its seed, window size, data files and (step, time, kind, a, b, c, d) events."""
+    with open(path, "rb") as f:
+        magic, version, seed, width, height, file_count = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != RECORD_MAGIC or version != RECORD_VERSION:
+            raise ValueError(f"Not an input recording: {path}")
+        payload = zlib.decompress(f.read())
+    files: dict[str, bytes] = {}
+    offset = 0
+    for _ in range(file_count):
+        name_size, size = _FILE.unpack_from(payload, offset)
+        offset += _FILE.size
+        name = payload[offset:offset + name_size].decode("utf-8")
+        offset += name_size
+        files[name] = payload[offset:offset + size]
+        offset += size
+    events = list(_EVENT.iter_unpack(payload[offset:]))
+    return seed, (width, height), files, events
+
+
+class InputReplay:
+    """Recorded input handed back one simulation step at a time."""
+
+    def __init__(self, path: Path) -> None:
+        self.seed, self.size, self.files, self.events = read_recording(path)
+        self.end_step = self.events[-1][0] if self.events else 0
+        self.duration = self.events[-1][1] if self.events else 0.0
+        self._cursor = 0
+
+    @property
+    def finished(self) -> bool:
+        return self._cursor >= len(self.events)
+
+    def restore_files(self, directory: Path = DATA_DIR) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, data in self.files.items():
+            (directory / name).write_bytes(data)
+
+    def events_at(self, step: int) -> list[InputRecord]:
+        start = end = self._cursor
+        events = self.events
+        while end < len(events) and events[end][0] <= step:
+            end += 1
+        self._cursor = end
+        return events[start:end]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+from typing import Any
+
+import arcade
+import orjson
+from arcade.gl import BufferDescription
+from pyglet import gl
+
+from src.shared.constants import VIDEO_PIXEL_SIZE
+
+VIDEO_PIXEL_SIZES = (1, 2, 3, 4, 6, 8)
+PIXEL_SIZES_PATH = Path(__file__).resolve().parents[2] / "assets" / "video" / "pixel_sizes.json"
+
+_VERTEX_SHADER = """
+#version 330
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 v_uv;
+
+void main() {
+    gl_Position = window.projection * window.view * vec4(in_vert, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+# Same result as ffmpeg's nearest-neighbour downscale/upscale pair in pix.py: each block of
+# pixel_size x pixel_size source texels shows the texel at its centre.
+_FRAGMENT_SHADER = """
+#version 330
+uniform sampler2D frame;
+uniform vec2 texel_count;
+uniform float pixel_size;
+
+in vec2 v_uv;
+out vec4 out_color;
+
+void main() {
+    vec2 block = floor(v_uv * texel_count / pixel_size) * pixel_size;
+    vec2 texel = min(floor(block + pixel_size * 0.5), texel_count - 1.0) + 0.5;
+    out_color = texture(frame, texel / texel_count);
+}
+"""
+
+
+class VideoPixelation:
+    """Optional pixel-art pass for video frames, replacing baked ``pix.py`` encodes for previews.
+
+    ``pixel_size`` is counted in source video pixels; 1 draws the frame untouched. Per-video
+    sizes come from ``assets/video/pixel_sizes.json`` (``{"name.webm": 4}``) when present.
+    """
+
+    def __init__(self, pixel_size: int = VIDEO_PIXEL_SIZE) -> None:
+        self.pixel_size = pixel_size
+        self._overrides: dict[str, int] | None = None
+        self._program: arcade.gl.Program | None = None
+        self._buffer: arcade.gl.Buffer | None = None
+        self._geometry: arcade.gl.Geometry | None = None
+
+    def size_for(self, name: str) -> int:
+        if self._overrides is None:
+            self._overrides = orjson.loads(PIXEL_SIZES_PATH.read_bytes()) if PIXEL_SIZES_PATH.exists() else {}
+        return self._overrides.get(name, self.pixel_size)
+
+    def cycle(self) -> int:
+        sizes = VIDEO_PIXEL_SIZES
+        self.pixel_size = sizes[(sizes.index(self.pixel_size) + 1) % len(sizes)] if self.pixel_size in sizes else sizes[0]
+        return self.pixel_size
+
+    def _build(self) -> None:
+        ctx = arcade.get_window().ctx
+        self._program = ctx.program(vertex_shader=_VERTEX_SHADER, fragment_shader=_FRAGMENT_SHADER)
+        self._program["frame"] = 0
+        self._buffer = ctx.buffer(reserve=16 * 4)
+        self._geometry = ctx.geometry([BufferDescription(self._buffer, "2f 2f", ["in_vert", "in_uv"])], mode=ctx.TRIANGLE_STRIP)
+
+    def draw(self, texture: Any, x: float, y: float, width: float, height: float, pixel_size: int) -> None:
+        if self._program is None:
+            self._build()
+        t = texture.tex_coords
+        self._buffer.write(array("f", (
+            x, y + height, t[9], t[10],
+            x, y, t[0], t[1],
+            x + width, y + height, t[6], t[7],
+            x + width, y, t[3], t[4],
+        )))
+        owner = getattr(texture, "owner", texture)
+        self._program["texel_count"] = (owner.width, owner.height)
+        self._program["pixel_size"] = float(pixel_size)
+        gl.glActiveTexture(gl.GL_TEXTURE0)
+        gl.glBindTexture(texture.target, texture.id)
+        self._geometry.render(self._program)
+
+
+video_pixelation = VideoPixelation()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from collections import deque
+from functools import wraps
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+import arcade
+
+from src.shared.utils import make_rect, save_json, summarize
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+PROFILER_HISTORY = 300
+PROFILER_PERCENTILES = (50, 90, 99)
+GRAPH_WIDTH = 300
+GRAPH_HEIGHT = 80
+GRAPH_MAX_MS = 50.0
+
+_SUBMISSION_HOOKS = {
+    "text": ("draw_text",),
+    "shapes": (
+        "draw_rect_filled",
+        "draw_rect_outline",
+        "draw_circle_filled",
+        "draw_triangle_filled",
+        "draw_line",
+        "draw_texture_rect",
+    ),
+}
+
+
+class FrameProfiler:
+    """Per-section frame timings and GL counters with a rolling history.
+
+    Recording is off until ``enable`` is called; instrumented code then pays a flag check only.
+    """
+
+    def __init__(self, history: int = PROFILER_HISTORY) -> None:
+        self.enabled = False
+        self.history = history
+        self.timings: dict[str, deque[float]] = {}
+        self.counters: dict[str, deque[int]] = {}
+        self._frame_timings: dict[str, float] = {}
+        self._frame_counters: dict[str, int] = {}
+        self._frame_start = 0.0
+        self._recording = True
+        self._patches: list[tuple[Any, str, Any]] = []
+        self._labels: list[arcade.Text] = []
+
+    def reset(self, history: int | None = None) -> None:
+        if history is not None:
+            self.history = history
+        self.timings.clear()
+        self.counters.clear()
+        self._frame_timings.clear()
+        self._frame_counters.clear()
+        self._frame_start = perf_counter()
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self._frame_start = perf_counter()
+        self._install_hooks()
+
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        self.enabled = False
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches.clear()
+
+    def toggle(self) -> bool:
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def add_time(self, name: str, elapsed: float) -> None:
+        if self._recording:
+            self._frame_timings[name] = self._frame_timings.get(name, 0.0) + elapsed
+
+    def count(self, name: str, amount: int = 1) -> None:
+        if self._recording:
+            self._frame_counters[name] = self._frame_counters.get(name, 0) + amount
+
+    def next_frame(self) -> None:
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self._frame_timings["frame"] = now - self._frame_start
+        self._frame_start = now
+        for name, value in self._frame_timings.items():
+            self.timings.setdefault(name, deque(maxlen=self.history)).append(value * 1000.0)
+        for name, samples in self.timings.items():
+            if name not in self._frame_timings:
+                samples.append(0.0)
+        for name in self.counters.keys() | self._frame_counters.keys():
+            samples = self.counters.setdefault(name, deque(maxlen=self.history))
+            samples.append(self._frame_counters.get(name, 0))
+        self._frame_timings.clear()
+        self._frame_counters.clear()
+
+    def percentiles(
+        self, points: tuple[int, ...] = PROFILER_PERCENTILES
+    ) -> dict[str, dict[str, float]]:
+        return {
+            name: summarize(samples, points)
+            for name, samples in (*self.timings.items(), *self.counters.items())
+            if samples
+        }
+
+    def dump(self, path: str) -> dict[str, dict[str, float]]:
+        report = self.percentiles()
+        save_json(path, report)
+        return report
+
+    def draw_overlay(self, x: float, y: float) -> None:
+        if not self.enabled:
+            return
+        self._recording = False
+        try:
+            self._draw_graph(x, y)
+            self._draw_table(x, y - 8)
+        finally:
+            self._recording = True
+
+    def _draw_graph(self, x: float, y: float) -> None:
+        frames = self.timings.get("frame")
+        arcade.draw_rect_filled(make_rect(x, y, GRAPH_WIDTH, GRAPH_HEIGHT), (0, 0, 0, 180))
+        budget_y = y + GRAPH_HEIGHT * min(1000.0 / 60 / GRAPH_MAX_MS, 1.0)
+        arcade.draw_line(x, budget_y, x + GRAPH_WIDTH, budget_y, (80, 160, 80, 255), 1)
+        if not frames or len(frames) < 2:
+            return
+        step = GRAPH_WIDTH / (self.history - 1)
+        points = [
+            (x + i * step, y + GRAPH_HEIGHT * min(ms / GRAPH_MAX_MS, 1.0))
+            for i, ms in enumerate(frames)
+        ]
+        arcade.draw_line_strip(points, arcade.color.WHITE, 1)
+
+    def _draw_table(self, x: float, y: float) -> None:
+        rows = [f"{n:<16}{s[-1]:7.2f} ms" for n, s in sorted(self.timings.items()) if s]
+        rows += [f"{n:<16}{s[-1]:7d}" for n, s in sorted(self.counters.items()) if s]
+        while len(self._labels) < len(rows):
+            self._labels.append(
+                arcade.Text("", x, 0, arcade.color.WHITE, 10, font_name="monospace", anchor_y="top")
+            )
+        for i, label in enumerate(self._labels[:len(rows)]):
+            label.text, label.x, label.y = rows[i], x, y - i * 14
+            label.draw()
+
+    def _install_hooks(self) -> None:
+        for section, names in _SUBMISSION_HOOKS.items():
+            for name in names:
+                self._patch(arcade, name, self._timed(section, getattr(arcade, name)))
+        from arcade.gl.backends.opengl.texture import OpenGLTexture2D
+        from arcade.gl.backends.opengl.vertex_array import OpenGLVertexArray
+        from pyglet.graphics import vertexdomain
+        vao_render = self._counted("draw_calls", OpenGLVertexArray.render)
+        self._patch(OpenGLVertexArray, "render", vao_render)
+        self._patch(OpenGLTexture2D, "use", self._counted("texture_binds", OpenGLTexture2D.use))
+        for cls in (vertexdomain.VertexList, vertexdomain.IndexedVertexList):
+            if "draw" in vars(cls):
+                self._patch(cls, "draw", self._counted("draw_calls", cls.draw))
+        for cls in (vertexdomain.VertexDomain, vertexdomain.IndexedVertexDomain):
+            for name in ("draw", "draw_subset"):
+                if name in vars(cls):
+                    self._patch(cls, name, self._counted("draw_calls", getattr(cls, name)))
+
+    def _patch(self, owner: Any, name: str, replacement: Any) -> None:
+        self._patches.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, replacement)
+
+    def _timed(self, section: str, fn: Callable[P, R]) -> Callable[P, R]:
+        @wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            start = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add_time(section, perf_counter() - start)
+        return wrapper
+
+    def _counted(self, counter: str, fn: Callable[P, R]) -> Callable[P, R]:
+        @wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            self.count(counter)
+            return fn(*args, **kwargs)
+        return wrapper
+
+
+profiler = FrameProfiler()
+
+
+def profiled(section: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    def decorator(fn: Callable[P, R]) -> Callable[P, R]:
+        @wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not profiler.enabled:
+                return fn(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler.add_time(section, perf_counter() - start)
+        return wrapper
+    return decorator
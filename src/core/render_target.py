@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import arcade
+from arcade.gl import geometry
+from arcade.types import LBWH
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+RENDER_QUALITY_SCALES: dict[str, float | None] = {
+    "low": 1.0,
+    "medium": 1.5,
+    "high": 2.0,
+    "native": None,
+}
+
+
+class ScreenRenderTarget:
+    """Offscreen framebuffer for a fixed logical area, scaled onto the window on draw.
+
+    Quality presets pick the internal pixels-per-unit; ``native`` follows the display scale.
+    """
+
+    def __init__(self, logical_width: float, logical_height: float, quality: str = "high") -> None:
+        if quality not in RENDER_QUALITY_SCALES:
+            raise ValueError(f"Unknown render quality: {quality}")
+        self.logical_width = logical_width
+        self.logical_height = logical_height
+        self.quality = quality
+        self.display_scale = 1.0
+        self.scale = self._resolve_scale()
+        self._fbo: arcade.gl.Framebuffer | None = None
+        self._camera: arcade.Camera2D | None = None
+        self._quad: arcade.gl.Geometry | None = None
+        self._dest = (0.0, 0.0, 0.0, 0.0, 1, 1)
+
+    @property
+    def width(self) -> int:
+        return max(1, round(self.logical_width * self.scale))
+
+    @property
+    def height(self) -> int:
+        return max(1, round(self.logical_height * self.scale))
+
+    def _resolve_scale(self) -> float:
+        preset = RENDER_QUALITY_SCALES[self.quality]
+        return self.display_scale if preset is None else preset
+
+    def _update_scale(self) -> bool:
+        scale = self._resolve_scale()
+        if scale == self.scale:
+            return False
+        self.scale = scale
+        self._fbo = self._camera = None
+        return True
+
+    def set_quality(self, quality: str) -> bool:
+        if quality not in RENDER_QUALITY_SCALES:
+            raise ValueError(f"Unknown render quality: {quality}")
+        self.quality = quality
+        return self._update_scale()
+
+    def set_display_scale(self, display_scale: float) -> bool:
+        self.display_scale = display_scale
+        return self._update_scale()
+
+    def place(
+        self, x: float, y: float, width: float, height: float, window_width: int, window_height: int
+    ) -> None:
+        self._dest = (x, y, width, height, window_width, window_height)
+        self._quad = None
+
+    def to_local(self, x: float, y: float) -> tuple[float, float]:
+        k = self.scale / self.display_scale
+        return (x - self._dest[0]) * k, (y - self._dest[1]) * k
+
+    def to_window(self, x: float, y: float) -> tuple[float, float]:
+        k = self.display_scale / self.scale
+        return self._dest[0] + x * k, self._dest[1] + y * k
+
+    def to_local_delta(self, dx: float, dy: float) -> tuple[float, float]:
+        k = self.scale / self.display_scale
+        return dx * k, dy * k
+
+    def _build(self) -> None:
+        ctx = arcade.get_window().ctx
+        texture = ctx.texture((self.width, self.height), components=4)
+        self._fbo = ctx.framebuffer(color_attachments=[texture])
+        self._camera = arcade.Camera2D(
+            viewport=LBWH(0, 0, self.width, self.height), render_target=self._fbo
+        )
+
+    def _build_quad(self) -> None:
+        x, y, w, h, ww, wh = self._dest
+        size = (2 * w / ww, 2 * h / wh)
+        pos = (2 * (x + w / 2) / ww - 1, 2 * (y + h / 2) / wh - 1)
+        self._quad = geometry.quad_2d(size=size, pos=pos)
+
+    @contextmanager
+    def activate(self) -> Generator[ScreenRenderTarget, None, None]:
+        if self._fbo is None:
+            self._build()
+        with self._camera.activate():
+            self._fbo.clear()
+            yield self
+
+    def release(self) -> None:
+        """Delete the framebuffer and its texture now rather than at the next context GC."""
+        if self._fbo is not None:
+            for texture in self._fbo.color_attachments:
+                texture.delete()
+            self._fbo.delete()
+        self._fbo = self._camera = self._quad = None
+
+    def draw(self) -> None:
+        if self._fbo is None:
+            return
+        if self._quad is None:
+            self._build_quad()
+        ctx = self._fbo.ctx
+        self._fbo.color_attachments[0].use(0)
+        self._quad.render(ctx.utility_textured_quad_program)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import struct
+import zlib
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from src.shared.constants import DATA_DIR
+
+SAVE_PATH = DATA_DIR / "save.bin"
+SAVE_MAGIC = b"ZSAV"
+SAVE_VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")
+_ENTRY = struct.Struct("<16sIII")
+
+
+def schema_id(cls: type) -> int:
+    """CRC of the saved field names and annotations; a mismatch leaves the section unread."""
+    types = {f.name: str(f.type) for f in dataclasses.fields(cls)}
+    return zlib.crc32(";".join(f"{name}:{types[name]}" for name in cls.SAVE_FIELDS).encode("utf-8"))
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, Path):
+        return str(value)
+    return value
+
+
+class SaveGame:
+    """Versioned binary save made of named sections, one per state dataclass.
+
+    Only the header and section table are read up front; a section is read and decoded when
+    ``load`` asks for it. State classes list what they persist in ``SAVE_FIELDS`` and may define
+    ``before_save``/``after_load`` hooks.
+    """
+
+    def __init__(self, path: Path = SAVE_PATH) -> None:
+        self.path = path
+        self._table: dict[str, tuple[int, int, int]] | None = None
+        self._pending: dict[str, tuple[int, bytes]] = {}
+
+    def _read_table(self) -> dict[str, tuple[int, int, int]]:
+        if self._table is not None:
+            return self._table
+        self._table = {}
+        try:
+            with open(self.path, "rb") as f:
+                magic, version, count = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != SAVE_MAGIC or version != SAVE_VERSION:
+                    return self._table
+                for _ in range(count):
+                    name, schema, offset, length = _ENTRY.unpack(f.read(_ENTRY.size))
+                    self._table[name.rstrip(b"\0").decode("ascii")] = (schema, offset, length)
+        except (OSError, struct.error, UnicodeDecodeError):
+            self._table = {}
+        return self._table
+
+    def _read_section(self, name: str) -> tuple[int, bytes] | None:
+        if name in self._pending:
+            return self._pending[name]
+        if (entry := self._read_table().get(name)) is None:
+            return None
+        schema, offset, length = entry
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return schema, f.read(length)
+
+    def has(self, name: str) -> bool:
+        return name in self._pending or name in self._read_table()
+
+    def load(self, name: str, state: Any) -> bool:
+        """Restore ``state`` from its section; returns False if missing or of another schema."""
+        try:
+            section = self._read_section(name)
+        except OSError:
+            return False
+        if section is None or section[0] != schema_id(type(state)):
+            return False
+        data = orjson.loads(section[1])
+        defaults = {f.name: f.default for f in dataclasses.fields(state)}
+        for field_name in state.SAVE_FIELDS:
+            if field_name not in data:
+                continue
+            value, default = data[field_name], defaults.get(field_name)
+            if isinstance(default, Enum):
+                value = type(default)[value]
+            elif isinstance(default, Path):
+                value = Path(value)
+            setattr(state, field_name, value)
+        if hook := getattr(state, "after_load", None):
+            hook()
+        return True
+
+    def store(self, name: str, state: Any) -> None:
+        if hook := getattr(state, "before_save", None):
+            hook()
+        data = {field_name: _encode(getattr(state, field_name)) for field_name in state.SAVE_FIELDS}
+        self._pending[name] = (schema_id(type(state)), orjson.dumps(data))
+
+    def commit(self) -> None:
+        """Write pending sections plus untouched ones from the old file, via temp-and-rename."""
+        if not self._pending:
+            return
+        sections: dict[str, tuple[int, bytes]] = {}
+        for name in self._read_table():
+            if name not in self._pending and (section := self._read_section(name)):
+                sections[name] = section
+        sections.update(self._pending)
+
+        offset = _HEADER.size + _ENTRY.size * len(sections)
+        table, blobs = [], []
+        for name, (schema, payload) in sections.items():
+            table.append(_ENTRY.pack(name.encode("ascii"), schema, offset, len(payload)))
+            blobs.append(payload)
+            offset += len(payload)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, len(sections)))
+            f.write(b"".join(table))
+            f.write(b"".join(blobs))
+        os.replace(tmp_path, self.path)
+        self._table = None
+        self._pending.clear()
+
+
+save_game = SaveGame()
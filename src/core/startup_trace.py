@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import builtins
+import importlib.util
+import platform
+import sys
+import time
+from contextlib import nullcontext
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from time import perf_counter
+from typing import Any, ContextManager
+
+STARTUP_TOP_IMPORTS = 25
+
+
+def _package_version() -> str:
+    try:
+        return version("zhosko")
+    except PackageNotFoundError:
+        return "dev"
+
+
+class _Phase:
+    __slots__ = ("trace", "name", "start")
+
+    def __init__(self, trace: StartupTrace, name: str) -> None:
+        self.trace, self.name = trace, name
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.trace.phases.append((self.name, self.start - self.trace.origin, perf_counter() - self.start))
+
+
+class StartupTrace:
+    """Time-to-first-frame breakdown: module imports, named load phases and the first drawn frame.
+
+    While enabled ``builtins.__import__`` is wrapped to time every import that loads new
+    modules, split into self and cumulative time. ``first_frame`` writes a JSON report to
+    ``DATA_DIR/startup`` (or the path given to ``start``) and removes the hook.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.origin = 0.0
+        self.path: Path | None = None
+        self.phases: list[tuple[str, float, float]] = []
+        self.imports: list[tuple[str, float, float]] = []
+        self._import = builtins.__import__
+        self._stack: list[float] = []
+
+    def start(self, path: Path | None = None) -> None:
+        self.enabled = True
+        self.origin = perf_counter()
+        self.path = path
+        builtins.__import__ = self._timed_import
+
+    def phase(self, name: str) -> ContextManager[None]:
+        return _Phase(self, name) if self.enabled else nullcontext()
+
+    def _timed_import(self, name: str, globals: dict | None = None, locals: dict | None = None, fromlist: Any = (), level: int = 0) -> Any:
+        if level:
+            name_abs = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__") or "")
+        else:
+            name_abs = name
+        if name_abs in sys.modules and not fromlist:
+            return self._import(name, globals, locals, fromlist, level)
+        loaded = len(sys.modules)
+        self._stack.append(0.0)
+        start = perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            if len(sys.modules) > loaded:
+                self.imports.append((name_abs, elapsed - children, elapsed))
+
+    def report(self, first_frame: float) -> dict:
+        top = sorted(self.imports, key=lambda item: item[1], reverse=True)[:STARTUP_TOP_IMPORTS]
+        return {
+            "version": _package_version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "first_frame_ms": first_frame * 1000.0,
+            "phases": [{"name": n, "start_ms": s * 1000.0, "ms": d * 1000.0} for n, s, d in self.phases],
+            "imports": {
+                "count": len(self.imports),
+                "ms": sum(item[1] for item in self.imports) * 1000.0,
+                "top": [{"module": m, "self_ms": s * 1000.0, "cumulative_ms": c * 1000.0} for m, s, c in top],
+            },
+        }
+
+    def first_frame(self) -> Path | None:
+        if not self.enabled:
+            return None
+        import orjson
+        report = self.report(perf_counter() - self.origin)
+        self.enabled = False
+        builtins.__import__ = self._import
+        path = self.path
+        if path is None:
+            from src.shared.constants import DATA_DIR
+            path = DATA_DIR / "startup" / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        print(f"first frame after {report['first_frame_ms']:.1f} ms, report: {path}")
+        return path
+
+
+startup_trace = StartupTrace()
@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import copy
+import math
+import random
+from pathlib import Path
+from typing import Any, Callable
+
+from src.core.ink import (
+    CHOICE_FLAG_BITS, CHOICE_HAS_CHOICE_ONLY, CHOICE_HAS_CONDITION, CHOICE_HAS_START,
+    CHOICE_INVISIBLE_DEFAULT, CHOICE_ONCE_ONLY, FLAG_TURNS, FLAG_VISITS, NATIVE_NAMES,
+    OP_ASSIGN, OP_CALL, OP_CALL_VAR, OP_CHOICE, OP_CHOICE_COUNT, OP_DIVERT, OP_DIVERT_COND,
+    OP_DIVERT_VAR, OP_DONE, OP_DUP, OP_END, OP_ENTER, OP_EV_END, OP_EV_START, OP_FLOW_END, OP_GET,
+    OP_GLUE, OP_NATIVE, OP_NEWLINE, OP_OUT, OP_POP, OP_PUSH, OP_RANDOM, OP_READ_COUNT, OP_READC,
+    OP_RETURN, OP_SEED_RANDOM, OP_SEQ, OP_SET_GLOBAL, OP_SET_TEMP, OP_STR_END, OP_STR_START,
+    OP_TAG, OP_TAG_END, OP_TAG_START, OP_TARGET, OP_TEXT, OP_TUNNEL, OP_TUNNEL_RETURN,
+    OP_TUNNEL_VAR, OP_TURN, OP_TURNS_SINCE, OP_VISIT, OP_VOID, CompiledStory, StoryError,
+    load_compiled_story,
+)
+from src.states.story import StoryState
+
+_LINE_START = frozenset((OP_TEXT, OP_OUT, OP_TAG, OP_TAG_START))
+
+
+def format_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else repr(value)
+    return str(value)
+
+
+def _divide(a: Any, b: Any) -> Any:
+    if isinstance(a, int) and isinstance(b, int):
+        if b == 0:
+            raise StoryError("Division by zero")
+        quotient = abs(a) // abs(b)
+        return quotient if (a < 0) == (b < 0) else -quotient
+    return a / b
+
+
+def _modulo(a: Any, b: Any) -> Any:
+    if isinstance(a, int) and isinstance(b, int):
+        if b == 0:
+            raise StoryError("Division by zero")
+        return a - b * _divide(a, b)
+    return math.fmod(a, b)
+
+
+def _add(a: Any, b: Any) -> Any:
+    if isinstance(a, str) or isinstance(b, str):
+        return format_value(a) + format_value(b)
+    return a + b
+
+
+_NATIVE_FUNCTIONS: dict[str, tuple[int, Callable[..., Any]]] = {
+    "+": (2, _add),
+    "-": (2, lambda a, b: a - b),
+    "*": (2, lambda a, b: a * b),
+    "/": (2, _divide),
+    "%": (2, _modulo),
+    "_": (1, lambda a: -a),
+    "==": (2, lambda a, b: a == b),
+    "!=": (2, lambda a, b: a != b),
+    ">": (2, lambda a, b: a > b),
+    "<": (2, lambda a, b: a < b),
+    ">=": (2, lambda a, b: a >= b),
+    "<=": (2, lambda a, b: a <= b),
+    "!": (1, lambda a: not a),
+    "&&": (2, lambda a, b: bool(a) and bool(b)),
+    "||": (2, lambda a, b: bool(a) or bool(b)),
+    "MIN": (2, min),
+    "MAX": (2, max),
+    "POW": (2, lambda a, b: float(a) ** b),
+    "FLOOR": (1, lambda a: float(math.floor(a))),
+    "CEILING": (1, lambda a: float(math.ceil(a))),
+    "INT": (1, lambda a: int(a)),
+    "FLOAT": (1, lambda a: float(a)),
+    "?": (2, lambda a, b: format_value(b) in format_value(a)),
+    "!?": (2, lambda a, b: format_value(b) not in format_value(a)),
+}
+_NATIVES = tuple(_NATIVE_FUNCTIONS[name] for name in NATIVE_NAMES)
+
+
+class Story:
+    """Runs a ``CompiledStory`` one line at a time.
+
+    Stepping is a single loop over the ``ops``/``args`` arrays with no JSON left to walk; all
+    mutable data sits in ``state`` (a ``StoryState``), so ``save_state``/``load_state`` are
+    plain copies. Visit counts are taken when a counted container is entered from its start.
+    """
+
+    def __init__(self, compiled: CompiledStory, seed: int | None = None) -> None:
+        self.compiled = compiled
+        self.state = StoryState()
+        self.tags: list[str] = []
+        self._seq_hashes = [sum(map(ord, path)) for path in compiled.paths]
+        self.reset(seed)
+
+    @classmethod
+    def load(cls, source: Path, seed: int | None = None) -> Story:
+        return cls(load_compiled_story(source), seed)
+
+    def reset(self, seed: int | None = None) -> None:
+        count = len(self.compiled.paths)
+        self.state = StoryState(
+            checksum=self.compiled.checksum,
+            visits=[0] * count,
+            turns=[-1] * count,
+            seed=random.getrandbits(16) if seed is None else seed,
+        )
+        self.tags = []
+        if self.compiled.globals_address >= 0:
+            self.state.pc = self.compiled.globals_address
+            self._run()
+            self.state.pc = 0
+            self.state.stopped = self.state.ended = False
+            self.state.output.clear()
+
+    @property
+    def can_continue(self) -> bool:
+        return not self.state.stopped
+
+    @property
+    def ended(self) -> bool:
+        return self.state.ended
+
+    @property
+    def choices(self) -> list[str]:
+        return [choice[0] for choice in self.state.choices if not choice[2]]
+
+    def continue_story(self) -> str:
+        """Run to the end of the next line and return it; its tags are left in ``tags``."""
+        if self.state.stopped:
+            raise StoryError("Story can't continue")
+        self.tags = []
+        return self._run()
+
+    def continue_maximally(self) -> list[str]:
+        lines = []
+        while self.can_continue:
+            if line := self.continue_story():
+                lines.append(line)
+        return lines
+
+    def choose(self, index: int) -> None:
+        visible = [choice for choice in self.state.choices if not choice[2]]
+        if not 0 <= index < len(visible):
+            raise StoryError(f"Choice {index} out of range")
+        self._take_choice(visible[index])
+
+    def choose_path(self, path: str) -> None:
+        """Jump to a knot or stitch (``"knot.stitch"``), dropping the call stack and choices."""
+        if (container := self.compiled.container_ids.get(path)) is None:
+            raise StoryError(f"Unknown story path {path!r}")
+        st = self.state
+        st.frames[1:] = []
+        st.eval_stack.clear()
+        st.choices.clear()
+        st.output.clear()
+        st.in_eval = st.stopped = st.ended = False
+        st.pc = self.compiled.container_addresses[container]
+
+    def visit_count(self, path: str) -> int:
+        if (container := self.compiled.container_ids.get(path)) is None:
+            raise StoryError(f"Unknown story path {path!r}")
+        return self.state.visits[container]
+
+    def variable(self, name: str) -> Any:
+        return self.state.globals[name]
+
+    def set_variable(self, name: str, value: Any) -> None:
+        if name not in self.state.globals:
+            raise StoryError(f"Unknown story variable {name!r}")
+        self.state.globals[name] = value
+
+    def save_state(self) -> StoryState:
+        return copy.deepcopy(self.state)
+
+    def load_state(self, state: StoryState) -> bool:
+        """Adopt a copy of ``state``; returns False if it belongs to another build of the story."""
+        if state.checksum != self.compiled.checksum or len(state.visits) != len(self.compiled.paths):
+            return False
+        self.state = copy.deepcopy(state)
+        self.tags = []
+        return True
+
+    def _take_choice(self, choice: list[Any]) -> None:
+        st = self.state
+        st.choices.clear()
+        st.turn_index += 1
+        st.pc = choice[1]
+        st.stopped = False
+
+    def _lookup(self, name: str) -> Any:
+        st = self.state
+        if name in st.globals:
+            return st.globals[name]
+        temps = st.frames[-1][3]
+        if name not in temps:
+            raise StoryError(f"Unknown story variable {name!r}")
+        return temps[name]
+
+    def _container_at(self, target: Any) -> int:
+        if not isinstance(target, dict):
+            raise StoryError(f"Expected a divert target, got {target!r}")
+        return self.compiled.counted.get(target["->"], -1)
+
+    def _run(self) -> str:
+        st = self.state
+        compiled = self.compiled
+        ops, args, constants = compiled.ops, compiled.args, compiled.constants
+        output, stack, frames, str_marks = st.output, st.eval_stack, st.frames, st.str_marks
+        pc, in_eval = st.pc, st.in_eval
+        while True:
+            op = ops[pc]
+            if op in _LINE_START and output and output[-1] == "\n" and not str_marks:
+                break
+            arg = args[pc]
+            pc += 1
+            if op == OP_TEXT:
+                if in_eval:
+                    stack.append(constants[arg])
+                else:
+                    output.append(constants[arg])
+                    st.glued = False
+            elif op == OP_NEWLINE:
+                if output and output[-1] != "\n" and not st.glued:
+                    output.append("\n")
+            elif op == OP_PUSH:
+                stack.append(constants[arg])
+            elif op == OP_EV_START:
+                in_eval = True
+            elif op == OP_EV_END:
+                in_eval = False
+            elif op == OP_GET:
+                stack.append(self._lookup(constants[arg]))
+            elif op == OP_NATIVE:
+                arity, function = _NATIVES[arg]
+                if arity == 2:
+                    b = stack.pop()
+                    stack.append(function(stack.pop(), b))
+                else:
+                    stack.append(function(stack.pop()))
+            elif op == OP_OUT:
+                if text := format_value(stack.pop()):
+                    output.append(text)
+                    st.glued = False
+            elif op == OP_DIVERT:
+                pc = arg
+            elif op == OP_DIVERT_COND:
+                if stack.pop():
+                    pc = arg
+            elif op == OP_ENTER:
+                flags = compiled.container_flags[arg]
+                if flags & FLAG_VISITS:
+                    st.visits[arg] += 1
+                if flags & FLAG_TURNS:
+                    st.turns[arg] = st.turn_index
+            elif op == OP_CHOICE:
+                flags, address = arg & ((1 << CHOICE_FLAG_BITS) - 1), arg >> CHOICE_FLAG_BITS
+                show = bool(stack.pop()) if flags & CHOICE_HAS_CONDITION else True
+                text = format_value(stack.pop()) if flags & CHOICE_HAS_CHOICE_ONLY else ""
+                if flags & CHOICE_HAS_START:
+                    text = format_value(stack.pop()) + text
+                if flags & CHOICE_ONCE_ONLY and st.visits[compiled.counted.get(address, -1)] > 0:
+                    show = False
+                if show:
+                    st.choices.append([" ".join(text.split()), address, bool(flags & CHOICE_INVISIBLE_DEFAULT)])
+            elif op == OP_STR_START:
+                str_marks.append(len(output))
+                in_eval = False
+            elif op == OP_STR_END:
+                mark = str_marks.pop()
+                text = "".join(output[mark:])
+                del output[mark:]
+                stack.append(text)
+                in_eval = True
+            elif op == OP_SET_TEMP:
+                frames[-1][3][constants[arg]] = stack.pop()
+            elif op == OP_ASSIGN:
+                name = constants[arg]
+                (st.globals if name in st.globals else frames[-1][3])[name] = stack.pop()
+            elif op == OP_SET_GLOBAL:
+                st.globals[constants[arg]] = stack.pop()
+            elif op == OP_TARGET:
+                stack.append({"->": arg})
+            elif op == OP_DIVERT_VAR:
+                pc = self._lookup(constants[arg])["->"]
+            elif op == OP_GLUE:
+                while output and output[-1] == "\n" and len(output) > (str_marks[-1] if str_marks else 0):
+                    output.pop()
+                st.glued = True
+            elif op in (OP_CALL, OP_CALL_VAR, OP_TUNNEL, OP_TUNNEL_VAR):
+                frames.append(["function" if op in (OP_CALL, OP_CALL_VAR) else "tunnel", pc, in_eval, {}])
+                in_eval = False
+                pc = arg if op in (OP_CALL, OP_TUNNEL) else self._lookup(constants[arg])["->"]
+            elif op == OP_RETURN or op == OP_TUNNEL_RETURN:
+                override = stack.pop() if op == OP_TUNNEL_RETURN and stack else None
+                if len(frames) == 1:
+                    raise StoryError("Return outside of a function or tunnel")
+                _, pc, in_eval, _ = frames.pop()
+                if isinstance(override, dict):
+                    pc = override["->"]
+            elif op == OP_POP:
+                stack.pop()
+            elif op == OP_DUP:
+                stack.append(stack[-1])
+            elif op == OP_VOID:
+                stack.append(None)
+            elif op == OP_READ_COUNT:
+                stack.append(st.visits[arg])
+            elif op == OP_VISIT:
+                stack.append(st.visits[arg] - 1)
+            elif op == OP_SEQ:
+                elements, count = stack.pop(), stack.pop()
+                rng = random.Random(self._seq_hashes[arg] + count // elements + st.seed)
+                unpicked = list(range(elements))
+                for _ in range(count % elements + 1):
+                    chosen = unpicked.pop(rng.randrange(len(unpicked)))
+                stack.append(chosen)
+            elif op == OP_CHOICE_COUNT:
+                stack.append(sum(1 for choice in st.choices if not choice[2]))
+            elif op == OP_TURN:
+                stack.append(st.turn_index)
+            elif op == OP_TURNS_SINCE:
+                container = self._container_at(stack.pop())
+                turn = st.turns[container] if container >= 0 else -1
+                stack.append(st.turn_index - turn if turn >= 0 else -1)
+            elif op == OP_READC:
+                container = self._container_at(stack.pop())
+                stack.append(st.visits[container] if container >= 0 else 0)
+            elif op == OP_RANDOM:
+                high, low = stack.pop(), stack.pop()
+                if high < low:
+                    raise StoryError(f"RANDOM range {low}..{high} is empty")
+                st.previous_random = random.Random(st.seed + st.previous_random).getrandbits(31)
+                stack.append(low + st.previous_random % (high - low + 1))
+            elif op == OP_SEED_RANDOM:
+                st.seed, st.previous_random = int(stack.pop()), 0
+                stack.append(None)
+            elif op == OP_TAG:
+                if not str_marks:
+                    self.tags.append(constants[arg])
+            elif op == OP_TAG_START:
+                st.tag_mark = len(output)
+            elif op == OP_TAG_END:
+                tag = "".join(output[st.tag_mark:]).strip()
+                del output[st.tag_mark:]
+                st.tag_mark = -1
+                if not str_marks:
+                    self.tags.append(tag)
+            elif op == OP_FLOW_END and frames[-1][0] == "function":
+                _, pc, in_eval, _ = frames.pop()
+                if in_eval:
+                    stack.append(None)
+            elif op in (OP_DONE, OP_END, OP_FLOW_END):
+                pc -= 1
+                st.stopped = True
+                if op == OP_END:
+                    st.ended = True
+                    st.choices.clear()
+                    del frames[1:]
+                elif st.choices and not any(not choice[2] for choice in st.choices):
+                    pc = st.choices[0][1]
+                    self._take_choice(st.choices[0])
+                    if not output:
+                        continue
+                break
+        st.pc, st.in_eval = pc, in_eval
+        line = " ".join("".join(output).split())
+        output.clear()
+        return line
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import atexit
+import os
+import struct
+import time
+import zlib
+from array import array
+from pathlib import Path
+from time import perf_counter
+
+from src.core.background_writer import BackgroundWriter
+from src.shared.constants import DATA_DIR
+
+TELEMETRY_DIR = DATA_DIR / "telemetry"
+TELEMETRY_BATCH = 4096
+TELEMETRY_MAX_FILES = 20
+TELEMETRY_ENABLED = os.environ.get("ZHOSKO_TELEMETRY", "1") != "0"
+TELEMETRY_MAGIC = b"ZTLM"
+TELEMETRY_VERSION = 1
+
+EVENT_VIDEO_LOAD = 1
+EVENT_VIDEO_READY = 2
+EVENT_DECODE_STALL = 3
+EVENT_WATCH = 4
+EVENT_SWIPE = 5
+EVENT_NAMES = {
+    EVENT_VIDEO_LOAD: "video_load",
+    EVENT_VIDEO_READY: "video_ready",
+    EVENT_DECODE_STALL: "decode_stall",
+    EVENT_WATCH: "watch",
+    EVENT_SWIPE: "swipe",
+}
+
+_HEADER = struct.Struct("<4sHd")
+_FRAME = struct.Struct("<II")
+
+
+class Telemetry:
+    """Event batch buffer, flushed to a compressed session file each time it fills.
+
+    ``record`` only writes four preallocated arrays (time, code, arg, value); when a batch fills
+    it is copied out and compressed on a ``BackgroundWriter`` thread. Starting a session file
+    deletes the oldest ones beyond ``max_files``; ``ZHOSKO_TELEMETRY=0`` turns recording off.
+    """
+
+    def __init__(
+        self, batch: int = TELEMETRY_BATCH, directory: Path = TELEMETRY_DIR, max_files: int = TELEMETRY_MAX_FILES
+    ) -> None:
+        self.enabled = TELEMETRY_ENABLED
+        self.batch = batch
+        self.directory = directory
+        self.max_files = max_files
+        self.path: Path | None = None
+        self._times = array("d", bytes(8 * batch))
+        self._values = array("d", bytes(8 * batch))
+        self._codes = array("i", bytes(4 * batch))
+        self._args = array("i", bytes(4 * batch))
+        self._count = 0
+        self._start = perf_counter()
+        self._writer: BackgroundWriter[bytes] | None = None
+
+    def record(self, code: int, arg: int = 0, value: float = 0.0) -> None:
+        if not self.enabled:
+            return
+        i = self._count
+        self._times[i] = perf_counter() - self._start
+        self._codes[i] = code
+        self._args[i] = arg
+        self._values[i] = value
+        self._count = i + 1
+        if self._count == self.batch:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._count:
+            return
+        n, self._count = self._count, 0
+        payload = b"".join((
+            self._times[:n].tobytes(), self._values[:n].tobytes(),
+            self._codes[:n].tobytes(), self._args[:n].tobytes(),
+        ))
+        if self._writer is None:
+            self._writer = BackgroundWriter(self._write, name="telemetry-writer")
+            atexit.register(self.close)  # runs before the writer's own exit hook
+        self._writer.submit(payload)
+
+    def close(self) -> None:
+        self.flush()
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+            atexit.unregister(self.close)
+
+    def _write(self, payloads: list[bytes]) -> None:
+        if self.path is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.path = self.directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.tlm"
+            self._prune()
+            with open(self.path, "wb") as f:
+                f.write(_HEADER.pack(TELEMETRY_MAGIC, TELEMETRY_VERSION, time.time()))
+        with open(self.path, "ab") as f:
+            for payload in payloads:
+                data = zlib.compress(payload, 6)
+                f.write(_FRAME.pack(len(payload) // 24, len(data)))
+                f.write(data)
+
+    def _prune(self) -> None:
+        """Keep the newest ``max_files - 1`` sessions so the new one brings the count to the cap."""
+        sessions = sorted(self.directory.glob("*.tlm"))
+        for old in sessions[:max(len(sessions) - self.max_files + 1, 0)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+def read_events(path: Path) -> tuple[float, list[tuple[float, int, int, float]]]:
+    """Decode a session file into its wall-clock start and (time, code, arg, value) events."""
+    events: list[tuple[float, int, int, float]] = []
+    with open(path, "rb") as f:
+        magic, version, started = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != TELEMETRY_MAGIC or version != TELEMETRY_VERSION:
+            raise ValueError(f"Not a telemetry file: {path}")
+        while header := f.read(_FRAME.size):
+            if len(header) < _FRAME.size:
+                break
+            n, size = _FRAME.unpack(header)
+            try:
+                payload = zlib.decompress(f.read(size))
+            except zlib.error:
+                break  # truncated tail from an interrupted session
+            times, values = array("d"), array("d")
+            codes, args = array("i"), array("i")
+            times.frombytes(payload[:8 * n])
+            values.frombytes(payload[8 * n:16 * n])
+            codes.frombytes(payload[16 * n:20 * n])
+            args.frombytes(payload[20 * n:24 * n])
+            events.extend(zip(times, codes, args, values))
+    return started, events
+
+
+telemetry = Telemetry()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import Any, Callable
+
+
+class TimerHandle:
+    __slots__ = ("deadline", "callback", "cancelled")
+
+    def __init__(self, deadline: float, callback: Callable[[], Any]) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class UpdateScheduler:
+    """Simulation-step driver that only ticks components that asked for it.
+
+    ``wake`` puts a component on the tick list; after each ``update(dt)`` it stays there only
+    while its ``wants_update`` is true. Delays go into a heap of ``TimerHandle`` ordered by
+    deadline on the scheduler's own clock, so waiting costs nothing until they are due.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._active: dict[Any, None] = {}
+        self._timers: list[tuple[float, int, TimerHandle]] = []
+        self._order = count()
+
+    def wake(self, component: Any) -> None:
+        self._active[component] = None
+
+    def sleep(self, component: Any) -> None:
+        self._active.pop(component, None)
+
+    def is_awake(self, component: Any) -> bool:
+        return component in self._active
+
+    @property
+    def is_idle(self) -> bool:
+        return not self._active
+
+    def call_later(self, delay: float, callback: Callable[[], Any]) -> TimerHandle:
+        handle = TimerHandle(self.now + delay, callback)
+        heapq.heappush(self._timers, (handle.deadline, next(self._order), handle))
+        return handle
+
+    def update(self, delta_time: float) -> None:
+        self.now += delta_time
+        timers = self._timers
+        while timers and timers[0][0] <= self.now:
+            handle = heapq.heappop(timers)[2]
+            if not handle.cancelled:
+                handle.callback()
+        if not self._active:
+            return
+        for component in list(self._active):
+            component.update(delta_time)
+            if not component.wants_update:
+                self._active.pop(component, None)
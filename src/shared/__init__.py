@@ -1,48 +1,71 @@
-from src.shared.constants import (
-    ASSETS_DIR,
-    ATLAS_CONFIG_PATH,
-    IMAGES_DIR,
-    MAPS_DIR,
-    PROJECT_ROOT,
-    RAW_IMAGES_DIR,
-    SCREEN_HEIGHT,
-    SCREEN_TITLE,
-    SCREEN_WIDTH,
-    SOUNDS_DIR,
-    STORIES_DIR,
-    VIDEO_DIR,
-)
-from src.shared.types import (
-    IAtlasConfig,
-    IAtlasConfigEntry,
-    IAtlasData,
-    IAtlasEntry,
-    IAtlasMeta,
-    ISpriteFrame,
-    ISpriteSourceSize,
-)
-from src.shared.utils import load_json, save_json
+"""Shared constants, types and helpers, imported on first access (``utils`` needs arcade)."""
+from __future__ import annotations
 
-__all__ = [
-    "ASSETS_DIR",
-    "ATLAS_CONFIG_PATH",
-    "IMAGES_DIR",
-    "MAPS_DIR",
-    "PROJECT_ROOT",
-    "RAW_IMAGES_DIR",
-    "SCREEN_HEIGHT",
-    "SCREEN_TITLE",
-    "SCREEN_WIDTH",
-    "SOUNDS_DIR",
-    "STORIES_DIR",
-    "VIDEO_DIR",
-    "IAtlasConfig",
-    "IAtlasConfigEntry",
-    "IAtlasData",
-    "IAtlasEntry",
-    "IAtlasMeta",
-    "ISpriteFrame",
-    "ISpriteSourceSize",
-    "load_json",
-    "save_json",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.shared.constants import (
+        ASSETS_DIR,
+        ATLAS_CONFIG_PATH,
+        IMAGES_DIR,
+        MAPS_DIR,
+        PHONE_RENDER_QUALITY,
+        PROJECT_ROOT,
+        RAW_IMAGES_DIR,
+        RENDER_MODE,
+        SCREEN_HEIGHT,
+        SCREEN_TITLE,
+        SCREEN_WIDTH,
+        SOUNDS_DIR,
+        STORIES_DIR,
+        VIDEO_DIR,
+        VIDEO_PIXEL_SIZE,
+    )
+    from src.shared.types import (
+        IAtlasConfig,
+        IAtlasConfigEntry,
+        IAtlasData,
+        IAtlasEntry,
+        IAtlasMeta,
+        ISpriteFrame,
+        ISpriteSourceSize,
+    )
+    from src.shared.utils import load_json, save_json, summarize
+
+_EXPORTS = {
+    "ASSETS_DIR": "src.shared.constants",
+    "ATLAS_CONFIG_PATH": "src.shared.constants",
+    "IMAGES_DIR": "src.shared.constants",
+    "MAPS_DIR": "src.shared.constants",
+    "PHONE_RENDER_QUALITY": "src.shared.constants",
+    "PROJECT_ROOT": "src.shared.constants",
+    "RAW_IMAGES_DIR": "src.shared.constants",
+    "RENDER_MODE": "src.shared.constants",
+    "SCREEN_HEIGHT": "src.shared.constants",
+    "SCREEN_TITLE": "src.shared.constants",
+    "SCREEN_WIDTH": "src.shared.constants",
+    "SOUNDS_DIR": "src.shared.constants",
+    "STORIES_DIR": "src.shared.constants",
+    "VIDEO_DIR": "src.shared.constants",
+    "VIDEO_PIXEL_SIZE": "src.shared.constants",
+    "IAtlasConfig": "src.shared.types",
+    "IAtlasConfigEntry": "src.shared.types",
+    "IAtlasData": "src.shared.types",
+    "IAtlasEntry": "src.shared.types",
+    "IAtlasMeta": "src.shared.types",
+    "ISpriteFrame": "src.shared.types",
+    "ISpriteSourceSize": "src.shared.types",
+    "load_json": "src.shared.utils",
+    "save_json": "src.shared.utils",
+    "summarize": "src.shared.utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _EXPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(module), name)
+    return value
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
@@ -8,10 +9,14 @@ SOUNDS_DIR = ASSETS_DIR / "sounds"
 VIDEO_DIR = ASSETS_DIR / "video"
 STORIES_DIR = ASSETS_DIR / "stories"
 MAPS_DIR = ASSETS_DIR / "maps"
-DATA_DIR = PROJECT_ROOT / "data"
+DATA_DIR = Path(os.environ.get("ZHOSKO_DATA_DIR", PROJECT_ROOT / "data"))
 
 ATLAS_CONFIG_PATH = PROJECT_ROOT / "tools" / "atlas_config.json"
 
 SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
-SCREEN_TITLE = "ZHOSKO"
\ No newline at end of file
+SCREEN_TITLE = "ZHOSKO"
+
+PHONE_RENDER_QUALITY = "high"
+RENDER_MODE = "vsync"
+VIDEO_PIXEL_SIZE = 1
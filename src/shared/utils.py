@@ -1,7 +1,10 @@
 from __future__ import annotations
+from typing import Iterable
 import orjson
 import arcade
 
+SUMMARY_PERCENTILES = (50, 90, 99)
+
 def load_json(path: str) -> dict:
     with open(path, "rb") as f:
         return orjson.loads(f.read())
@@ -10,6 +13,17 @@ def save_json(path: str, data: dict) -> None:
     with open(path, "wb") as f:
         f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
+def summarize(samples: Iterable[float], points: tuple[int, ...] = SUMMARY_PERCENTILES) -> dict[str, float]:
+    """Count, mean, nearest-rank ``points`` percentiles and max of ``samples``; empty if there are none."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    last = len(ordered) - 1
+    report = {"count": len(ordered), "mean": sum(ordered) / len(ordered)}
+    report.update({f"p{p}": float(ordered[round(last * p / 100)]) for p in points})
+    report["max"] = float(ordered[-1])
+    return report
+
 def make_rect(x: float, y: float, width: float, height: float) -> arcade.Rect:
     return arcade.Rect(x, x + width, y, y + height, width, height, x + width / 2, y + height / 2)
 
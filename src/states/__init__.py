@@ -1,5 +1,6 @@
 from .phone import PhoneData, PhoneState
-from .zasora import ZasoraState, VideoInteractionState
+from .zasora import CommentList, ZasoraState, VideoInteractionState
 from .calc import CalcState
+from .story import StoryState
 
-__all__ = ["PhoneData", "PhoneState", "ZasoraState", "VideoInteractionState", "CalcState"]
\ No newline at end of file
+__all__ = ["PhoneData", "PhoneState", "ZasoraState", "VideoInteractionState", "CommentList", "CalcState", "StoryState"]
\ No newline at end of file
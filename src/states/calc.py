@@ -1,14 +1,38 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import ClassVar
+from src.core.calc_engine import CalcError, CalcTape, evaluate, format_number
+
+OPERATORS = ("+", "-", "*", "/")
 
 @dataclass
 class CalcState:
+    """Keypad state. ``source`` is the pending expression as the engine parses it and
+    ``expression`` the same shown to the player; computed values enter ``source`` exactly
+    (``display_exact``), so only the display is rounded.
+
+    "=" compiles and evaluates ``source``. Operator previews come from the running ``total`` of
+    closed terms and the open product ``term`` instead, so a key press costs the same on long inputs.
+    """
+
+    SAVE_FIELDS: ClassVar[tuple[str, ...]] = (
+        "display", "display_exact", "expression", "source", "total", "term", "negative",
+        "needs_clear", "awaiting_operand", "history",
+    )
+
     is_running: bool = False
     display: str = "0"
+    display_exact: str = ""
     expression: str = ""
-    operand: float | None = None
-    operator: str | None = None
+    source: str = ""
+    total: str = "0"
+    term: str = "0"
+    negative: bool = False
     needs_clear: bool = False
+    awaiting_operand: bool = False
+    history: list[list[str]] = field(default_factory=list)
+    tape: CalcTape = field(default_factory=CalcTape, repr=False, compare=False)
 
     def reset(self) -> None:
         self.is_running = False
@@ -16,10 +40,20 @@ class CalcState:
 
     def clear_all(self) -> None:
         self.display = "0"
+        self.display_exact = ""
         self.expression = ""
-        self.operand = None
-        self.operator = None
+        self.source = ""
+        self.total = "0"
+        self.term = "0"
+        self.negative = False
         self.needs_clear = False
+        self.awaiting_operand = False
+
+    def before_save(self) -> None:
+        self.history = self.tape.to_list()
+
+    def after_load(self) -> None:
+        self.tape = CalcTape(self.history)
 
     def input_char(self, char: str) -> None:
         if char == "C":
@@ -32,73 +66,101 @@ class CalcState:
                     self.display = self.display[1:]
                 else:
                     self.display = "-" + self.display
+                if self.display_exact:
+                    self.display_exact = str(-Fraction(self.display_exact))
+                self.awaiting_operand = False
             return
 
         if char == "%":
-            try:
-                val = float(self.display) / 100.0
-                self.display = self._format_number(val)
-                self.needs_clear = True
-            except ValueError:
-                self.display = "Error"
+            if self.display == "Error":
+                return
+            self._show(self._entry() / 100)
+            self.needs_clear = True
+            self.awaiting_operand = False
             return
 
-        if char in ("+", "-", "*", "/"):
+        if char in OPERATORS:
             if self.display == "Error":
                 return
-            if self.operand is not None and not self.needs_clear:
-                self._calculate()
-            self.operand = float(self.display)
-            self.operator = char
-            self.expression = f"{self._format_number(self.operand)} {char}"
+            if self.awaiting_operand:
+                self.source = self.source[:-1] + char
+                self.expression = self.expression[:-1] + char
+            else:
+                try:
+                    self._push_operand(self._entry())
+                except CalcError:
+                    self.clear_all()
+                    self.display = "Error"
+                    self.needs_clear = True
+                    return
+                self.source = f"{self.source} {self._entry_source()} {char}".lstrip()
+                self.expression = f"{self.expression} {self.display} {char}".lstrip()
+            value = Fraction(self.term)
+            if char in ("+", "-"):
+                value = Fraction(self.total) + (-value if self.negative else value)
+            self._show(value)
+            self.awaiting_operand = True
             self.needs_clear = True
             return
 
         if char == "=":
-            self._calculate()
+            if self.display == "Error":
+                return
+            if self.source:
+                shown = f"{self.expression} {self.display}"
+                try:
+                    self._show(evaluate(f"{self.source} {self._entry_source()}"))
+                    self.tape.append(shown, self.display)
+                except CalcError:
+                    self.display = "Error"
+                    self.display_exact = ""
             self.expression = ""
-            self.operand = None
-            self.operator = None
+            self.source = ""
+            self.total = self.term = "0"
+            self.negative = False
+            self.awaiting_operand = False
             self.needs_clear = True
             return
 
         if self.needs_clear:
             self.display = ""
+            self.display_exact = ""
             self.needs_clear = False
+            self.awaiting_operand = False
 
         if char == ".":
-            if "." not in self.display:
+            if self.display == "Error":
+                self.display = "0."
+            elif "." not in self.display:
                 self.display += "." if self.display else "0."
             return
 
+        self.display_exact = ""
         if self.display == "0" or self.display == "Error":
             self.display = char
         else:
             self.display += char
 
-    def _calculate(self) -> None:
-        if self.operator and self.operand is not None:
-            try:
-                current_val = float(self.display)
-                if self.operator == "+":
-                    res = self.operand + current_val
-                elif self.operator == "-":
-                    res = self.operand - current_val
-                elif self.operator == "*":
-                    res = self.operand * current_val
-                elif self.operator == "/":
-                    if current_val == 0:
-                        self.display = "Error"
-                        return
-                    res = self.operand / current_val
-                else:
-                    res = current_val
-                self.display = self._format_number(res)
-            except Exception:
-                self.display = "Error"
-
-    def _format_number(self, num: float) -> str:
-        if num.is_integer():
-            return str(int(num))
-        res = str(round(num, 8))
-        return res.rstrip("0").rstrip(".") if "." in res else res
\ No newline at end of file
+    def _entry(self) -> Fraction:
+        return Fraction(self.display_exact or self.display)
+
+    def _entry_source(self) -> str:
+        return f"({self.display_exact})" if self.display_exact else self.display
+
+    def _show(self, value: Fraction) -> None:
+        self.display = format_number(value)
+        self.display_exact = "" if value.denominator == 1 else str(value)
+
+    def _push_operand(self, value: Fraction) -> None:
+        """Fold the operand ending at the pressed operator into ``total``/``term``."""
+        previous = self.source[-1] if self.source else "+"
+        if previous in ("*", "/"):
+            if previous == "/" and not value:
+                raise CalcError("Division by zero")
+            term = Fraction(self.term)
+            self.term = str(term * value if previous == "*" else term / value)
+            return
+        term = Fraction(self.term)
+        self.total = str(Fraction(self.total) + (-term if self.negative else term))
+        self.term = str(value)
+        self.negative = previous == "-"
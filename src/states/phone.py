@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 from enum import Enum, auto
 from pathlib import Path
 
@@ -19,18 +20,26 @@ class PhoneState(Enum):
 class PhoneData:
     """Phone state data class."""
 
+    SAVE_FIELDS: ClassVar[tuple[str, ...]] = ("state", "active_app")
+
     state: PhoneState = PhoneState.OFF
     boot_start_time: float = 0.0
     power_button_blocked: bool = False
-    power_button_block_time: float = 0.0
     videos_loaded: bool = False
     video_files: list[Path] = field(default_factory=list)
+    active_app: str = ""
 
     def reset(self) -> None:
         """Reset phone state to initial."""
         self.state = PhoneState.OFF
         self.boot_start_time = 0.0
         self.power_button_blocked = False
-        self.power_button_block_time = 0.0
         self.videos_loaded = False
         self.video_files.clear()
+        self.active_app = ""
+
+    def after_load(self) -> None:
+        """Resume a saved boot as already booted."""
+        if self.state == PhoneState.BOOTING:
+            self.state = PhoneState.ON
+        self.videos_loaded = self.state == PhoneState.ON
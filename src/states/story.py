@@ -0,0 +1,42 @@
+"""Story state module."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+
+@dataclass
+class StoryState:
+    """Resumable state of one Ink story run.
+
+    Everything is plain JSON data so the whole run can go through ``SaveGame``; divert
+    target values are kept as ``{"->": address}``. ``frames`` holds
+    ``[kind, return_pc, caller_in_eval, temps]`` and ``choices`` holds
+    ``[text, address, invisible_default]``.
+    """
+
+    SAVE_FIELDS: ClassVar[tuple[str, ...]] = (
+        "checksum", "pc", "in_eval", "stopped", "ended", "glued", "frames", "eval_stack", "output",
+        "str_marks", "tag_mark", "globals", "visits", "turns", "turn_index", "seed", "previous_random",
+        "choices",
+    )
+
+    checksum: int = 0
+    pc: int = 0
+    in_eval: bool = False
+    stopped: bool = False
+    ended: bool = False
+    glued: bool = False
+    frames: list[list[Any]] = field(default_factory=lambda: [["root", -1, False, {}]])
+    eval_stack: list[Any] = field(default_factory=list)
+    output: list[str] = field(default_factory=list)
+    str_marks: list[int] = field(default_factory=list)
+    tag_mark: int = -1
+    globals: dict[str, Any] = field(default_factory=dict)
+    visits: list[int] = field(default_factory=list)
+    turns: list[int] = field(default_factory=list)
+    turn_index: int = 0
+    seed: int = 0
+    previous_random: int = 0
+    choices: list[list[Any]] = field(default_factory=list)
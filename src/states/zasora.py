@@ -1,38 +1,185 @@
 from __future__ import annotations
+import sys
+import threading
+from array import array
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
-    from src.composables.zasora.dataLoader import load_interactions
+    from src.composables.zasora.dataLoader import InteractionJournal
+    from src.composables.zasora.feedSampler import FeedSampler
+    from src.composables.zasora.phrasesLoader import PhraseTable
+    from src.composables.zasora.videoLoader import VideoCatalog
+    from src.core.background_writer import BackgroundWriter
+
+class CommentArena:
+    """Append-only storage for the ``CommentList``s of one state: interned authors plus comment texts.
+
+    Nothing is freed per comment; the whole arena goes with the ``ZasoraState`` that owns it.
+    """
+
+    __slots__ = ("authors", "texts", "_author_names", "_author_ids", "_lock")
+
+    def __init__(self) -> None:
+        self.authors = array("I")
+        self.texts: list[str] = []
+        self._author_names: list[str] = []
+        self._author_ids: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, author: str, text: str) -> int:
+        with self._lock:
+            if (author_id := self._author_ids.get(author)) is None:
+                author_id = self._author_ids[author] = len(self._author_names)
+                self._author_names.append(sys.intern(author))
+            self.authors.append(author_id)
+            self.texts.append(text)
+            return len(self.texts) - 1
+
+    def get(self, comment_id: int) -> tuple[str, str]:
+        return self._author_names[self.authors[comment_id]], self.texts[comment_id]
+
+class CommentList:
+    """Comments of one video, newest first.
+
+    Holds only ids into ``arena``, stored oldest-first so adding a comment is an append.
+    """
+
+    __slots__ = ("_arena", "_ids")
+
+    def __init__(self, arena: CommentArena, comments: list[dict[str, str]] | None = None) -> None:
+        self._arena = arena
+        self._ids = array("I")
+        for comment in reversed(comments or ()):
+            self.prepend(comment.get("author", "Player"), comment.get("text", ""))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def prepend(self, author: str, text: str) -> None:
+        self._ids.append(self._arena.add(author, text))
+
+    def row(self, index: int) -> tuple[str, str]:
+        return self._arena.get(self._ids[len(self._ids) - 1 - index])
+
+    def rows(self, start: int, stop: int) -> list[tuple[str, str]]:
+        return [self.row(i) for i in range(max(start, 0), min(stop, len(self._ids)))]
+
+    def to_list(self) -> list[dict[str, str]]:
+        return [{"author": a, "text": t} for a, t in self.rows(0, len(self))]
+
+_NO_COMMENTS = CommentList(CommentArena())
 
-@dataclass
 class VideoInteractionState:
-    likes: int = 0
-    is_liked: bool = False
-    comments: list[dict[str, str]] = field(default_factory=list)
+    """Likes and comments of one video; the like count and flag are packed into one int."""
+
+    __slots__ = ("_packed", "_comments")
+
+    def __init__(self, likes: int = 0, is_liked: bool = False, comments: CommentList | None = None) -> None:
+        self._packed = likes << 1 | bool(is_liked)
+        self._comments = comments if comments else None
+
+    def __repr__(self) -> str:
+        return f"VideoInteractionState(likes={self.likes}, is_liked={self.is_liked}, comments={len(self.comments)})"
+
+    @property
+    def likes(self) -> int:
+        return self._packed >> 1
+
+    @likes.setter
+    def likes(self, value: int) -> None:
+        self._packed = value << 1 | self._packed & 1
+
+    @property
+    def is_liked(self) -> bool:
+        return bool(self._packed & 1)
+
+    @is_liked.setter
+    def is_liked(self, value: bool) -> None:
+        self._packed = self._packed & ~1 | bool(value)
+
+    @property
+    def comments(self) -> CommentList:
+        return self._comments if self._comments is not None else _NO_COMMENTS
+
+    def add_comment(self, author: str, text: str, arena: CommentArena) -> None:
+        if self._comments is None:
+            self._comments = CommentList(arena)
+        self._comments.prepend(author, text)
+
+_NO_INTERACTION = VideoInteractionState()
+
+FEED_SAVE_HISTORY = 100
 
 @dataclass
 class ZasoraState:
+    SAVE_FIELDS: ClassVar[tuple[str, ...]] = ("seed", "feed_history", "feed_position", "videos_played", "watch_times")
+
     is_running: bool = False
-    video_files: list[Path] = field(default_factory=list)
-    shuffled_order: list[int] = field(default_factory=list)
+    catalog: VideoCatalog | None = field(default=None, repr=False, compare=False)
+    feed: FeedSampler | None = field(default=None, repr=False, compare=False)
     current_video_index: int = 0
     videos_played: int = 0
-    phrases: dict[str, dict[str, str]] = field(default_factory=dict)
+    watch_time: float = 0.0
+    seed: int = 0
+    feed_history: list[str] = field(default_factory=list)
+    feed_position: int = 0
+    watch_times: dict[str, float] = field(default_factory=dict)
+    phrases: PhraseTable | None = field(default=None, repr=False, compare=False)
     interactions: dict[str, VideoInteractionState] = field(default_factory=dict)
+    comment_arena: CommentArena = field(default_factory=CommentArena, repr=False, compare=False)
     y_offset: float = 0.0
     swipe_velocity: float = 0.0
     show_comments: bool = False
     is_paused: bool = False
+    journal: InteractionJournal | None = field(default=None, repr=False, compare=False)
+    writer: BackgroundWriter[dict] | None = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        from src.composables.zasora.dataLoader import load_interactions
+        from src.composables.zasora.dataLoader import InteractionJournal
+        from src.composables.zasora.feedSampler import FeedSampler
         from src.composables.zasora.videoLoader import load_videos
-        self.interactions = load_interactions()
-        self.video_files, self.shuffled_order = load_videos()
+        from src.core.background_writer import BackgroundWriter
+        self.journal = InteractionJournal()
+        self.interactions = self.journal.load(self.comment_arena)
+        self.writer = BackgroundWriter(self.journal.write, name="zasora-writer")
+        self.catalog = load_videos()
+        self.seed = self.catalog.seed
+        self.feed = FeedSampler(self.catalog, self.interactions, self.seed)
+
+    def before_save(self) -> None:
+        """Keep the last ``FEED_SAVE_HISTORY`` feed positions by name, up to the preloaded next one.
+
+        Only writes the saved fields: ``feed_position`` is the current video rebased onto
+        ``feed_history``, ``current_video_index`` stays as the running feed uses it.
+        """
+        start = max(0, self.current_video_index - FEED_SAVE_HISTORY + 1)
+        indices = [self.feed.index_at(i) for i in range(start, self.current_video_index + 2)] if self.feed else []
+        self.feed_history = [self.catalog.name(i) for i in indices if i is not None]
+        self.watch_times = self.feed.watch_times() if self.feed else {}
+        if self.feed and self.watch_time > 0 and (index := self.feed.index_at(self.current_video_index)) is not None:
+            name = self.catalog.name(index)  # still pending until the next swipe commits it
+            self.watch_times[name] = self.watch_times.get(name, 0.0) + self.watch_time
+        self.feed_position = self.current_video_index - start
+
+    def after_load(self) -> None:
+        # the catalog scanned in __post_init__ is kept; only the sampler depends on the saved seed
+        from src.composables.zasora.feedSampler import FeedSampler
+        self.catalog.seed = self.seed
+        self.feed = FeedSampler(self.catalog, self.interactions, self.seed)
+        indices = [i for name in self.feed_history if (i := self.catalog.index_of(name)) is not None]
+        self.feed.restore(indices)
+        self.feed.restore_watch_times(self.watch_times)
+        self.current_video_index = min(self.feed_position, max(len(indices) - 1, 0))
+
+    def _commit_watch_time(self) -> None:
+        if self.feed and (index := self.feed.index_at(self.current_video_index)) is not None:
+            self.feed.add_watch_time(index, self.watch_time)
+        self.watch_time = 0.0
 
     def reset(self) -> None:
+        self._commit_watch_time()
         self.is_running = False
         self.current_video_index = 0
         self.videos_played = 0
@@ -42,17 +189,16 @@ class ZasoraState:
         self.is_paused = False
 
     def next_video(self) -> int:
+        self._commit_watch_time()
         self.videos_played += 1
         self.current_video_index += 1
-        if self.current_video_index >= len(self.shuffled_order):
-            self.current_video_index = 0
-            self.videos_played = 0
         self.show_comments = False
         self.is_paused = False
         return self.current_video_index
 
     def prev_video(self) -> int:
         if self.current_video_index > 0:
+            self._commit_watch_time()
             self.current_video_index -= 1
             self.videos_played = max(0, self.videos_played - 1)
         self.show_comments = False
@@ -60,28 +206,36 @@ class ZasoraState:
         return self.current_video_index
 
     def get_current_video(self) -> Path | None:
-        if not self.video_files or not self.shuffled_order:
-            return None
-        actual_index = self.shuffled_order[self.current_video_index]
-        if actual_index < len(self.video_files):
-            return self.video_files[actual_index]
-        return None
+        return self.feed.get(self.current_video_index) if self.feed else None
 
     def get_video_by_offset(self, offset: int) -> Path | None:
-        if not self.video_files or not self.shuffled_order:
-            return None
-        idx = self.current_video_index + offset
-        if 0 <= idx < len(self.shuffled_order):
-            actual_index = self.shuffled_order[idx]
-            if actual_index < len(self.video_files):
-                return self.video_files[actual_index]
-        return None
+        return self.feed.get(self.current_video_index + offset) if self.feed else None
 
     def get_interaction(self, video_name: str) -> VideoInteractionState:
-        if video_name not in self.interactions:
-            self.interactions[video_name] = VideoInteractionState()
-        return self.interactions[video_name]
+        # read-only lookup; records create entries through apply_interaction
+        return self.interactions.get(video_name, _NO_INTERACTION)
+
+    def _record(self, record: dict) -> VideoInteractionState:
+        from src.composables.zasora.dataLoader import apply_interaction
+        apply_interaction(self.interactions, record, self.comment_arena)
+        if self.writer:
+            self.writer.submit(record)
+        if self.feed:
+            self.feed.refresh(record["video"])
+        return self.interactions[record["video"]]
+
+    def toggle_like(self, video_name: str) -> VideoInteractionState:
+        op = "unlike" if self.get_interaction(video_name).is_liked else "like"
+        return self._record({"op": op, "video": video_name})
+
+    def add_comment(self, video_name: str, comment: dict[str, str]) -> VideoInteractionState:
+        return self._record({"op": "comment", "video": video_name, "comment": comment})
 
     def save_interactions(self) -> None:
-        from src.composables.zasora.dataLoader import save_interactions
-        save_interactions(self.interactions)
\ No newline at end of file
+        if self.writer:
+            self.writer.submit({"op": "compact"})
+            self.writer.flush()
+
+    def close(self) -> None:
+        if self.writer:
+            self.writer.close()
\ No newline at end of file
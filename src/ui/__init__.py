@@ -1,5 +1,8 @@
 from .shapes import draw_rounded_rect
-from .text import draw_wrapped_text
+from .text import draw_wrapped_text, wrap_text_lines
 from .input import TextInput
+from .widgets import InputEvent, Widget, WidgetTree
+from .layout import Layout, Length, Slot, SolvedLayout, grid_slots
+from .kinetic import VelocityTracker, fling_direction, spring_step
 
-__all__ = ["draw_rounded_rect", "draw_wrapped_text", "TextInput"]
\ No newline at end of file
+__all__ = ["draw_rounded_rect", "draw_wrapped_text", "wrap_text_lines", "TextInput", "InputEvent", "Widget", "WidgetTree", "Layout", "Length", "Slot", "SolvedLayout", "grid_slots", "VelocityTracker", "fling_direction", "spring_step"]
\ No newline at end of file
@@ -0,0 +1,62 @@
+from __future__ import annotations
+import math
+from collections import deque
+
+VELOCITY_WINDOW = 0.1
+VELOCITY_SAMPLES = 16
+
+
+class VelocityTracker:
+    """Pointer velocity as the least-squares slope of the positions of the last ``VELOCITY_WINDOW`` seconds.
+
+    Samples are stamped with the caller's clock; samples sharing a stamp (several motion events
+    in one simulation step) collapse into the latest position.
+    """
+
+    def __init__(self, window: float = VELOCITY_WINDOW) -> None:
+        self.window = window
+        self._samples: deque[tuple[float, float]] = deque(maxlen=VELOCITY_SAMPLES)
+
+    def reset(self, t: float, position: float) -> None:
+        self._samples.clear()
+        self._samples.append((t, position))
+
+    def add(self, t: float, position: float) -> None:
+        samples = self._samples
+        if samples and samples[-1][0] >= t:
+            samples[-1] = (samples[-1][0], position)
+        else:
+            samples.append((t, position))
+        while samples[0][0] < t - self.window:
+            samples.popleft()
+
+    def velocity(self, t: float) -> float:
+        samples = [s for s in self._samples if s[0] >= t - self.window]
+        if len(samples) < 2:
+            return 0.0
+        n = len(samples)
+        mean_t = sum(s[0] for s in samples) / n
+        mean_p = sum(s[1] for s in samples) / n
+        var = sum((s[0] - mean_t) ** 2 for s in samples)
+        return sum((s[0] - mean_t) * (s[1] - mean_p) for s in samples) / var if var else 0.0
+
+
+def spring_step(x: float, v: float, omega: float, dt: float) -> tuple[float, float]:
+    """Advance a critically damped spring towards 0 by ``dt`` in closed form, so any step size lands on the same curve."""
+    decay = math.exp(-omega * dt)
+    c = v + omega * x
+    return (x + c * dt) * decay, (v - omega * c * dt) * decay
+
+
+def fling_direction(offset: float, velocity: float, page: float, fling_velocity: float, projection: float, commit_fraction: float = 0.5) -> int:
+    """Page to settle on after release: -1, 0 or 1 in the sign convention of ``offset``.
+
+    A fast enough flick commits in its own direction; otherwise the offset is projected
+    ``projection`` seconds ahead and commits past ``commit_fraction`` of a page.
+    """
+    if abs(velocity) >= fling_velocity and velocity * offset >= 0:
+        return 1 if velocity > 0 else -1
+    projected = offset + velocity * projection
+    if abs(projected) > page * commit_fraction:
+        return 1 if projected > 0 else -1
+    return 0
@@ -0,0 +1,114 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable
+import arcade
+from src.shared.utils import make_rect
+
+LAYOUT_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True, slots=True)
+class Length:
+    """``px + units * scale + fraction * parent extent``; plain numbers in a ``Slot`` are design units."""
+
+    units: float = 0.0
+    fraction: float = 0.0
+    px: float = 0.0
+
+
+FULL = Length(fraction=1.0)
+
+
+@dataclass(frozen=True, slots=True)
+class Slot:
+    """Named box placed relative to its parent (the layout root when ``parent`` is empty).
+
+    Zero-sized slots are anchor points for text and shapes; read them through ``rect.left``/``rect.bottom``.
+    """
+
+    name: str
+    left: Length | float = 0.0
+    bottom: Length | float = 0.0
+    width: Length | float = FULL
+    height: Length | float = FULL
+    parent: str = ""
+
+
+def _resolve(value: Length | float, scale: float, extent: float) -> float:
+    if isinstance(value, Length):
+        return value.px + value.units * scale + value.fraction * extent
+    return value * scale
+
+
+def grid_slots(parent: str, cells: Iterable[tuple[str, int, int, int]], rows: int, cols: int, padding: float) -> list[Slot]:
+    """Equal cells with ``padding`` units between them and around the edge; ``cells`` are (name, row, col, col_span), row 0 on top."""
+    cell_w = Length(-padding * (cols + 1) / cols, 1.0 / cols)
+    cell_h = Length(-padding * (rows + 1) / rows, 1.0 / rows)
+    slots = []
+    for name, row, col, span in cells:
+        slots.append(Slot(
+            name,
+            Length(padding + col * (cell_w.units + padding), col * cell_w.fraction),
+            Length(-padding - cell_h.units - row * (cell_h.units + padding), 1.0 - (row + 1) * cell_h.fraction),
+            Length(span * cell_w.units + (span - 1) * padding, span * cell_w.fraction),
+            cell_h,
+            parent,
+        ))
+    return slots
+
+
+class SolvedLayout:
+    """Rects, metrics (scaled design units) and font sizes of one layout at one size and scale."""
+
+    __slots__ = ("rects", "metrics", "fonts", "scale")
+
+    def __init__(self, rects: dict[str, arcade.Rect], metrics: dict[str, float], fonts: dict[str, int], scale: float) -> None:
+        self.rects, self.metrics, self.fonts, self.scale = rects, metrics, fonts, scale
+
+    def __getitem__(self, name: str) -> arcade.Rect:
+        return self.rects[name]
+
+
+class Layout:
+    """Declarative screen geometry solved once per (origin, size, scale) and cached.
+
+    Slots are listed parents first. Resizing costs one ``solve``; draw and hit-test code reads
+    the returned ``SolvedLayout`` and does no geometry of its own.
+    """
+
+    def __init__(self, slots: Iterable[Slot], metrics: dict[str, float] | None = None, fonts: dict[str, float] | None = None) -> None:
+        self.slots = tuple(slots)
+        self.metrics = metrics or {}
+        self.fonts = fonts or {}
+        known = {""}
+        for slot in self.slots:
+            if slot.parent not in known:
+                raise ValueError(f"Layout slot {slot.name!r} comes before its parent {slot.parent!r}")
+            known.add(slot.name)
+        self._cache: OrderedDict[tuple[float, ...], SolvedLayout] = OrderedDict()
+
+    def solve(self, width: float, height: float, scale: float, x: float = 0.0, y: float = 0.0) -> SolvedLayout:
+        key = (x, y, width, height, scale)
+        if (solved := self._cache.get(key)) is not None:
+            self._cache.move_to_end(key)
+            return solved
+        rects = {"": make_rect(x, y, width, height)}
+        for slot in self.slots:
+            parent = rects[slot.parent]
+            rects[slot.name] = make_rect(
+                parent.left + _resolve(slot.left, scale, parent.width),
+                parent.bottom + _resolve(slot.bottom, scale, parent.height),
+                _resolve(slot.width, scale, parent.width),
+                _resolve(slot.height, scale, parent.height),
+            )
+        solved = SolvedLayout(
+            rects,
+            {name: units * scale for name, units in self.metrics.items()},
+            {name: int(units * scale) for name, units in self.fonts.items()},
+            scale,
+        )
+        self._cache[key] = solved
+        if len(self._cache) > LAYOUT_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return solved
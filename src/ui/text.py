@@ -2,17 +2,7 @@ from __future__ import annotations
 from typing import Any
 import arcade
 
-def draw_wrapped_text(
-    text: str,
-    x: float,
-    y: float,
-    width: float,
-    font_size: int,
-    color: Any,
-    font_name: str,
-    line_spacing_factor: float = 1.3,
-    max_lines: int = 3
-) -> float:
+def wrap_text_lines(text: str, width: float, font_size: int, max_lines: int = 3) -> list[str]:
     words = text.split()
     lines = []
     current_line = ""
@@ -34,7 +24,20 @@ def draw_wrapped_text(
     if len(lines) > max_lines:
         lines = lines[:max_lines]
         lines[-1] = lines[-1][:int(width / (font_size * 0.6)) - 3] + "..."
+    return lines
 
+def draw_wrapped_text(
+    text: str,
+    x: float,
+    y: float,
+    width: float,
+    font_size: int,
+    color: Any,
+    font_name: str,
+    line_spacing_factor: float = 1.3,
+    max_lines: int = 3
+) -> float:
+    lines = wrap_text_lines(text, width, font_size, max_lines)
     curr_y = y
     for line in lines:
         arcade.draw_text(
@@ -0,0 +1,154 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable
+
+HIT_GRID_CELL = 64
+
+Handler = Callable[["InputEvent"], bool]
+
+
+@dataclass(slots=True)
+class InputEvent:
+    """Pointer event; for ``scroll`` the wheel amounts travel in ``dx``/``dy``."""
+
+    kind: str
+    x: float
+    y: float
+    button: int = 0
+    modifiers: int = 0
+    dx: float = 0.0
+    dy: float = 0.0
+    target: Widget | None = None
+
+
+class Widget:
+    """Node of a retained input tree with bounds cached at layout time.
+
+    ``active`` is asked at hit-test time, so widgets of hidden screens stay indexed and are
+    simply skipped. Handlers return True to stop the event.
+    """
+
+    def __init__(self, name: str = "", active: Callable[[], bool] | None = None) -> None:
+        self.name = name
+        self.active = active
+        self.parent: Widget | None = None
+        self.children: list[Widget] = []
+        self.left = self.bottom = self.right = self.top = 0.0
+        self.tree: WidgetTree | None = None
+        self._handlers: dict[str, Handler] = {}
+        self._capture_handlers: dict[str, Handler] = {}
+
+    def set_bounds(self, left: float, bottom: float, width: float, height: float) -> None:
+        self.left, self.bottom, self.right, self.top = left, bottom, left + width, bottom + height
+        if self.tree:
+            self.tree.invalidate()
+
+    def contains(self, x: float, y: float) -> bool:
+        return self.left <= x <= self.right and self.bottom <= y <= self.top
+
+    def is_active(self) -> bool:
+        widget: Widget | None = self
+        while widget:
+            if widget.active and not widget.active():
+                return False
+            widget = widget.parent
+        return True
+
+    def on(self, kind: str, handler: Handler, capture: bool = False) -> Widget:
+        (self._capture_handlers if capture else self._handlers)[kind] = handler
+        return self
+
+    def add(self, child: Widget) -> Widget:
+        child.parent = self
+        self.children.append(child)
+        child._attach(self.tree)
+        return child
+
+    def remove(self, child: Widget) -> None:
+        self.children.remove(child)
+        child.parent = None
+        child._attach(None)
+        if self.tree:
+            self.tree.invalidate()
+            self.tree.release(child)
+
+    def clear(self) -> None:
+        for child in self.children:
+            child.parent = None
+            child._attach(None)
+        self.children.clear()
+        if self.tree:
+            self.tree.invalidate()
+
+    def _attach(self, tree: WidgetTree | None) -> None:
+        self.tree = tree
+        for child in self.children:
+            child._attach(tree)
+        if tree:
+            tree.invalidate()
+
+    def _walk(self):
+        yield self
+        for child in self.children:
+            yield from child._walk()
+
+
+class WidgetTree:
+    """Routes pointer events through a widget tree in capture then bubble order.
+
+    Hit-testing goes through a uniform grid rebuilt only when bounds or structure change; the
+    topmost active widget under the point is the target, the root when nothing is hit. A
+    widget holding the pointer (``capture``) receives every event until it lets go.
+    """
+
+    def __init__(self, cell: float = HIT_GRID_CELL) -> None:
+        self.root = Widget("root")
+        self.root.tree = self
+        self.cell = cell
+        self.captured: Widget | None = None
+        self._grid: dict[tuple[int, int], list[Widget]] | None = None
+
+    def invalidate(self) -> None:
+        self._grid = None
+
+    def _build(self) -> dict[tuple[int, int], list[Widget]]:
+        grid: dict[tuple[int, int], list[Widget]] = {}
+        cell = self.cell
+        for widget in self.root._walk():
+            if widget is self.root or widget.right <= widget.left or widget.top <= widget.bottom:
+                continue
+            for cx in range(int(widget.left // cell), int(widget.right // cell) + 1):
+                for cy in range(int(widget.bottom // cell), int(widget.top // cell) + 1):
+                    grid.setdefault((cx, cy), []).append(widget)
+        return grid
+
+    def hit_test(self, x: float, y: float) -> Widget | None:
+        if self._grid is None:
+            self._grid = self._build()
+        for widget in reversed(self._grid.get((int(x // self.cell), int(y // self.cell)), ())):
+            if widget.contains(x, y) and widget.is_active():
+                return widget
+        return None
+
+    def capture(self, widget: Widget) -> None:
+        self.captured = widget
+
+    def release(self, widget: Widget) -> None:
+        if self.captured is widget:
+            self.captured = None
+
+    def dispatch(self, event: InputEvent) -> bool:
+        target = self.captured if self.captured and self.captured.is_active() else None
+        event.target = target or self.hit_test(event.x, event.y) or self.root
+        path: list[Widget] = []
+        widget: Widget | None = event.target
+        while widget:
+            path.append(widget)
+            widget = widget.parent
+        for widget in reversed(path):
+            if (handler := widget._capture_handlers.get(event.kind)) and handler(event):
+                return True
+        for widget in path:
+            if (handler := widget._handlers.get(event.kind)) and handler(event):
+                return True
+        return False
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import orjson
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BENCH_SEED = 1337
+OPERAND_COUNTS = (10, 100, 1000)
+BATCH_OPERANDS = 20
+
+
+def _keys(rng: random.Random, operands: int) -> list[str]:
+    """Keypad presses for ``operands`` numbers joined by random operators, ending with "="."""
+    keys = []
+    for i in range(operands):
+        keys += str(rng.randint(1, 9999))
+        if rng.random() < 0.3:
+            keys += ["."] + list(str(rng.randint(1, 99)))
+        keys.append(rng.choice("+-*/") if i < operands - 1 else "=")
+    return keys
+
+
+def _expression(rng: random.Random, operands: int) -> str:
+    parts = [f"{rng.randint(1, 9999)}.{rng.randint(0, 99)}" for _ in range(operands)]
+    return "".join(p + rng.choice("+-*/") for p in parts[:-1]) + parts[-1]
+
+
+def bench_keypad(rng: random.Random, operands: int, runs: int) -> dict:
+    """Per-key cost of ``CalcState.input_char`` while typing one long expression, split by key kind."""
+    from src.shared.utils import summarize
+    from src.states.calc import OPERATORS, CalcState
+
+    digit_us, operator_us, equals_us = [], [], []
+    for _ in range(runs):
+        state = CalcState()
+        for key in _keys(rng, operands):
+            start = perf_counter()
+            state.input_char(key)
+            elapsed = (perf_counter() - start) * 1e6
+            (operator_us if key in OPERATORS else equals_us if key == "=" else digit_us).append(elapsed)
+    return {
+        "digit_us": summarize(digit_us),
+        "operator_us": summarize(operator_us),
+        "equals_us": summarize(equals_us),
+    }
+
+
+def bench_engine(rng: random.Random, operands: int, runs: int) -> dict:
+    from src.core.calc_engine import compile_expression
+    from src.shared.utils import summarize
+
+    compile_us, evaluate_us = [], []
+    for _ in range(runs):
+        text = _expression(rng, operands)
+        start = perf_counter()
+        compiled = compile_expression(text)
+        compiled_at = perf_counter()
+        compiled.evaluate()
+        compile_us.append((compiled_at - start) * 1e6)
+        evaluate_us.append((perf_counter() - compiled_at) * 1e6)
+    return {"compile_us": summarize(compile_us), "evaluate_us": summarize(evaluate_us)}
+
+
+def bench_batch(rng: random.Random, count: int) -> dict:
+    from src.core.calc_engine import evaluate_many
+
+    texts = [_expression(rng, BATCH_OPERANDS) for _ in range(count)]
+    start = perf_counter()
+    results = evaluate_many(texts)
+    elapsed = perf_counter() - start
+    return {
+        "expressions": count,
+        "operands": BATCH_OPERANDS,
+        "errors": sum(isinstance(r, Exception) for r in results),
+        "ms": elapsed * 1000.0,
+        "per_second": count / elapsed if elapsed else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calculator engine benchmark (no window needed)")
+    parser.add_argument("--runs", type=int, default=20, help="Expressions per operand count")
+    parser.add_argument("--batch", type=int, default=2000, help="Expressions in the evaluate_many batch")
+    parser.add_argument("--output", "-o", type=Path, help="Write JSON here instead of stdout")
+    args = parser.parse_args()
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+    rng = random.Random(BENCH_SEED)
+    report = {
+        "seed": BENCH_SEED,
+        "keypad": {str(n): bench_keypad(rng, n, args.runs) for n in OPERAND_COUNTS},
+        "engine": {str(n): bench_engine(rng, n, args.runs) for n in OPERAND_COUNTS},
+        "batch": bench_batch(rng, args.batch),
+    }
+    data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    if args.output:
+        args.output.write_bytes(data)
+    else:
+        sys.stdout.buffer.write(data + b"\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import argparse
+import ast
+import string
+from pathlib import Path
+
+import orjson
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SOURCE_ROOT = PROJECT_ROOT / "src"
+STORIES_ROOT = PROJECT_ROOT / "assets" / "stories"
+MANIFEST_PATH = PROJECT_ROOT / "assets" / "font_manifest.json"
+FONT_PATH = "assets/font.ttf"
+
+BASE_CHARSET = string.ascii_letters + string.digits + string.punctuation + " " + (
+    "абвгдеёжзийклмнопрстуфхцчшщъыьэюя" "АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ" "±…«»—№"
+)
+
+# positional index of font_size / bold for the text entry points the UI calls
+TEXT_CALLS = {
+    "draw_text": (4, 8),
+    "Text": (4, 8),
+    "draw_wrapped_text": (4, None),
+}
+
+
+def _base_size(node: ast.expr | None, names: dict[str, int], fonts: dict[str, int]) -> int | None:
+    if isinstance(node, ast.Name):
+        return names.get(node.id)
+    if _is_font_lookup(node):
+        return fonts.get(node.slice.value)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return int(node.value)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "int" and node.args:
+        inner = node.args[0]
+        if isinstance(inner, ast.BinOp) and isinstance(inner.op, ast.Mult):
+            for side in (inner.left, inner.right):
+                if isinstance(side, ast.Constant) and isinstance(side.value, (int, float)):
+                    return int(side.value)
+    return None
+
+
+def _is_font_lookup(node: ast.expr | None) -> bool:
+    """``frame.fonts["name"]`` / ``fonts["name"]``: a size from a ``Layout`` font table."""
+    if not isinstance(node, ast.Subscript) or not isinstance(node.slice, ast.Constant):
+        return False
+    value = node.value
+    return (isinstance(value, ast.Attribute) and value.attr == "fonts") or (isinstance(value, ast.Name) and value.id == "fonts")
+
+
+def _collect_layout_fonts(tree: ast.AST) -> dict[str, int]:
+    """Design sizes from ``Layout(..., fonts={...})`` tables."""
+    fonts: dict[str, int] = {}
+    for call in ast.walk(tree):
+        if not isinstance(call, ast.Call) or _call_name(call) != "Layout":
+            continue
+        for kw in call.keywords:
+            if kw.arg != "fonts" or not isinstance(kw.value, ast.Dict):
+                continue
+            for key, value in zip(kw.value.keys, kw.value.values):
+                if isinstance(key, ast.Constant) and isinstance(value, ast.Constant) and isinstance(value.value, (int, float)):
+                    fonts[key.value] = int(value.value)
+    return fonts
+
+
+def _collect_assignments(func: ast.AST, fonts: dict[str, int]) -> dict[str, int]:
+    names: dict[str, int] = {}
+    for node in ast.walk(func):
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            pairs = []
+            if isinstance(target, ast.Name):
+                pairs = [(target, node.value)]
+            elif isinstance(target, ast.Tuple) and isinstance(node.value, ast.Tuple):
+                pairs = list(zip(target.elts, node.value.elts))
+            for name, value in pairs:
+                size = _base_size(value, names, fonts)
+                if isinstance(name, ast.Name) and size is not None:
+                    names[name.id] = size
+    return names
+
+
+def _call_name(call: ast.Call) -> str | None:
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    return None
+
+
+def scan_source(root: Path) -> tuple[set[str], set[tuple[int, bool]]]:
+    chars: set[str] = set()
+    sizes: set[tuple[int, bool]] = set()
+    trees = {path: ast.parse(path.read_text(encoding="utf-8")) for path in sorted(root.rglob("*.py"))}
+    # font tables are looked up by name across modules (the Zasora header reads the app's table)
+    fonts: dict[str, int] = {}
+    for tree in trees.values():
+        fonts.update(_collect_layout_fonts(tree))
+    for tree in trees.values():
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                chars.update(node.value)
+        for func in ast.walk(tree):
+            if not isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            names = _collect_assignments(func, fonts)
+            for call in ast.walk(func):
+                if not isinstance(call, ast.Call) or _call_name(call) not in TEXT_CALLS:
+                    continue
+                size_idx, bold_idx = TEXT_CALLS[_call_name(call)]
+                kwargs = {kw.arg: kw.value for kw in call.keywords if kw.arg}
+                size_node = kwargs.get("font_size", call.args[size_idx] if len(call.args) > size_idx else None)
+                bold_node = kwargs.get("bold")
+                if bold_node is None and bold_idx is not None and len(call.args) > bold_idx:
+                    bold_node = call.args[bold_idx]
+                size = _base_size(size_node, names, fonts)
+                if size is None:
+                    continue
+                bold = isinstance(bold_node, ast.Constant) and bool(bold_node.value)
+                sizes.add((size, bold))
+    return chars, sizes
+
+
+def scan_stories(root: Path) -> set[str]:
+    chars: set[str] = set()
+    for path in sorted(root.glob("*.json")):
+        chars.update(path.read_text(encoding="utf-8"))
+    return chars
+
+
+def build_manifest() -> dict:
+    source_chars, sizes = scan_source(SOURCE_ROOT)
+    chars = set(BASE_CHARSET) | source_chars | scan_stories(STORIES_ROOT)
+    charset = "".join(sorted(c for c in chars if c.isprintable()))
+    return {
+        "font": FONT_PATH,
+        "charset": charset,
+        "sizes": [{"size": size, "bold": bold} for size, bold in sorted(sizes)],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Font warm-up manifest generator")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=MANIFEST_PATH,
+        help="Output manifest path",
+    )
+    args = parser.parse_args()
+
+    manifest = build_manifest()
+    with open(args.output, "wb") as f:
+        f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    print(f"Wrote {args.output}: {len(manifest['charset'])} chars, {len(manifest['sizes'])} sizes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import orjson
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _median(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2] if ordered else 0.0
+
+
+def aggregate(paths: list[Path]) -> dict:
+    """Median time to first frame and per-phase times, grouped by release version."""
+    runs: dict[str, list[dict]] = defaultdict(list)
+    for path in paths:
+        report = orjson.loads(path.read_bytes())
+        runs[report.get("version", "dev")].append(report)
+    summary = {}
+    for version, reports in runs.items():
+        phases: dict[str, list[float]] = defaultdict(list)
+        for report in reports:
+            for phase in report["phases"]:
+                phases[phase["name"]].append(phase["ms"])
+        summary[version] = {
+            "runs": len(reports),
+            "first_frame_ms": _median([r["first_frame_ms"] for r in reports]),
+            "imports_ms": _median([r["imports"]["ms"] for r in reports]),
+            "phases_ms": {name: _median(values) for name, values in phases.items()},
+        }
+    return summary
+
+
+def main() -> None:
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from src.shared.constants import DATA_DIR
+
+    startup_dir = DATA_DIR / "startup"
+    parser = argparse.ArgumentParser(description="Compare startup traces across releases")
+    parser.add_argument("files", nargs="*", type=Path, help=f"Trace reports (default: all in {startup_dir})")
+    args = parser.parse_args()
+
+    paths = args.files or sorted(startup_dir.glob("*.json"))
+    if not paths:
+        parser.error("No startup traces found, run `python main.py --trace-startup` first")
+    sys.stdout.buffer.write(orjson.dumps(aggregate(paths), option=orjson.OPT_INDENT_2) + b"\n")
+
+
+if __name__ == "__main__":
+    main()
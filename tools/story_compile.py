@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+STORIES_ROOT = PROJECT_ROOT / "assets" / "stories"
+
+
+def compile_file(source: Path) -> Path | None:
+    from src.composables.zasora.phrasesLoader import compile_phrases, compiled_path
+    from src.core.ink import compile_ink
+
+    with open(source, "r", encoding="utf-8-sig") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "inkVersion" in data:
+        payload = compile_ink(data).to_bytes()
+    elif isinstance(data, dict) and all(isinstance(v, dict) for v in data.values()):
+        payload = compile_phrases(data)
+    else:
+        return None
+    target = compiled_path(source)
+    target.write_bytes(payload)
+    return target
+
+
+def main() -> None:
+    sys.path.insert(0, str(PROJECT_ROOT))
+    parser = argparse.ArgumentParser(description="Compile story/phrase JSON into binary tables")
+    parser.add_argument("files", nargs="*", type=Path, help="JSON files (default: all in assets/stories)")
+    args = parser.parse_args()
+
+    sources = args.files or sorted(STORIES_ROOT.glob("*.json"))
+    for source in sources:
+        target = compile_file(source)
+        print(f"{source.name}: {'-> ' + target.name if target else 'skipped (unknown format)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+
+import orjson
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def aggregate(paths: list[Path]) -> dict:
+    from src.core.telemetry import (
+        EVENT_DECODE_STALL, EVENT_NAMES, EVENT_SWIPE, EVENT_VIDEO_READY, EVENT_WATCH, read_events,
+    )
+    from src.shared.utils import summarize
+
+    counts: Counter[str] = Counter()
+    watch, ready, stalls = [], [], []
+    swipes = unloaded = 0
+    for path in paths:
+        _, events = read_events(path)
+        for _, code, arg, value in events:
+            counts[EVENT_NAMES.get(code, str(code))] += 1
+            if code == EVENT_WATCH:
+                watch.append(value)
+            elif code == EVENT_VIDEO_READY:
+                ready.append(value * 1000.0)
+            elif code == EVENT_DECODE_STALL:
+                stalls.append(value * 1000.0)
+            elif code == EVENT_SWIPE:
+                swipes += 1
+                unloaded += value == 0.0
+    return {
+        "sessions": len(paths),
+        "events": dict(counts),
+        "watch_s": summarize(watch),
+        "video_ready_ms": summarize(ready),
+        "decode_stall_ms": summarize(stalls),
+        "swipes": swipes,
+        "swipes_onto_unloaded": unloaded,
+        "unloaded_ratio": unloaded / swipes if swipes else 0.0,
+    }
+
+
+def main() -> None:
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from src.core.telemetry import TELEMETRY_DIR
+
+    parser = argparse.ArgumentParser(description="Aggregate Zasora telemetry sessions")
+    parser.add_argument("files", nargs="*", type=Path, help=f"Session files (default: all in {TELEMETRY_DIR})")
+    parser.add_argument("--last", "-n", type=int, help="Only the N most recent sessions")
+    args = parser.parse_args()
+
+    paths = args.files or sorted(TELEMETRY_DIR.glob("*.tlm"))
+    if args.last:
+        paths = paths[-args.last:]
+    if not paths:
+        parser.error("No telemetry sessions found")
+    sys.stdout.buffer.write(orjson.dumps(aggregate(paths), option=orjson.OPT_INDENT_2) + b"\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ASSETS_ROOT = PROJECT_ROOT / "assets"
+BENCH_SEED = 1337
+BENCH_WIDTH = 1920
+BENCH_HEIGHT = 1080
+SWIPE_STEPS = 12
+SETTLE_FRAMES = 48
+STRESS_COUNTS = (1, 2, 4, 8, 16)
+STRESS_APPS = ("zasora", "calc", "home", "mixed")
+
+if TYPE_CHECKING:
+    import arcade
+    from src.components.phone import Phone
+
+
+class BenchDriver:
+    def __init__(self, window: arcade.Window, phone: Phone, step: float, track_allocations: bool) -> None:
+        self.window = window
+        self.phone = phone
+        self.step = step
+        self.track_allocations = track_allocations
+        self.recording = False
+        self.cpu_ms: list[float] = []
+        self.frame_ms: list[float] = []
+        self.alloc_kb: list[float] = []
+
+    def start_recording(self) -> None:
+        from src.core.profiler import profiler
+        profiler.reset(history=1_000_000)
+        self.recording = True
+
+    def frame(self, count: int = 1) -> None:
+        from src.core.profiler import profiler
+        for _ in range(count):
+            if self.track_allocations:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+            start = perf_counter()
+            self.phone.update(self.step)
+            self.window.clear()
+            self.phone.draw()
+            submitted = perf_counter()
+            self.window.ctx.finish()
+            finished = perf_counter()
+            profiler.next_frame()
+            if not self.recording:
+                continue
+            self.cpu_ms.append((submitted - start) * 1000.0)
+            self.frame_ms.append((finished - start) * 1000.0)
+            if self.track_allocations:
+                self.alloc_kb.append((tracemalloc.get_traced_memory()[1] - base) / 1024.0)
+
+    def press(self, x: float, y: float) -> None:
+        import arcade
+        self.phone.on_mouse_press(x, y, arcade.MOUSE_BUTTON_LEFT, 0)
+
+    def release(self, x: float, y: float) -> None:
+        import arcade
+        self.phone.on_mouse_release(x, y, arcade.MOUSE_BUTTON_LEFT, 0)
+
+    def click(self, x: float, y: float) -> None:
+        self.press(x, y)
+        self.frame()
+        self.release(x, y)
+        self.frame()
+
+    def click_screen(self, x: float, y: float) -> None:
+        self.click(*self.phone.render_target.to_window(x, y))
+
+    def drag_screen(self, x: float, y: float, dy: float, steps: int) -> None:
+        wx, wy = self.phone.render_target.to_window(x, y)
+        wdy = (self.phone.render_target.to_window(x, y + dy)[1] - wy) / steps
+        self.press(wx, wy)
+        for _ in range(steps):
+            wy += wdy
+            self.phone.on_mouse_motion(wx, wy, 0, wdy)
+            self.frame()
+        self.release(wx, wy)
+        self.frame()
+
+
+def _boot(driver: BenchDriver) -> None:
+    from src.components.phone import BOOT_DURATION
+    layout = driver.phone.layout
+    size = layout.power_button_size
+    driver.click(layout.power_button_x + size / 2, layout.power_button_y + size / 2)
+    driver.frame(int(BOOT_DURATION / driver.step) + 2)
+
+
+def _go_home(driver: BenchDriver) -> None:
+    layout = driver.phone.layout
+    size = layout.home_button_size
+    driver.click(layout.home_button_x + size / 2, layout.home_button_y + size / 2)
+
+
+def _open_app(driver: BenchDriver, name: str) -> None:
+    from src.components.phone.home import APP_ICON_SIZE, APP_POSITIONS
+    s = driver.phone.scale_factor
+    pos_x, pos_y = APP_POSITIONS[name]
+    icon = APP_ICON_SIZE * s
+    driver.click_screen(pos_x * s + icon / 2, (driver.phone.home.phone_height - pos_y) * s - icon / 2)
+
+
+def scenario_boot(driver: BenchDriver) -> None:
+    driver.start_recording()
+    driver.frame(10)
+    _boot(driver)
+
+
+def scenario_open_apps(driver: BenchDriver) -> None:
+    _boot(driver)
+    driver.start_recording()
+    for name in ("zasora", "calc", "zasora"):
+        _open_app(driver, name)
+        driver.frame(SETTLE_FRAMES)
+        _go_home(driver)
+        driver.frame(5)
+
+
+def scenario_swipe(driver: BenchDriver, count: int) -> None:
+    _boot(driver)
+    _open_app(driver, "zasora")
+    app = driver.phone.zasora_app
+    driver.start_recording()
+    for _ in range(count):
+        cx, cy = app.app_x + app.app_w / 2, app.app_y + app.video_area_height / 3
+        driver.drag_screen(cx, cy, app.video_area_height * 0.5, SWIPE_STEPS)
+        driver.frame(SETTLE_FRAMES)
+
+
+def scenario_comments(driver: BenchDriver, count: int) -> None:
+    import arcade
+    _boot(driver)
+    _open_app(driver, "zasora")
+    app = driver.phone.zasora_app
+    s = app.scale_factor
+    driver.start_recording()
+    driver.click_screen(app.app_x + app.app_w - 40 * s, app.app_y + app.video_area_height / 2 - 65 * s)
+    for i in range(count):
+        driver.click_screen(app.app_x + app.app_w / 2, app.app_y + 25 * s)
+        for char in f"benchmark comment {i}":
+            driver.phone.on_text(char)
+            driver.frame()
+        driver.phone.on_key_press(arcade.key.ENTER, 0)
+        driver.frame(5)
+
+
+def scenario_calc(driver: BenchDriver, count: int) -> None:
+    _boot(driver)
+    _open_app(driver, "calc")
+    app = driver.phone.calc_app
+    rng = random.Random(BENCH_SEED)
+    driver.start_recording()
+    for _ in range(count):
+        rect = rng.choice(app.button_rects)[0]
+        driver.click_screen(rect.left + rect.width / 2, rect.bottom + rect.height / 2)
+
+
+def run_scenario(
+    window: arcade.Window, name: str, scenario: Callable[[BenchDriver], None], track_allocations: bool
+) -> dict:
+    from src.components.phone import Phone
+    from src.core.asset_manager import AssetManager
+    from src.core.frame_scheduler import SIMULATION_STEP
+    from src.core.profiler import profiler
+    from src.shared.utils import summarize
+
+    random.seed(BENCH_SEED)
+    asset_manager = AssetManager(ASSETS_ROOT)
+    asset_manager.load_all_atlases(ASSETS_ROOT / "images")
+    phone = Phone(asset_manager)
+    phone.resize(window.width, window.height)
+    driver = BenchDriver(window, phone, SIMULATION_STEP, track_allocations)
+    scenario(driver)
+    _release(phone)
+    counters = ("frame", "draw_calls", "texture_binds")
+    result = {
+        "frames": len(driver.cpu_ms),
+        "cpu_ms": summarize(driver.cpu_ms),
+        "frame_ms": summarize(driver.frame_ms),
+        "draw_calls": summarize([float(v) for v in profiler.counters.get("draw_calls", ())]),
+        "texture_binds": summarize([float(v) for v in profiler.counters.get("texture_binds", ())]),
+        "sections_ms": {k: v for k, v in profiler.percentiles().items() if k not in counters},
+    }
+    if track_allocations:
+        result["alloc_kb"] = summarize(driver.alloc_kb)
+    print(f"{name}: {result['frames']} frames, cpu p50 {result['cpu_ms'].get('p50', 0):.2f} ms", file=sys.stderr)
+    return result
+
+
+def _release(phone: Phone) -> None:
+    for app in phone.apps.loaded.values():  # not Phone.close: runs must not leave a save behind
+        app.release()
+    phone.render_target.release()
+
+
+def _tiles(count: int, width: float, height: float) -> list[tuple[float, float, float, float]]:
+    cols = math.ceil(math.sqrt(count))
+    rows = math.ceil(count / cols)
+    cell_w, cell_h = width / cols, height / rows
+    return [(i % cols * cell_w, height - (i // cols + 1) * cell_h, cell_w, cell_h) for i in range(count)]
+
+
+def run_stress(window: arcade.Window, counts: list[int], app: str, frames: int) -> dict:
+    """Tile ``count`` independent phones over the window and time frames that update and draw all of them."""
+    from src.components.phone import Phone
+    from src.core.asset_manager import AssetManager
+    from src.core.frame_scheduler import SIMULATION_STEP
+    from src.core.profiler import profiler
+    from src.shared.utils import summarize
+
+    asset_manager = AssetManager(ASSETS_ROOT)
+    asset_manager.load_all_atlases(ASSETS_ROOT / "images")
+    results = {}
+    base_ms = None
+    for count in counts:
+        random.seed(BENCH_SEED)
+        phones = []
+        for i, cell in enumerate(_tiles(count, window.width, window.height)):
+            phone = Phone(asset_manager)
+            phone.place(*cell, window.width, window.height)
+            driver = BenchDriver(window, phone, SIMULATION_STEP, False)
+            _boot(driver)
+            name = ("zasora", "calc")[i % 2] if app == "mixed" else app
+            if name != "home":
+                _open_app(driver, name)
+            phones.append(phone)
+
+        cpu_ms, frame_ms = [], []
+        for frame in range(SETTLE_FRAMES + frames):
+            if frame == SETTLE_FRAMES:
+                profiler.reset(history=1_000_000)
+            start = perf_counter()
+            for phone in phones:
+                phone.update(SIMULATION_STEP)
+            window.clear()
+            for phone in phones:
+                phone.draw()
+            submitted = perf_counter()
+            window.ctx.finish()
+            finished = perf_counter()
+            profiler.next_frame()
+            if frame >= SETTLE_FRAMES:
+                cpu_ms.append((submitted - start) * 1000.0)
+                frame_ms.append((finished - start) * 1000.0)
+
+        for phone in phones:
+            _release(phone)
+        phones.clear()  # no phone, app state or comment arena outlives its count
+        phone = driver = None
+        gc.collect()
+        window.ctx.gc()
+        counters = ("frame", "draw_calls", "texture_binds")
+        result = {
+            "instances": count,
+            "frames": len(cpu_ms),
+            "cpu_ms": summarize(cpu_ms),
+            "frame_ms": summarize(frame_ms),
+            "draw_calls": summarize([float(v) for v in profiler.counters.get("draw_calls", ())]),
+            "sections_ms": {k: v for k, v in profiler.percentiles().items() if k not in counters},
+        }
+        p50 = result["frame_ms"].get("p50", 0.0)
+        base_ms = base_ms or p50 / count
+        result["frame_ms_per_instance"] = p50 / count
+        # 1.0 is linear scaling from the first count; above 1 each extra phone costs more than the last
+        result["scaling"] = p50 / (base_ms * count) if base_ms else 0.0
+        results[str(count)] = result
+        print(f"stress x{count}: frame p50 {p50:.2f} ms, {p50 / count:.2f} ms/instance", file=sys.stderr)
+    return {"app": app, "counts": results}
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless phone UI benchmark")
+    parser.add_argument("--scenario", "-s", action="append", help="Scenario to run (default: all)")
+    parser.add_argument("--swipes", type=int, default=20, help="Videos to swipe in the swipe scenario")
+    parser.add_argument("--comments", type=int, default=5, help="Comments to type in the comments scenario")
+    parser.add_argument("--keys", type=int, default=200, help="Key presses in the calc scenario")
+    parser.add_argument(
+        "--stress", nargs="?", const=",".join(map(str, STRESS_COUNTS)), metavar="COUNTS",
+        help="Tile several phones over the window and time them per count (default counts: %(const)s)",
+    )
+    parser.add_argument("--stress-app", choices=STRESS_APPS, default="zasora", help="Screen each stress phone shows")
+    parser.add_argument("--stress-frames", type=int, default=120, help="Measured frames per stress count")
+    parser.add_argument("--allocations", action="store_true", help="Track per-frame allocations (slower)")
+    parser.add_argument("--headless", action="store_true", help="Use arcade's headless (EGL) context")
+    parser.add_argument("--output", "-o", type=Path, help="Write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ["ARCADE_HEADLESS"] = "1"
+    os.environ.setdefault("ZHOSKO_DATA_DIR", tempfile.mkdtemp(prefix="zhosko-bench-"))
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+    import arcade
+    from src.core.profiler import profiler
+
+    scenarios: dict[str, Callable[[BenchDriver], None]] = {
+        "boot": scenario_boot,
+        "open_apps": scenario_open_apps,
+        "swipe": lambda d: scenario_swipe(d, args.swipes),
+        "comments": lambda d: scenario_comments(d, args.comments),
+        "calc": lambda d: scenario_calc(d, args.keys),
+    }
+    selected = args.scenario or ([] if args.stress else list(scenarios))
+    unknown = [name for name in selected if name not in scenarios]
+    if unknown:
+        parser.error(f"Unknown scenario(s): {', '.join(unknown)}")
+    try:
+        stress_counts = [int(c) for c in args.stress.split(",")] if args.stress else []
+    except ValueError:
+        parser.error(f"--stress expects comma-separated counts, got {args.stress!r}")
+
+    window = arcade.Window(BENCH_WIDTH, BENCH_HEIGHT, "ZHOSKO bench", visible=False)
+    profiler.enable()
+    if args.allocations:
+        tracemalloc.start()
+
+    report = {
+        "meta": {
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "arcade": arcade.version.VERSION,
+            "gl_renderer": window.ctx.info.RENDERER,
+            "seed": BENCH_SEED,
+            "window": [BENCH_WIDTH, BENCH_HEIGHT],
+        },
+        "scenarios": {
+            name: run_scenario(window, name, scenarios[name], args.allocations) for name in selected
+        },
+    }
+    if stress_counts:
+        report["stress"] = run_stress(window, stress_counts, args.stress_app, args.stress_frames)
+
+    import orjson
+    data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    if args.output:
+        args.output.write_bytes(data)
+    else:
+        sys.stdout.buffer.write(data + b"\n")
+
+
+if __name__ == "__main__":
+    main()